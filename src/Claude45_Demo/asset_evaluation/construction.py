@@ -5,7 +5,7 @@ Applies premiums for winter construction, mountain logistics, and labor market c
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 
@@ -29,6 +29,13 @@ class LogisticsPremiumResult:
     premium_amount: float
     adjusted_cost: float
     factors: list[str]
+    factors_lower_joined: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Pre-normalize factors once for case-insensitive keyword checks."""
+        object.__setattr__(
+            self, "factors_lower_joined", " | ".join(f.casefold() for f in self.factors)
+        )
 
 
 @dataclass(frozen=True)
@@ -72,19 +79,16 @@ class ConstructionAdjuster:
 
         Spec: Requirement 8, Scenario "Winter construction premium"
         """
-        # Count months in winter period
-        winter_months = 0
-        current = start_date.replace(day=1)
-
-        while current <= end_date:
-            if current.month in self.WINTER_MONTHS:
-                winter_months += 1
-
-            # Move to next month
-            if current.month == 12:
-                current = current.replace(year=current.year + 1, month=1)
-            else:
-                current = current.replace(month=current.month + 1)
+        # Count months in winter period, walking absolute month indices
+        # (year * 12 + month - 1) instead of constructing a date per month
+        winter = self.WINTER_MONTHS
+        first_month = start_date.year * 12 + start_date.month - 1
+        last_month = end_date.year * 12 + end_date.month - 1
+        winter_months = sum(
+            1
+            for index in range(first_month, last_month + 1)
+            if index % 12 + 1 in winter
+        )
 
         # Calculate premium based on location type and winter exposure
         if winter_months == 0:
@@ -6,8 +6,11 @@ to support investment committee decision-making.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+import numpy.typing as npt
 
 
 @dataclass(frozen=True)
@@ -30,6 +33,17 @@ class ExitModelResult:
     scenarios: List[ExitScenario]
     recommended_hold_period: int
     recommendation: str
+    scenarios_by_hold_period: Dict[int, ExitScenario] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index scenarios by hold period for O(1) lookup."""
+        object.__setattr__(
+            self,
+            "scenarios_by_hold_period",
+            {s.hold_period_years: s for s in self.scenarios},
+        )
 
 
 @dataclass(frozen=True)
@@ -53,6 +67,15 @@ class AppreciationResult:
     p50_irr: float  # 50th percentile (base)
     p90_irr: float  # 90th percentile (bull)
     recommendation: str
+    scenarios_by_name: Dict[str, AppreciationScenario] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index scenarios by name for O(1) lookup."""
+        object.__setattr__(
+            self, "scenarios_by_name", {s.scenario_name: s for s in self.scenarios}
+        )
 
 
 @dataclass(frozen=True)
@@ -69,6 +92,19 @@ class RefinanceComparison:
     recommendation: str
 
 
+@dataclass(frozen=True)
+class RefinanceComparisonBatch:
+    """Vectorized refinance vs. sale comparison (one element per case)."""
+
+    refi_equity_extracted: npt.NDArray[np.float64]
+    refi_ongoing_cashflow: npt.NDArray[np.float64]
+    refi_net_benefit: npt.NDArray[np.float64]
+    sale_gross_proceeds: npt.NDArray[np.float64]
+    sale_net_proceeds: npt.NDArray[np.float64]  # After taxes
+    sale_realized_gain: npt.NDArray[np.float64]
+    recommended_strategy: npt.NDArray[np.str_]  # "refinance", "sale", "hold"
+
+
 class ExitAnalyzer:
     """Model exit strategies and hold period optimization."""
 
@@ -103,37 +139,39 @@ class ExitAnalyzer:
 
         Spec: Requirement 11, Scenario "Value-add exit modeling"
         """
-        scenarios = []
-
         exit_cap_rate = entry_cap_rate + (cap_rate_adjustment_bps / 10000)
 
-        for years in hold_periods:
-            # Exit value = stabilized NOI / exit cap rate
-            exit_value = stabilized_noi / exit_cap_rate if exit_cap_rate > 0 else 0
-
-            # Total return = exit value - entry value
-            total_return = exit_value - entry_value
-
-            # Simple IRR approximation: ((exit_value / initial_equity) ^ (1/years)) - 1
-            # This is a simplified calculation; full IRR would account for interim cashflows
-            if initial_equity > 0 and years > 0:
-                equity_multiple = exit_value / initial_equity
-                irr = ((equity_multiple) ** (1 / years)) - 1
-            else:
-                equity_multiple = 0
-                irr = 0
-
-            scenarios.append(
-                ExitScenario(
-                    hold_period_years=years,
-                    stabilized_noi=stabilized_noi,
-                    exit_cap_rate=round(exit_cap_rate, 4),
-                    exit_value=round(exit_value, 2),
-                    total_return=round(total_return, 2),
-                    irr=round(irr, 4),
-                    equity_multiple=round(equity_multiple, 2),
-                )
+        # Exit value = stabilized NOI / exit cap rate (same for every hold period)
+        exit_value = stabilized_noi / exit_cap_rate if exit_cap_rate > 0 else 0
+
+        # Total return = exit value - entry value
+        total_return = exit_value - entry_value
+
+        # Simple IRR approximation: ((exit_value / initial_equity) ^ (1/years)) - 1,
+        # evaluated for all hold periods at once. This is a simplified calculation;
+        # full IRR would account for interim cashflows.
+        periods = np.asarray(hold_periods, dtype=np.float64)
+        valid = (periods > 0) & (initial_equity > 0)
+        equity_multiple = exit_value / initial_equity if initial_equity > 0 else 0.0
+        with np.errstate(divide="ignore"):
+            exponents = np.where(valid, 1.0 / periods, 0.0)
+        equity_multiples = np.where(valid, equity_multiple, 0.0)
+        irrs = np.where(valid, np.power(equity_multiple, exponents) - 1, 0.0)
+
+        scenarios = [
+            ExitScenario(
+                hold_period_years=years,
+                stabilized_noi=stabilized_noi,
+                exit_cap_rate=round(exit_cap_rate, 4),
+                exit_value=round(exit_value, 2),
+                total_return=round(total_return, 2),
+                irr=round(float(irr), 4),
+                equity_multiple=round(float(multiple), 2),
+            )
+            for years, irr, multiple in zip(
+                hold_periods, irrs, equity_multiples, strict=True
             )
+        ]
 
         # Recommend hold period with highest IRR
         best_scenario = max(scenarios, key=lambda s: s.irr)
@@ -370,3 +408,99 @@ class ExitAnalyzer:
             recommended_strategy=recommended_strategy,
             recommendation=recommendation,
         )
+
+    def compare_refi_vs_sale_batch(
+        self,
+        *,
+        current_value: npt.ArrayLike,
+        current_debt: npt.ArrayLike,
+        current_noi: npt.ArrayLike,
+        annual_cashflow_growth: npt.ArrayLike = 0.03,
+        hold_years_if_refi: npt.ArrayLike = 5,
+        refi_ltv: npt.ArrayLike = 0.70,
+        refi_interest_rate: npt.ArrayLike = 0.045,
+        capital_gains_rate: npt.ArrayLike = 0.20,
+        depreciation_recapture_rate: npt.ArrayLike = 0.25,
+        depreciation_taken: npt.ArrayLike = 0,
+        cost_basis: npt.ArrayLike = 0,
+    ) -> RefinanceComparisonBatch:
+        """Compare refinance vs. sale for many cases at once.
+
+        Vectorized counterpart of ``compare_refi_vs_sale`` for scenario sweeps.
+        Arguments accept scalars or arrays and are broadcast against each other;
+        each output element matches the scalar method for the same inputs.
+
+        Returns:
+            RefinanceComparisonBatch with one array element per case
+        """
+        (
+            value,
+            debt,
+            noi,
+            growth,
+            hold_years,
+            ltv,
+            rate,
+            cg_rate,
+            recapture_rate,
+            depreciation,
+            basis,
+        ) = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(arg, dtype=np.float64))
+                for arg in (
+                    current_value,
+                    current_debt,
+                    current_noi,
+                    annual_cashflow_growth,
+                    hold_years_if_refi,
+                    refi_ltv,
+                    refi_interest_rate,
+                    capital_gains_rate,
+                    depreciation_recapture_rate,
+                    depreciation_taken,
+                    cost_basis,
+                )
+            )
+        )
+
+        # REFINANCE OPTION
+        new_loan = value * ltv
+        refi_equity_extracted = new_loan - debt
+        annual_cashflow_after_refi = noi - new_loan * rate
+
+        # Sum growth factors over each case's hold period: (cases, years) grid
+        years = np.arange(1, int(hold_years.max(initial=0)) + 1, dtype=np.float64)
+        growth_factors = (1 + growth[:, None]) ** years
+        growth_factors[years > hold_years[:, None]] = 0.0
+        total_refi_cashflow = annual_cashflow_after_refi * growth_factors.sum(axis=1)
+
+        refi_net_benefit = refi_equity_extracted + total_refi_cashflow
+
+        # SALE OPTION
+        sale_gross_proceeds = value - debt
+        capital_gain = np.where(basis > 0, value - basis, value * 0.3)
+        total_tax = (capital_gain - depreciation) * cg_rate + (
+            depreciation * recapture_rate
+        )
+        sale_net_proceeds = sale_gross_proceeds - total_tax
+
+        # RECOMMENDATION (10%+ advantage required to favor either option)
+        recommended_strategy = np.select(
+            [
+                refi_net_benefit > sale_net_proceeds * 1.1,
+                sale_net_proceeds > refi_net_benefit * 1.1,
+            ],
+            ["refinance", "sale"],
+            default="hold",
+        )
+
+        return RefinanceComparisonBatch(
+            refi_equity_extracted=np.round(refi_equity_extracted, 2),
+            refi_ongoing_cashflow=np.round(total_refi_cashflow, 2),
+            refi_net_benefit=np.round(refi_net_benefit, 2),
+            sale_gross_proceeds=np.round(sale_gross_proceeds, 2),
+            sale_net_proceeds=np.round(sale_net_proceeds, 2),
+            sale_realized_gain=np.round(capital_gain, 2),
+            recommended_strategy=recommended_strategy,
+        )
@@ -6,12 +6,16 @@ in terms of geographic diversification, product type mix, and operational synerg
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, NamedTuple, Sequence, Tuple
 
+import numpy as np
+import numpy.typing as npt
 
-@dataclass(frozen=True)
-class GeographicFitResult:
+
+class GeographicFitResult(NamedTuple):
     """Result of geographic diversification analysis."""
 
     concentration_risk_score: int  # 0-100, higher is better (more diversified)
@@ -22,7 +26,16 @@ class GeographicFitResult:
 
 
 @dataclass(frozen=True)
-class ProductMixResult:
+class GeographicFitBatch:
+    """Vectorized geographic fit for many candidates (one element per candidate)."""
+
+    concentration_risk_score: npt.NDArray[np.int64]
+    current_noi_concentration_pct: npt.NDArray[np.float64]
+    projected_noi_concentration_pct: npt.NDArray[np.float64]
+    diversification_impact: npt.NDArray[np.str_]
+
+
+class ProductMixResult(NamedTuple):
     """Result of product type mix analysis."""
 
     mix_score: int  # 0-100, higher is better (more balanced)
@@ -32,14 +45,212 @@ class ProductMixResult:
     recommendation: str
 
 
-@dataclass(frozen=True)
-class SynergyResult:
+class SynergyResult(NamedTuple):
     """Result of operational synergy analysis."""
 
     synergy_value_estimate: float  # Annual $ value of synergies
     opex_savings_pct: float  # % reduction in operating expenses
     lease_up_bonus_days: int  # Faster lease-up from local brand recognition
-    synergy_factors: List[str]  # Reasons for synergies
+    synergy_factors: Tuple[str, ...]  # Reasons for synergies (shared, immutable)
+
+
+class CandidateEvaluation(NamedTuple):
+    """Combined portfolio fit assessment of one candidate."""
+
+    geographic_fit: GeographicFitResult
+    product_mix: ProductMixResult
+    synergies: SynergyResult
+
+
+# Product mix recommendation by (candidate type group, balance impact)
+_PRODUCT_MIX_RECOMMENDATIONS: Dict[Tuple[str, str], str] = {
+    ("core", "improves"): "Strengthens core garden/low-rise portfolio",
+    ("core", "concentrates"): "Consider diversifying to mid-rise or mixed-use",
+    ("core", "neutral"): "Maintains balanced product mix",
+    ("mid-rise", "improves"): "Adds selective mid-rise exposure",
+    ("mid-rise", "concentrates"): "Mid-rise exposure approaching upper limit",
+    ("mixed-use", "improves"): "Adds strategic mixed-use exposure",
+    ("other", "neutral"): "Product type fits within portfolio strategy",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _SynergyTier:
+    """Synergy parameters for one metro cluster-size bucket."""
+
+    synergy_factors: Tuple[str, ...]
+    opex_savings_pct: float
+    reputation_threshold: int  # Bonus lease-up days need a score above this
+    lease_up_days_above: int
+    lease_up_days_at_or_below: int
+
+
+# Inclusive upper asset-count bound of each cluster bucket; bisect_left maps
+# portfolio_assets_in_metro onto _SYNERGY_TIERS (0, 1, 2-4, 5+)
+_CLUSTER_THRESHOLDS = (0, 1, 4)
+_SYNERGY_TIERS = (
+    # New market entry - no synergies yet
+    _SynergyTier(
+        synergy_factors=("New market entry - building brand presence",),
+        opex_savings_pct=0.0,
+        reputation_threshold=100,
+        lease_up_days_above=0,
+        lease_up_days_at_or_below=0,
+    ),
+    # Second asset - some synergies begin
+    _SynergyTier(
+        synergy_factors=(
+            "Second asset enables vendor negotiations",
+            "Emerging local brand recognition",
+        ),
+        opex_savings_pct=2.0,
+        reputation_threshold=60,
+        lease_up_days_above=5,
+        lease_up_days_at_or_below=0,
+    ),
+    # Small cluster - meaningful synergies
+    _SynergyTier(
+        synergy_factors=(
+            "Shared vendor contracts and bulk purchasing",
+            "Regional maintenance team efficiency",
+            "Established local brand and referral network",
+        ),
+        opex_savings_pct=3.5,
+        reputation_threshold=70,
+        lease_up_days_above=10,
+        lease_up_days_at_or_below=5,
+    ),
+    # Large cluster - maximum synergies
+    _SynergyTier(
+        synergy_factors=(
+            "Portfolio pricing power with vendors",
+            "Dedicated regional operations team",
+            "Strong local brand drives organic lead generation",
+            "Resident transfers between properties",
+        ),
+        opex_savings_pct=5.0,
+        reputation_threshold=80,
+        lease_up_days_above=15,
+        lease_up_days_at_or_below=10,
+    ),
+)
+
+
+def _concentration_kernel(
+    total_current_noi: float, current_metro_noi: float, candidate_noi: float
+) -> Tuple[float, float, int]:
+    """Compute current/projected metro concentration and the risk score.
+
+    Pure scalar arithmetic with no object allocation, kept separate from the
+    string-building verdict logic.
+
+    Returns:
+        Tuple of (current concentration %, projected concentration %, score)
+    """
+    # Calculate current portfolio metrics
+    current_concentration = (
+        (current_metro_noi / total_current_noi * 100) if total_current_noi > 0 else 0
+    )
+
+    # Calculate projected metrics after adding candidate
+    total_projected_noi = total_current_noi + candidate_noi
+    projected_metro_noi = current_metro_noi + candidate_noi
+    projected_concentration = (
+        (projected_metro_noi / total_projected_noi * 100)
+        if total_projected_noi > 0
+        else 100
+    )
+
+    # Score: 100 = perfect diversification (no metro >20%), 0 = single metro
+    concentration_risk_score = max(0, min(100, int(100 - projected_concentration * 2)))
+
+    return current_concentration, projected_concentration, concentration_risk_score
+
+
+@lru_cache(maxsize=1024)
+def _assess_geographic_fit(
+    total_current_noi: float,
+    current_metro_noi: float,
+    candidate_metro: str,
+    candidate_noi: float,
+) -> GeographicFitResult:
+    """Memoized core of ``PortfolioAnalyzer.assess_geographic_fit``.
+
+    The result depends on the portfolio only through its NOI total and the
+    candidate metro's NOI, so those are the cache key. Results are immutable,
+    so a cached instance can be shared between callers.
+    """
+    current_concentration, projected_concentration, concentration_risk_score = (
+        _concentration_kernel(total_current_noi, current_metro_noi, candidate_noi)
+    )
+
+    # Assess diversification impact
+    if current_metro_noi == 0:
+        # New market entry
+        diversification_impact = "improves"
+        recommendation = (
+            f"Enters new market {candidate_metro}, improving diversification"
+        )
+    elif projected_concentration > 40:
+        # High concentration threshold
+        diversification_impact = "increases_concentration"
+        recommendation = (
+            f"Adds to already concentrated market (>{projected_concentration:.1f}%), "
+            f"consider diversifying to other markets"
+        )
+    elif projected_concentration > current_concentration + 5:
+        # Meaningful increase in concentration
+        diversification_impact = "increases_concentration"
+        recommendation = (
+            f"Increases {candidate_metro} concentration to {projected_concentration:.1f}%, "
+            f"monitor portfolio balance"
+        )
+    elif (
+        current_concentration > 30 and projected_concentration <= current_concentration
+    ):
+        # Reduces concentration from high level
+        diversification_impact = "improves"
+        recommendation = f"Helps reduce concentration in {candidate_metro}"
+    else:
+        diversification_impact = "neutral"
+        recommendation = (
+            f"Minor impact on diversification ({projected_concentration:.1f}%)"
+        )
+
+    return GeographicFitResult(
+        concentration_risk_score=concentration_risk_score,
+        current_noi_concentration_pct=round(current_concentration, 2),
+        projected_noi_concentration_pct=round(projected_concentration, 2),
+        diversification_impact=diversification_impact,
+        recommendation=recommendation,
+    )
+
+
+def _portfolio_arrays(
+    portfolio_by_metro: Dict[str, float],
+) -> Tuple[npt.NDArray[np.str_], npt.NDArray[np.float64]]:
+    """Split a metro -> NOI mapping into parallel arrays sorted by metro."""
+    metros = np.array(sorted(portfolio_by_metro), dtype=np.str_)
+    nois = np.fromiter(
+        (portfolio_by_metro[metro] for metro in metros),
+        dtype=np.float64,
+        count=len(metros),
+    )
+    return metros, nois
+
+
+def _metro_nois(
+    metros: npt.NDArray[np.str_],
+    nois: npt.NDArray[np.float64],
+    candidate_metros: npt.NDArray[np.str_],
+) -> npt.NDArray[np.float64]:
+    """Look up existing NOI per candidate metro (0 where not in portfolio)."""
+    current = np.zeros(candidate_metros.shape, dtype=np.float64)
+    if len(metros):
+        idx = np.minimum(np.searchsorted(metros, candidate_metros), len(metros) - 1)
+        in_portfolio = metros[idx] == candidate_metros
+        current[in_portfolio] = nois[idx[in_portfolio]]
+    return current
 
 
 class PortfolioAnalyzer:
@@ -47,90 +258,204 @@ class PortfolioAnalyzer:
 
     def __init__(self) -> None:
         """Initialize portfolio analyzer."""
-        pass
+        # Portfolio loaded for repeated screening, as parallel sorted arrays
+        self._metros: npt.NDArray[np.str_] | None = None
+        self._nois: npt.NDArray[np.float64] | None = None
+        self._total_noi = 0.0
 
-    def assess_geographic_fit(
+    def load_portfolio(self, portfolio_by_metro: Dict[str, float]) -> None:
+        """Load a portfolio to screen candidates against without passing it.
+
+        Geographic fit calls that omit ``portfolio_by_metro`` use the loaded
+        portfolio; its total NOI is summed once here.
+
+        Args:
+            portfolio_by_metro: Current portfolio NOI by metro area
+        """
+        self._metros, self._nois = _portfolio_arrays(portfolio_by_metro)
+        self._total_noi = float(self._nois.sum())
+
+    def _loaded_portfolio(
+        self,
+    ) -> Tuple[npt.NDArray[np.str_], npt.NDArray[np.float64]]:
+        """Return the loaded portfolio arrays, failing if none was loaded."""
+        if self._metros is None or self._nois is None:
+            raise ValueError(
+                "No portfolio_by_metro given and no portfolio loaded; "
+                "call load_portfolio() first"
+            )
+        return self._metros, self._nois
+
+    def evaluate_candidate(
         self,
         *,
         candidate_metro: str,
         candidate_noi: float,
+        candidate_product_type: str,
+        candidate_units: int,
+        candidate_opex_per_unit: float,
+        local_reputation_score: int,
         portfolio_by_metro: Dict[str, float],  # metro -> NOI
+        portfolio_by_product: Dict[str, int],  # product_type -> unit count
+        assets_by_metro: Dict[str, int],  # metro -> existing asset count
+    ) -> CandidateEvaluation:
+        """Run geographic fit, product mix, and synergy analysis in one pass.
+
+        Portfolio totals are computed once and shared by the three assessments,
+        which match the individual methods called with the same inputs.
+
+        Args:
+            candidate_metro: Metro area of candidate property
+            candidate_noi: Annual NOI of candidate property
+            candidate_product_type: Product type (garden, low-rise, mid-rise, mixed-use)
+            candidate_units: Unit count of candidate
+            candidate_opex_per_unit: Annual operating expense per unit
+            local_reputation_score: Aker brand strength in market (0-100)
+            portfolio_by_metro: Current portfolio NOI by metro area
+            portfolio_by_product: Current portfolio unit counts by product type
+            assets_by_metro: Count of existing Aker assets by metro area
+
+        Returns:
+            CandidateEvaluation with the three portfolio fit results
+        """
+        total_noi = sum(portfolio_by_metro.values())
+        total_units = sum(portfolio_by_product.values())
+
+        return CandidateEvaluation(
+            geographic_fit=_assess_geographic_fit(
+                total_noi,
+                portfolio_by_metro.get(candidate_metro, 0),
+                candidate_metro,
+                candidate_noi,
+            ),
+            product_mix=self._assess_product_type_mix(
+                candidate_product_type,
+                candidate_units,
+                portfolio_by_product,
+                total_units,
+            ),
+            synergies=self.estimate_synergies(
+                candidate_metro=candidate_metro,
+                candidate_units=candidate_units,
+                candidate_opex_per_unit=candidate_opex_per_unit,
+                portfolio_assets_in_metro=assets_by_metro.get(candidate_metro, 0),
+                local_reputation_score=local_reputation_score,
+            ),
+        )
+
+    def assess_geographic_fit(
+        self,
+        *,
+        candidate_metro: str,
+        candidate_noi: float,
+        portfolio_by_metro: Dict[str, float] | None = None,  # metro -> NOI
     ) -> GeographicFitResult:
         """Assess geographic diversification impact of adding candidate.
 
         Args:
             candidate_metro: Metro area of candidate property (e.g., "Denver-Aurora-Lakewood")
             candidate_noi: Annual NOI of candidate property
-            portfolio_by_metro: Current portfolio NOI by metro area
+            portfolio_by_metro: Current portfolio NOI by metro area; defaults to
+                the portfolio passed to ``load_portfolio``
 
         Returns:
             GeographicFitResult with concentration metrics and recommendation
 
         Spec: Requirement 10, Scenario "Geographic diversification"
         """
-        # Calculate current portfolio metrics
-        total_current_noi = sum(portfolio_by_metro.values())
-        current_metro_noi = portfolio_by_metro.get(candidate_metro, 0)
+        if portfolio_by_metro is None:
+            metros, nois = self._loaded_portfolio()
+            current_metro_noi = _metro_nois(metros, nois, np.array([candidate_metro]))
+            return _assess_geographic_fit(
+                self._total_noi,
+                float(current_metro_noi[0]),
+                candidate_metro,
+                candidate_noi,
+            )
+
+        return _assess_geographic_fit(
+            sum(portfolio_by_metro.values()),
+            portfolio_by_metro.get(candidate_metro, 0),
+            candidate_metro,
+            candidate_noi,
+        )
+
+    def assess_geographic_fit_batch(
+        self,
+        *,
+        candidate_metros: Sequence[str],
+        candidate_nois: npt.ArrayLike,
+        portfolio_by_metro: Dict[str, float] | None = None,  # metro -> NOI
+    ) -> GeographicFitBatch:
+        """Assess geographic fit for many candidates against one portfolio.
+
+        Vectorized counterpart of ``assess_geographic_fit`` for screening runs;
+        each candidate is assessed independently against the same portfolio.
+        Per-call NumPy overhead makes this slower than the scalar method for a
+        handful of candidates, so reserve it for large batches.
+
+        Args:
+            candidate_metros: Metro area of each candidate
+            candidate_nois: Annual NOI of each candidate
+            portfolio_by_metro: Current portfolio NOI by metro area; defaults to
+                the portfolio passed to ``load_portfolio``
+
+        Returns:
+            GeographicFitBatch with one array element per candidate
+        """
+        metros = np.asarray(candidate_metros, dtype=np.str_)
+        candidate_noi = np.asarray(candidate_nois, dtype=np.float64)
+
+        # Look up each candidate's existing metro NOI in a sorted portfolio index
+        if portfolio_by_metro is None:
+            portfolio_metros, portfolio_nois = self._loaded_portfolio()
+            total_current_noi = self._total_noi
+        else:
+            portfolio_metros, portfolio_nois = _portfolio_arrays(portfolio_by_metro)
+            total_current_noi = float(portfolio_nois.sum())
+        current_metro_noi = _metro_nois(portfolio_metros, portfolio_nois, metros)
+
         current_concentration = (
-            (current_metro_noi / total_current_noi * 100)
+            current_metro_noi / total_current_noi * 100
             if total_current_noi > 0
-            else 0
+            else np.zeros_like(candidate_noi)
         )
-
-        # Calculate projected metrics after adding candidate
         total_projected_noi = total_current_noi + candidate_noi
-        projected_metro_noi = current_metro_noi + candidate_noi
         projected_concentration = (
-            (projected_metro_noi / total_projected_noi * 100)
-            if total_projected_noi > 0
-            else 100
-        )
-
-        # Assess diversification impact
-        if current_metro_noi == 0:
-            # New market entry
-            diversification_impact = "improves"
-            recommendation = (
-                f"Enters new market {candidate_metro}, improving diversification"
-            )
-        elif projected_concentration > 40:
-            # High concentration threshold
-            diversification_impact = "increases_concentration"
-            recommendation = (
-                f"Adds to already concentrated market (>{projected_concentration:.1f}%), "
-                f"consider diversifying to other markets"
-            )
-        elif projected_concentration > current_concentration + 5:
-            # Meaningful increase in concentration
-            diversification_impact = "increases_concentration"
-            recommendation = (
-                f"Increases {candidate_metro} concentration to {projected_concentration:.1f}%, "
-                f"monitor portfolio balance"
-            )
-        elif (
-            current_concentration > 30
-            and projected_concentration <= current_concentration
-        ):
-            # Reduces concentration from high level
-            diversification_impact = "improves"
-            recommendation = f"Helps reduce concentration in {candidate_metro}"
-        else:
-            diversification_impact = "neutral"
-            recommendation = (
-                f"Minor impact on diversification ({projected_concentration:.1f}%)"
+            np.divide(
+                current_metro_noi + candidate_noi,
+                total_projected_noi,
+                out=np.ones_like(candidate_noi),
+                where=total_projected_noi > 0,
             )
+            * 100
+        )
 
-        # Score: 100 = perfect diversification (no metro >20%), 0 = single metro
-        concentration_risk_score = max(
-            0, min(100, int(100 - projected_concentration * 2))
+        diversification_impact = np.select(
+            [
+                current_metro_noi == 0,
+                projected_concentration > 40,
+                projected_concentration > current_concentration + 5,
+                (current_concentration > 30)
+                & (projected_concentration <= current_concentration),
+            ],
+            [
+                "improves",
+                "increases_concentration",
+                "increases_concentration",
+                "improves",
+            ],
+            default="neutral",
         )
+        concentration_risk_score = np.clip(
+            np.trunc(100 - projected_concentration * 2), 0, 100
+        ).astype(np.int64)
 
-        return GeographicFitResult(
+        return GeographicFitBatch(
             concentration_risk_score=concentration_risk_score,
-            current_noi_concentration_pct=round(current_concentration, 2),
-            projected_noi_concentration_pct=round(projected_concentration, 2),
+            current_noi_concentration_pct=np.round(current_concentration, 2),
+            projected_noi_concentration_pct=np.round(projected_concentration, 2),
             diversification_impact=diversification_impact,
-            recommendation=recommendation,
         )
 
     def assess_product_type_mix(
@@ -152,22 +477,46 @@ class PortfolioAnalyzer:
 
         Spec: Requirement 10, Scenario "Product type mix"
         """
+        return self._assess_product_type_mix(
+            candidate_product_type,
+            candidate_units,
+            portfolio_by_product,
+            sum(portfolio_by_product.values()),
+        )
+
+    def _assess_product_type_mix(
+        self,
+        candidate_product_type: str,
+        candidate_units: int,
+        portfolio_by_product: Dict[str, int],
+        total_current_units: int,
+    ) -> ProductMixResult:
+        """Product mix assessment given the portfolio's precomputed unit total."""
         # Calculate current mix
-        total_current_units = sum(portfolio_by_product.values())
-        current_mix = {
-            ptype: (units / total_current_units * 100) if total_current_units > 0 else 0
-            for ptype, units in portfolio_by_product.items()
-        }
+        # Unit vector in portfolio order, with the candidate's type appended if
+        # new, so both mixes come out of single vector divisions
+        product_types = list(portfolio_by_product)
+        if candidate_product_type not in portfolio_by_product:
+            product_types.append(candidate_product_type)
+        units = np.fromiter(
+            (portfolio_by_product.get(ptype, 0) for ptype in product_types),
+            dtype=np.float64,
+            count=len(product_types),
+        )
+        current_pct = (
+            units[: len(portfolio_by_product)] / total_current_units * 100
+            if total_current_units > 0
+            else np.zeros(len(portfolio_by_product))
+        )
+        current_mix = dict(zip(portfolio_by_product, current_pct.tolist(), strict=True))
 
         # Calculate projected mix
         total_projected_units = total_current_units + candidate_units
-        projected_portfolio = portfolio_by_product.copy()
-        projected_portfolio[candidate_product_type] = (
-            projected_portfolio.get(candidate_product_type, 0) + candidate_units
-        )
+        units[product_types.index(candidate_product_type)] += candidate_units
+        projected_pct = units / total_projected_units * 100
         projected_mix = {
-            ptype: round(units / total_projected_units * 100, 1)
-            for ptype, units in projected_portfolio.items()
+            ptype: round(pct, 1)
+            for ptype, pct in zip(product_types, projected_pct.tolist(), strict=True)
         }
 
         # Target mix per Aker thesis: garden/low-rise 80%, mid-rise 15%, mixed-use 5%
@@ -189,31 +538,26 @@ class PortfolioAnalyzer:
 
         mix_score = max(0, int(100 - total_deviation))
 
-        # Assess balance impact
+        # Assess balance impact by candidate type group
         current_core = current_mix.get("garden", 0) + current_mix.get("low-rise", 0)
         if candidate_product_type in {"garden", "low-rise"}:
+            type_group = "core"
             if current_core < 70:
                 balance_impact = "improves"
-                recommendation = "Strengthens core garden/low-rise portfolio"
             elif current_core > 85:
                 balance_impact = "concentrates"
-                recommendation = "Consider diversifying to mid-rise or mixed-use"
             else:
                 balance_impact = "neutral"
-                recommendation = "Maintains balanced product mix"
         elif candidate_product_type == "mid-rise":
-            if projected_select < 20:
-                balance_impact = "improves"
-                recommendation = "Adds selective mid-rise exposure"
-            else:
-                balance_impact = "concentrates"
-                recommendation = "Mid-rise exposure approaching upper limit"
+            type_group = "mid-rise"
+            balance_impact = "improves" if projected_select < 20 else "concentrates"
         elif candidate_product_type == "mixed-use":
+            type_group = "mixed-use"
             balance_impact = "improves"
-            recommendation = "Adds strategic mixed-use exposure"
         else:
+            type_group = "other"
             balance_impact = "neutral"
-            recommendation = "Product type fits within portfolio strategy"
+        recommendation = _PRODUCT_MIX_RECOMMENDATIONS[(type_group, balance_impact)]
 
         return ProductMixResult(
             mix_score=mix_score,
@@ -246,48 +590,15 @@ class PortfolioAnalyzer:
 
         Spec: Requirement 10, Scenario "Operational scale synergies"
         """
-        synergy_factors = []
-        opex_savings_pct = 0.0
-        lease_up_bonus_days = 0
-
-        if portfolio_assets_in_metro == 0:
-            # New market entry - no synergies yet
-            synergy_factors.append("New market entry - building brand presence")
-            opex_savings_pct = 0.0
-            lease_up_bonus_days = 0
-        elif portfolio_assets_in_metro == 1:
-            # Second asset - some synergies begin
-            synergy_factors.extend(
-                [
-                    "Second asset enables vendor negotiations",
-                    "Emerging local brand recognition",
-                ]
-            )
-            opex_savings_pct = 2.0
-            lease_up_bonus_days = 5 if local_reputation_score > 60 else 0
-        elif portfolio_assets_in_metro <= 4:
-            # Small cluster - meaningful synergies
-            synergy_factors.extend(
-                [
-                    "Shared vendor contracts and bulk purchasing",
-                    "Regional maintenance team efficiency",
-                    "Established local brand and referral network",
-                ]
-            )
-            opex_savings_pct = 3.5
-            lease_up_bonus_days = 10 if local_reputation_score > 70 else 5
-        else:
-            # Large cluster - maximum synergies
-            synergy_factors.extend(
-                [
-                    "Portfolio pricing power with vendors",
-                    "Dedicated regional operations team",
-                    "Strong local brand drives organic lead generation",
-                    "Resident transfers between properties",
-                ]
-            )
-            opex_savings_pct = 5.0
-            lease_up_bonus_days = 15 if local_reputation_score > 80 else 10
+        tier = _SYNERGY_TIERS[
+            bisect_left(_CLUSTER_THRESHOLDS, portfolio_assets_in_metro)
+        ]
+        opex_savings_pct = tier.opex_savings_pct
+        lease_up_bonus_days = (
+            tier.lease_up_days_above
+            if local_reputation_score > tier.reputation_threshold
+            else tier.lease_up_days_at_or_below
+        )
 
         # Calculate annual synergy value
         annual_opex = candidate_opex_per_unit * candidate_units
@@ -303,5 +614,5 @@ class PortfolioAnalyzer:
             synergy_value_estimate=round(synergy_value_estimate, 2),
             opex_savings_pct=opex_savings_pct,
             lease_up_bonus_days=lease_up_bonus_days,
-            synergy_factors=synergy_factors,
+            synergy_factors=tier.synergy_factors,
         )
@@ -7,24 +7,49 @@ and assesses fit with Aker Companies' investment thesis.
 from __future__ import annotations
 
 import logging
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 logger = logging.getLogger(__name__)
 
+# Aker fit scores by product type
+PRODUCT_FIT_SCORES = {
+    "garden": 100,  # 1-2 stories, surface parking - core target
+    "low-rise": 100,  # 3-4 stories - core target
+    "mid-rise": 70,  # 5-8 stories - selective opportunities
+    "high-rise": 20,  # 9+ stories - rare, high bar
+}
 
-class ProductTypeClassifier:
-    """Classify multifamily product types and assess Aker investment fit."""
 
-    # Aker fit scores by product type
-    PRODUCT_FIT_SCORES = {
-        "garden": 100,  # 1-2 stories, surface parking - core target
-        "low-rise": 100,  # 3-4 stories - core target
-        "mid-rise": 70,  # 5-8 stories - selective opportunities
-        "high-rise": 20,  # 9+ stories - rare, high bar
-    }
+@dataclass(frozen=True, slots=True)
+class ProductMeta:
+    """Static classification metadata for one product type."""
 
-    # Preferred retail tenant types for mixed-use (Aker thesis)
-    PREFERRED_RETAIL_TENANTS = {
+    product_type: str
+    aker_fit_score: int
+    description: str
+    typical_features: tuple[str, ...]
+    notes: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metadata as a fresh classification dict."""
+        return {
+            "product_type": self.product_type,
+            "aker_fit_score": self.aker_fit_score,
+            "description": self.description,
+            "typical_features": list(self.typical_features),
+            "notes": self.notes,
+        }
+
+
+# Preferred retail tenant types for mixed-use (Aker thesis)
+PREFERRED_RETAIL_TENANTS = frozenset(
+    {
         "coffee_shop",
         "outdoor_gear",
         "bodega",
@@ -32,6 +57,138 @@ class ProductTypeClassifier:
         "bike_shop",
         "farmers_market",
     }
+)
+
+# Reuse verdict for properties that are already housing
+_ALREADY_RESIDENTIAL_RESULT: dict[str, Any] = {
+    "reuse_candidate": False,
+    "conversion_complexity": "n/a",
+    "reuse_potential_score": 0,
+    "notes": "Already residential - not a conversion candidate",
+}
+
+# Exact current_use values that short-circuit before any scoring
+_INELIGIBLE_REUSE_RESULTS: dict[str, dict[str, Any]] = {
+    "multifamily": _ALREADY_RESIDENTIAL_RESULT,
+    "residential": _ALREADY_RESIDENTIAL_RESULT,
+    "single_family": _ALREADY_RESIDENTIAL_RESULT,
+}
+
+# One bit per preferred tenant type; other tenants map to no bit
+_PREFERRED_TENANT_BITS: dict[str, int] = {
+    tenant: 1 << bit for bit, tenant in enumerate(sorted(PREFERRED_RETAIL_TENANTS))
+}
+
+# Interned so the hyphenated labels are shared objects across results
+_PRODUCT_TYPES = tuple(
+    sys.intern(product_type)
+    for product_type in ("garden", "low-rise", "mid-rise", "high-rise")
+)
+_PRODUCT_TYPES_ARR = np.array(_PRODUCT_TYPES)
+_FIT_SCORES_ARR = np.array(
+    [PRODUCT_FIT_SCORES[product_type] for product_type in _PRODUCT_TYPES],
+    dtype=np.int64,
+)
+
+# Below this many properties the array masks cost more than per-item lookups
+_BATCH_MIN_SIZE = 16
+
+# Built once at import; classification only selects an entry
+_PRODUCT_METADATA: dict[str, ProductMeta] = {
+    meta.product_type: meta
+    for meta in (
+        ProductMeta(
+            product_type="garden",
+            aker_fit_score=PRODUCT_FIT_SCORES["garden"],
+            description="Garden-style (1-2 stories, surface parking)",
+            typical_features=("Surface parking", "Lower density", "Outdoor-oriented"),
+            notes="",
+        ),
+        ProductMeta(
+            product_type="low-rise",
+            aker_fit_score=PRODUCT_FIT_SCORES["low-rise"],
+            description="Low-rise (3-4 stories)",
+            typical_features=(
+                "Tuck-under or surface parking",
+                "Walkable scale",
+                "Wood-frame construction",
+            ),
+            notes="",
+        ),
+        ProductMeta(
+            product_type="mid-rise",
+            aker_fit_score=PRODUCT_FIT_SCORES["mid-rise"],
+            description="Mid-rise (5-8 stories)",
+            typical_features=(
+                "Structured parking",
+                "Urban infill",
+                "Elevator required",
+            ),
+            notes="Select opportunities only",
+        ),
+        ProductMeta(
+            product_type="high-rise",
+            aker_fit_score=PRODUCT_FIT_SCORES["high-rise"],
+            description="High-rise (9+ stories)",
+            typical_features=(
+                "Urban core",
+                "Concrete/steel construction",
+                "High density",
+            ),
+            notes="Rare opportunity, high bar",
+        ),
+    )
+}
+
+
+def _story_bucket(stories: float) -> int:
+    """Map a story count to its index in ``_PRODUCT_TYPES``.
+
+    Buckets are closed integer ranges (<=2, 3-4, 5-8); anything outside them,
+    including fractional counts between ranges such as 2.5, is high-rise.
+    """
+    if stories <= 2:
+        return 0
+    if 3 <= stories <= 4:
+        return 1
+    if 5 <= stories <= 8:
+        return 2
+    return 3
+
+
+@lru_cache(maxsize=2048)
+def _score_retail_tenants(tenants: tuple[Any, ...]) -> tuple[int, int]:
+    """Score a tenant mix against the preferred tenant types.
+
+    Args:
+        tenants: Tenant types as listed; entries that are not preferred
+            tenant names (including None) count toward the total only
+
+    Returns:
+        Tuple of (preferred tenant count, retail profile score 0-100)
+    """
+    # OR preferred tenants into a bitmask and popcount it; a bit already set
+    # means a repeated tenant type, which still counts toward the total
+    mask = 0
+    repeats = 0
+    for tenant in tenants:
+        bit = _PREFERRED_TENANT_BITS.get(tenant, 0)
+        repeats += bool(mask & bit)
+        mask |= bit
+    preferred_count = mask.bit_count() + repeats
+    if not tenants:
+        return preferred_count, 50  # Unknown, default to neutral
+    return preferred_count, int((preferred_count / len(tenants)) * 100)
+
+
+class ProductTypeClassifier:
+    """Classify multifamily product types and assess Aker investment fit."""
+
+    # Aker fit scores by product type
+    PRODUCT_FIT_SCORES = PRODUCT_FIT_SCORES
+
+    # Preferred retail tenant types for mixed-use (Aker thesis)
+    PREFERRED_RETAIL_TENANTS = PREFERRED_RETAIL_TENANTS
 
     def __init__(self) -> None:
         """Initialize product type classifier."""
@@ -53,47 +210,44 @@ class ProductTypeClassifier:
         stories = property_data.get("stories", 0)
 
         # Classify by story count
-        if stories <= 2:
-            product_type = "garden"
-            description = "Garden-style (1-2 stories, surface parking)"
-            typical_features = ["Surface parking", "Lower density", "Outdoor-oriented"]
-            notes = ""
-        elif 3 <= stories <= 4:
-            product_type = "low-rise"
-            description = "Low-rise (3-4 stories)"
-            typical_features = [
-                "Tuck-under or surface parking",
-                "Walkable scale",
-                "Wood-frame construction",
-            ]
-            notes = ""
-        elif 5 <= stories <= 8:
-            product_type = "mid-rise"
-            description = "Mid-rise (5-8 stories)"
-            typical_features = [
-                "Structured parking",
-                "Urban infill",
-                "Elevator required",
-            ]
-            notes = "Select opportunities only"
-        else:  # 9+ stories
-            product_type = "high-rise"
-            description = "High-rise (9+ stories)"
-            typical_features = [
-                "Urban core",
-                "Concrete/steel construction",
-                "High density",
-            ]
-            notes = "Rare opportunity, high bar"
+        product_type = _PRODUCT_TYPES[_story_bucket(stories)]
+
+        return _PRODUCT_METADATA[product_type].as_dict()
 
-        aker_fit_score = self.PRODUCT_FIT_SCORES[product_type]
+    def classify_batch(self, stories: npt.ArrayLike) -> dict[str, npt.NDArray[Any]]:
+        """Classify many properties by story count at once.
+
+        Vectorized counterpart of ``classify_product_type`` for portfolio-wide
+        reclassification; returns only the type and fit score per property.
+
+        Args:
+            stories: Story count of each property
+
+        Returns:
+            Dictionary with product_type and aker_fit_score arrays
+
+        Raises:
+            ValueError: If any story count is NaN
+        """
+        stories_arr = np.asarray(stories, dtype=np.float64)
+        if np.isnan(stories_arr).any():
+            raise ValueError("Story counts must not be NaN")
+
+        if stories_arr.size < _BATCH_MIN_SIZE:
+            idx = np.array(
+                [_story_bucket(s) for s in stories_arr.ravel().tolist()],
+                dtype=np.intp,
+            ).reshape(stories_arr.shape)
+        else:
+            # Same closed ranges as _story_bucket; everything else is high-rise
+            idx = np.full(stories_arr.shape, 3, dtype=np.intp)
+            idx[(stories_arr >= 5) & (stories_arr <= 8)] = 2
+            idx[(stories_arr >= 3) & (stories_arr <= 4)] = 1
+            idx[stories_arr <= 2] = 0
 
         return {
-            "product_type": product_type,
-            "aker_fit_score": aker_fit_score,
-            "description": description,
-            "typical_features": typical_features,
-            "notes": notes,
+            "product_type": _PRODUCT_TYPES_ARR[idx],
+            "aker_fit_score": _FIT_SCORES_ARR[idx],
         }
 
     def assess_mixed_use(self, property_data: dict[str, Any]) -> dict[str, Any]:
@@ -134,16 +288,11 @@ class ProductTypeClassifier:
 
         # Assess retail tenant mix (prefer coffee, gear, bodega per Aker)
         retail_tenants = property_data.get("retail_tenants", [])
-        preferred_count = sum(
-            1 for tenant in retail_tenants if tenant in self.PREFERRED_RETAIL_TENANTS
+        preferred_count, retail_profile_score = _score_retail_tenants(
+            tuple(retail_tenants)
         )
         total_tenants = len(retail_tenants)
 
-        if total_tenants > 0:
-            retail_profile_score = int((preferred_count / total_tenants) * 100)
-        else:
-            retail_profile_score = 50  # Unknown, default to neutral
-
         # Overall mixed-use fit (weighted: location 60%, retail 40%)
         mixed_use_fit_score = int(location_score * 0.6 + retail_profile_score * 0.4)
 
@@ -176,13 +325,13 @@ class ProductTypeClassifier:
         current_use = property_data.get("current_use", "").lower()
 
         # Already residential = not a conversion candidate
-        if "multifamily" in current_use or "residential" in current_use:
-            return {
-                "reuse_candidate": False,
-                "conversion_complexity": "n/a",
-                "reuse_potential_score": 0,
-                "notes": "Already residential - not a conversion candidate",
-            }
+        ineligible = _INELIGIBLE_REUSE_RESULTS.get(current_use)
+        if ineligible is None and (
+            "multifamily" in current_use or "residential" in current_use
+        ):
+            ineligible = _ALREADY_RESIDENTIAL_RESULT
+        if ineligible is not None:
+            return dict(ineligible)
 
         # Assess conversion feasibility factors
         ceiling_height = property_data.get("ceiling_height_ft", 0)
@@ -18,7 +18,13 @@ from .cache_stats import (
     SourceStatistics,
     TierStatistics,
 )
-from .cache_warmer import CacheWarmer, PrefetchScheduler, WarmingProgress, WarmingResult
+from .cache_warmer import (
+    CacheWarmer,
+    PrefetchScheduler,
+    WarmingProgress,
+    WarmingResult,
+    get_shared_executor,
+)
 from .census import CensusConnector
 from .config import ConfigManager
 from .drought_monitor import DroughtMonitorConnector
@@ -73,6 +79,7 @@ __all__ = [
     "PrefetchScheduler",
     "WarmingProgress",
     "WarmingResult",
+    "get_shared_executor",
     "MemoryCache",
     "CensusConnector",
     "ConfigManager",
@@ -28,6 +28,9 @@ class APIConnector(ABC):
 
     DEFAULT_CACHE_TTL_DAYS = 30
     DEFAULT_RATE_LIMIT = 500
+    DEFAULT_BURST_LIMIT = 60
+    BURST_WINDOW_SECONDS = 60.0  # burst_limit is requests per minute
+    MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
 
     def __init__(
         self,
@@ -36,6 +39,7 @@ class APIConnector(ABC):
         base_url: str = "",
         cache_ttl_days: int = DEFAULT_CACHE_TTL_DAYS,
         rate_limit: int = DEFAULT_RATE_LIMIT,
+        burst_limit: int = DEFAULT_BURST_LIMIT,
         cache_manager: "CacheManager" | None = None,
     ) -> None:
         self.api_key = api_key or self._load_api_key()
@@ -49,8 +53,17 @@ class APIConnector(ABC):
 
             self.cache = CacheManager()
 
-        self._request_count = 0
-        self._last_request_time = datetime.now(timezone.utc)
+        # Token bucket smoothing bursts: a minute's worth of requests up front,
+        # refilled continuously so callers only wait until the next token is due.
+        self.burst_limit = burst_limit
+        self._capacity = burst_limit
+        self._refill_rate = burst_limit / self.BURST_WINDOW_SECONDS
+        self._tokens = float(burst_limit)
+        self._last_refill = time.monotonic()
+        # Hard ceiling per UTC day: providers bill and block on calendar-day
+        # quotas, so rate_limit is enforced by a counter, not by the bucket.
+        self._daily_count = 0
+        self._daily_count_date = datetime.now(timezone.utc).date()
 
     # ------------------------------------------------------------------
     # Abstract surface
@@ -107,8 +120,13 @@ class APIConnector(ABC):
         *,
         max_retries: int = 5,
         initial_delay: float = 1.0,
+        sleeper: Callable[[float], None] = time.sleep,
     ) -> Any:
-        """Retry a callable using exponential backoff for transient errors."""
+        """Retry a callable using exponential backoff for transient errors.
+
+        ``sleeper`` performs the wait between attempts; tests pass a recorder
+        so the backoff schedule can be checked without real delays.
+        """
         delay = initial_delay
         for attempt in range(1, max_retries + 1):
             try:
@@ -121,35 +139,75 @@ class APIConnector(ABC):
                 )
                 if attempt == max_retries:
                     raise DataSourceError("Maximum retry attempts exceeded") from exc
-                time.sleep(delay)
+                sleeper(delay)
                 delay *= 2
         raise DataSourceError("Unable to complete request after retries")
 
-    def _check_rate_limit(self) -> None:
-        """Track request volume and raise when limit exceeded."""
-        now = datetime.now(timezone.utc)
-        if now.date() != self._last_request_time.date():
-            self._request_count = 0
+    @property
+    def _request_count(self) -> int:
+        """Requests counted against today's (UTC) quota."""
+        self._roll_daily_count()
+        return self._daily_count
+
+    @_request_count.setter
+    def _request_count(self, value: int) -> None:
+        self._roll_daily_count()
+        self._daily_count = value
+
+    def _roll_daily_count(self) -> None:
+        """Reset the daily request count when the UTC date changes."""
+        today = datetime.now(timezone.utc).date()
+        if today != self._daily_count_date:
+            self._daily_count = 0
+            self._daily_count_date = today
+
+    def _refill_tokens(self) -> None:
+        """Credit tokens accrued since the last refill, capped at capacity."""
+        now = time.monotonic()
+        refill = (now - self._last_refill) * self._refill_rate
+        self._tokens = min(self._capacity, self._tokens + refill)
+        self._last_refill = now
+
+    def _check_rate_limit(
+        self, *, sleeper: Callable[[float], None] = time.sleep
+    ) -> None:
+        """Count a request against today's quota, pacing bursts via the bucket.
 
-        if self._request_count >= self.rate_limit:
+        ``sleeper`` performs the wait for the next token; tests pass a recorder
+        so the throttling can be checked without real delays.
+        """
+        self._roll_daily_count()
+        if self._daily_count >= self.rate_limit:
             raise RateLimitExceeded(
                 f"Rate limit of {self.rate_limit} requests/day exceeded"
             )
 
-        usage_ratio = (self._request_count + 1) / self.rate_limit
+        self._refill_tokens()
+
+        if self._tokens < 1:
+            wait = (1 - self._tokens) / self._refill_rate
+            if wait > self.MAX_RATE_LIMIT_WAIT_SECONDS:
+                raise RateLimitExceeded(
+                    f"Burst limit of {self.burst_limit} requests/minute exceeded; "
+                    f"next request allowed in {wait:.0f}s"
+                )
+            logger.info("Rate limit throttling: waiting %.2fs", wait)
+            # The token is taken below; the wait is credited by the next refill
+            sleeper(wait)
+
+        usage_ratio = (self._daily_count + 1) / self.rate_limit
         if usage_ratio >= 0.8:
             logger.warning("Approaching rate limit: %.0f%% used", usage_ratio * 100)
 
-        self._request_count += 1
-        self._last_request_time = now
+        self._tokens -= 1
+        self._daily_count += 1
 
     def _track_request(self) -> None:
-        """Increment request counter without performing limit checks."""
-        now = datetime.now(timezone.utc)
-        if now.date() != self._last_request_time.date():
-            self._request_count = 0
-        self._request_count += 1
-        self._last_request_time = now
+        """Take a token without performing limit checks."""
+        self._roll_daily_count()
+        self._refill_tokens()
+        self._tokens -= 1
+        self._daily_count += 1
 
     def _load_api_key(self) -> str | None:
         """Placeholder for subclasses to load API keys if not provided."""
@@ -10,6 +10,8 @@ import logging
 import os
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 
@@ -21,6 +23,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = "https://apps.bea.gov/api/data"
+
+# Low-cardinality label columns repeated on every row of a Regional response
+_CATEGORICAL_COLUMNS = ("GeoFips", "GeoName", "Description", "CL_UNIT")
+
+
+def _years_key(years: List[int]) -> str:
+    """Canonical cache-key fragment for a year list (order and repeats ignored).
+
+    BEA returns the same rows whatever order ``Year`` lists them in, so
+    ``[2021, 2020]`` and ``[2020, 2021]`` share one cache entry. Sorted unique
+    lists produce the same key as before, so existing entries stay valid.
+    """
+    return "_".join(map(str, sorted(set(years))))
+
 
 class BEAConnector(APIConnector):
     """
@@ -61,12 +78,22 @@ class BEAConnector(APIConnector):
 
         super().__init__(
             api_key=api_key,
-            base_url="https://apps.bea.gov/api/data",
+            base_url=BASE_URL,
             cache_ttl_days=30,  # BEA data updates quarterly
             rate_limit=100,  # 100 requests per minute for registered keys
             cache_manager=cache_manager,
         )
 
+        # Reuse one keep-alive connection pool across calls instead of a new
+        # TCP/TLS handshake per request.
+        self._session = requests.Session()
+        # Query parameters shared by every GetData call, built once
+        self._base_params: Dict[str, Any] = {
+            "UserID": self.api_key,
+            "method": "GetData",
+            "ResultFormat": "JSON",
+        }
+
     def _load_api_key(self) -> str | None:
         """Load BEA API key from environment."""
         return os.getenv("BEA_API_KEY")
@@ -87,17 +114,14 @@ class BEAConnector(APIConnector):
         self._check_rate_limit()
 
         # Add required parameters
-        full_params = {
-            "UserID": self.api_key,
-            "method": "GetData",
-            "ResultFormat": "JSON",
-            **params,
-        }
+        full_params = {**self._base_params, **params}
 
         try:
-            response = requests.get(self.base_url, params=full_params, timeout=30)
+            response = self._session.get(self.base_url, params=full_params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            # orjson decodes the raw bytes directly, skipping requests' text
+            # decoding and the stdlib json parser
+            data = orjson.loads(response.content)
 
             # Check for BEA API errors
             if "BEAAPI" in data and "Error" in data["BEAAPI"]:
@@ -110,6 +134,9 @@ class BEAConnector(APIConnector):
         except requests.exceptions.RequestException as exc:
             logger.error("BEA API request failed: %s", exc)
             raise DataSourceError(f"Failed to fetch BEA data: {exc}") from exc
+        except orjson.JSONDecodeError as exc:
+            logger.error("BEA API returned invalid JSON: %s", exc)
+            raise DataSourceError(f"Invalid JSON from BEA API: {exc}") from exc
 
     def parse(self, response: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -126,14 +153,21 @@ class BEAConnector(APIConnector):
         """
         try:
             data = response["BEAAPI"]["Results"]["Data"]
-            df = pd.DataFrame(data)
+            df = pd.DataFrame.from_records(data)
 
-            # Convert DataValue to numeric
+            # Convert DataValue to numeric in one pass; BEA sends "1,234" and
+            # suppression codes such as "(D)", which coerce to NaN
             if "DataValue" in df.columns:
                 df["DataValue"] = pd.to_numeric(
-                    df["DataValue"].str.replace(",", ""), errors="coerce"
+                    df["DataValue"].str.replace(",", "", regex=False),
+                    errors="coerce",
                 )
 
+            # One astype pass stores repeated labels as small integer codes
+            df = df.astype(
+                {col: "category" for col in _CATEGORICAL_COLUMNS if col in df.columns}
+            )
+
             return df
 
         except (KeyError, TypeError, AttributeError) as exc:
@@ -168,7 +202,7 @@ class BEAConnector(APIConnector):
             ... )
             >>> assert "DataValue" in df.columns
         """
-        cache_key = f"bea_gdp_{table_name}_{geo_fips}_{'_'.join(map(str, years))}"
+        cache_key = f"bea_gdp_{table_name}_{geo_fips}_{_years_key(years)}"
 
         # Check cache
         cached = self.cache.get(cache_key)
@@ -181,7 +215,7 @@ class BEAConnector(APIConnector):
             "DataSetName": "Regional",
             "TableName": table_name,
             "GeoFips": geo_fips,
-            "Year": ",".join(map(str, years)),
+            "Year": ",".join(map(str, sorted(set(years)))),
         }
 
         response = self._retry_with_backoff(lambda: self.fetch(params))
@@ -221,7 +255,7 @@ class BEAConnector(APIConnector):
             ...     years=[2020, 2021]
             ... )
         """
-        cache_key = f"bea_income_{table_name}_{geo_fips}_{'_'.join(map(str, years))}"
+        cache_key = f"bea_income_{table_name}_{geo_fips}_{_years_key(years)}"
 
         # Check cache
         cached = self.cache.get(cache_key)
@@ -234,7 +268,7 @@ class BEAConnector(APIConnector):
             "DataSetName": "Regional",
             "TableName": table_name,
             "GeoFips": geo_fips,
-            "Year": ",".join(map(str, years)),
+            "Year": ",".join(map(str, sorted(set(years)))),
         }
 
         response = self._retry_with_backoff(lambda: self.fetch(params))
@@ -283,26 +317,25 @@ class BEAConnector(APIConnector):
             )
         ]
 
-        # Calculate shares for each year
-        result_frames = []
-
-        for year in gdp_df["TimePeriod"].unique():
-            year_data = gdp_df[gdp_df["TimePeriod"] == year].copy()
-            year_total = totals[totals["TimePeriod"] == year]["DataValue"].iloc[0]
-
-            if year_total and year_total > 0:
-                year_data["sector_share"] = year_data["DataValue"] / year_total * 100
-            else:
-                year_data["sector_share"] = 0.0
+        # Group rows by year (first-appearance order) and divide by that year's
+        # total in one vectorized pass
+        year_codes = pd.factorize(gdp_df["TimePeriod"])[0]
+        order = np.argsort(year_codes, kind="stable")
+        result = gdp_df.iloc[order[year_codes[order] >= 0]].reset_index(drop=True)
 
-            result_frames.append(year_data)
-
-        result = pd.concat(result_frames, ignore_index=True)
+        year_totals = totals.drop_duplicates("TimePeriod").set_index("TimePeriod")
+        year_total = result["TimePeriod"].map(year_totals["DataValue"])
+        result["sector_share"] = np.where(
+            year_total > 0, result["DataValue"] / year_total * 100, 0.0
+        )
 
         # Calculate growth rates (year-over-year)
         result = result.sort_values(["Description", "TimePeriod"])
         result["growth_rate"] = (
-            result.groupby("Description")["DataValue"].pct_change() * 100
+            result.groupby("Description", observed=True, sort=False)[
+                "DataValue"
+            ].pct_change()
+            * 100
         )
 
         return result
@@ -12,8 +12,11 @@ API Documentation: https://www.bls.gov/developers/api_signature_v2.htm
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 from .base import APIConnector
 from .cache import CacheManager
@@ -21,6 +24,9 @@ from .exceptions import ConfigurationError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Label columns repeated on every datapoint of a series
+_CATEGORICAL_COLUMNS = ("series_id", "period", "period_name")
+
 
 class BLSConnector(APIConnector):
     """
@@ -30,6 +36,9 @@ class BLSConnector(APIConnector):
     Rate limit: 500 requests/day with registered API key.
     """
 
+    # BLS API v2 accepts at most 50 series IDs per request
+    MAX_SERIES_PER_REQUEST = 50
+
     def __init__(
         self,
         api_key: Optional[str],
@@ -57,6 +66,10 @@ class BLSConnector(APIConnector):
             rate_limit=500,
         )
         self.cache = cache_manager
+        # Pooled session keeps the TCP/TLS connection to api.bls.gov alive
+        # between series requests; retries stay in _retry_with_backoff
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
     def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -75,14 +88,15 @@ class BLSConnector(APIConnector):
         self._track_request()
 
         def _make_request() -> Dict[str, Any]:
-            response = requests.post(
+            response = self._session.post(
                 self.base_url,
                 json=params,
                 headers={"Content-Type": "application/json"},
                 timeout=30,
             )
             response.raise_for_status()
-            return response.json()
+            # Decode the raw bytes with orjson, as BEAConnector does
+            return orjson.loads(response.content)
 
         return self._retry_with_backoff(_make_request)
 
@@ -110,26 +124,34 @@ class BLSConnector(APIConnector):
         if "Results" not in response or "series" not in response["Results"]:
             raise ValidationError("Invalid BLS response: missing 'Results' or 'series'")
 
-        # Parse series data
-        all_data = []
+        # Parse series data column-wise in a single pass over the payload
+        series_ids: List[str] = []
+        years: List[str] = []
+        periods: List[str] = []
+        period_names: List[str] = []
+        values: List[str] = []
         for series in response["Results"]["series"]:
             series_id = series.get("seriesID", "unknown")
             for datapoint in series.get("data", []):
-                all_data.append(
-                    {
-                        "series_id": series_id,
-                        "year": int(datapoint["year"]),
-                        "period": datapoint["period"],
-                        "period_name": datapoint["periodName"],
-                        "value": float(datapoint["value"]),
-                    }
-                )
-
-        if not all_data:
+                series_ids.append(series_id)
+                years.append(datapoint["year"])
+                periods.append(datapoint["period"])
+                period_names.append(datapoint["periodName"])
+                values.append(datapoint["value"])
+
+        if not series_ids:
             logger.warning("No data returned from BLS API")
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_data)
+        df = pd.DataFrame(
+            {
+                "series_id": series_ids,
+                "year": np.asarray(years, dtype=np.int64),
+                "period": periods,
+                "period_name": period_names,
+                "value": np.asarray(values, dtype=np.float64),
+            }
+        ).astype({col: "category" for col in _CATEGORICAL_COLUMNS})
         logger.info(f"Parsed {len(df)} rows from BLS response")
         return df
 
@@ -161,34 +183,64 @@ class BLSConnector(APIConnector):
             ...     end_year=2021
             ... )
         """
-        cache_key = (
-            f"bls_qcew_{area_code}_{'_'.join(naics_codes)}_{start_year}_{end_year}"
-        )
-
-        # Check cache
-        cached = self.cache.get(cache_key)
-        if cached is not None:
-            logger.info(f"Cache hit for {cache_key}")
-            return cached
-
-        # Build series IDs for QCEW
-        # Format: ENUAAAA00BB0CC (AA=area, BB=naics, CC=data type)
-        series_ids = [f"ENU{area_code}0{naics}010" for naics in naics_codes]
+        # Cache per NAICS code so overlapping requests reuse earlier pulls
+        frames: Dict[str, pd.DataFrame] = {}
+        missing: List[str] = []
+        for naics in dict.fromkeys(naics_codes):
+            cache_key = f"bls_qcew_{area_code}_{naics}_{start_year}_{end_year}"
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for {cache_key}")
+                frames[naics] = cached
+            else:
+                missing.append(naics)
+
+        # One POST per MAX_SERIES_PER_REQUEST uncached series
+        for offset in range(0, len(missing), self.MAX_SERIES_PER_REQUEST):
+            chunk = missing[offset : offset + self.MAX_SERIES_PER_REQUEST]
+            series_ids = [self._qcew_series_id(area_code, naics) for naics in chunk]
+            params = {
+                "seriesid": series_ids,
+                "startyear": str(start_year),
+                "endyear": str(end_year),
+                "registrationkey": self.api_key,
+            }
+
+            df = self.parse(self.fetch(params))
+            entries = []
+            for naics, series_id in zip(chunk, series_ids, strict=True):
+                if df.empty or len(chunk) == 1:
+                    # A single-series response belongs to that series whole
+                    series_df = df
+                else:
+                    series_df = df[df["series_id"] == series_id].reset_index(drop=True)
+                cache_key = f"bls_qcew_{area_code}_{naics}_{start_year}_{end_year}"
+                entries.append((cache_key, series_df))
+                frames[naics] = series_df
+            self.cache.set_many(entries, ttl=self.cache_ttl)
+
+        parts = [frames[naics] for naics in naics_codes if not frames[naics].empty]
+        if not parts:
+            return pd.DataFrame()
+        if len(parts) == 1:
+            return parts[0]
+        return pd.concat(parts, ignore_index=True)
 
-        params = {
-            "seriesid": series_ids,
-            "startyear": str(start_year),
-            "endyear": str(end_year),
-            "registrationkey": self.api_key,
-        }
+    @staticmethod
+    def _qcew_series_id(area_code: str, naics: str) -> str:
+        """Build a QCEW series ID.
 
-        response = self.fetch(params)
-        df = self.parse(response)
+        Format: ENUAAAA00BB0CC (AA=area, BB=naics, CC=data type)
+        """
+        return f"ENU{area_code}0{naics}010"
 
-        # Cache result
-        self.cache.set(cache_key, df, ttl=self.cache_ttl)
+    @staticmethod
+    def _laus_series_id(area_code: str) -> str:
+        """Build a LAUS unemployment-rate series ID.
 
-        return df
+        Format: LAUAAAAAAAAAAAAAA03 (A=area code, 03=unemployment rate)
+        """
+        return f"LAU{area_code}03"
 
     def fetch_laus_unemployment(
         self, area_code: str, start_year: int, end_year: int
@@ -220,11 +272,8 @@ class BLSConnector(APIConnector):
             logger.info(f"Cache hit for {cache_key}")
             return cached
 
-        # LAUS series ID format: LAUAAAAAAAAAAAA03 (unemployment rate)
-        series_id = f"LAU{area_code}03"
-
         params = {
-            "seriesid": [series_id],
+            "seriesid": [self._laus_series_id(area_code)],
             "startyear": str(start_year),
             "endyear": str(end_year),
             "registrationkey": self.api_key,
@@ -302,15 +351,44 @@ class BLSConnector(APIConnector):
         Returns:
             CAGR as decimal (e.g., 0.05 for 5% annual growth)
         """
-        df_sorted = df.sort_values("year")
-        beginning_value = df_sorted["value"].iloc[0]
-        ending_value = df_sorted["value"].iloc[-1]
+        order = np.argsort(df["year"].to_numpy(), kind="stable")
+        values = df["value"].to_numpy(dtype=np.float64)
+        beginning_value = values[order[0]]
+        ending_value = values[order[-1]]
 
-        cagr = (ending_value / beginning_value) ** (1 / years) - 1
+        cagr = float(np.power(ending_value / beginning_value, 1.0 / years) - 1.0)
 
         logger.info(f"CAGR over {years} years: {cagr:.2%}")
         return cagr
 
+    def calculate_cagr_batch(
+        self, df: pd.DataFrame, years: int, group_col: str = "series_id"
+    ) -> pd.Series:
+        """
+        Calculate CAGR for every series in a long-format DataFrame at once.
+
+        Args:
+            df: DataFrame with group, 'year' and 'value' columns (e.g. the
+                output of ``parse`` for a multi-series request)
+            years: Number of years for CAGR calculation
+            group_col: Column identifying each series (default: 'series_id')
+
+        Returns:
+            Series of CAGR decimals indexed by group, using each group's
+            first and last non-null value by year
+        """
+        grouped = df.sort_values([group_col, "year"], kind="stable").groupby(
+            group_col, sort=False, observed=True
+        )["value"]
+        beginning = grouped.first()
+        ending = grouped.last()
+
+        cagr = np.power(
+            ending.to_numpy(dtype=np.float64) / beginning.to_numpy(dtype=np.float64),
+            1.0 / years,
+        )
+        return pd.Series(cagr - 1.0, index=beginning.index, name="cagr")
+
     def calculate_moving_average(self, df: pd.DataFrame, window: int = 12) -> pd.Series:
         """
         Calculate moving average for time series data.
@@ -10,63 +10,132 @@ from __future__ import annotations
 import logging
 import pickle
 import sqlite3
+import weakref
+import zlib
+from collections import OrderedDict
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Generator, Optional
+from threading import Lock
+from typing import Any, Generator, Iterable, Optional, Tuple
 
+from .cache_config import CompressionSettings, MemorySettings
 from .exceptions import CacheError
 
 logger = logging.getLogger(__name__)
 
 
 class CacheManager:
-    """Manage cached API responses using a SQLite backend."""
-
-    def __init__(self, db_path: Path = Path(".cache/aker_platform.db")) -> None:
+    """Manage cached API responses using a SQLite backend.
+
+    Pass ``db_path=":memory:"`` for a private in-memory database that lives as
+    long as the manager; nothing touches disk, which suits tests.
+
+    The most recently used entries (up to ``MEMO_MAX_ENTRIES`` and
+    ``memory.size_mb`` of pickled bytes) are also kept in process, so repeat
+    hits skip the SQLite round trip while callers still get their own unpickled
+    copy. Writes made to the same database file by another manager are not seen
+    until the entry expires.
+
+    Pickled payloads larger than ``compression.threshold_kb`` are stored in
+    SQLite zlib-compressed behind a one-byte marker; smaller payloads (and rows
+    written before compression existed) are plain pickles.
+    """
+
+    MEMORY_DB = ":memory:"
+    MEMO_MAX_ENTRIES = 1024
+    _GET_SQL = "SELECT value, expires_at FROM cache WHERE key = ?"
+    # SQLite's default SQLITE_MAX_VARIABLE_NUMBER before 3.32
+    MAX_KEYS_PER_QUERY = 999
+    _SET_SQL = (
+        "INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)"
+        " VALUES (?, ?, ?, ?)"
+    )
+    # Mirrors the cache.compression defaults in CacheConfig
+    DEFAULT_COMPRESSION = CompressionSettings(enabled=True, threshold_kb=10, level=6)
+    DEFAULT_MEMORY = MemorySettings(enabled=True, size_mb=256)
+    # Pickles (protocol >= 2) always start with 0x80, so this cannot collide
+    _ZLIB_MARKER = b"\x01"
+
+    def __init__(
+        self,
+        db_path: Path | str = Path(".cache/aker_platform.db"),
+        *,
+        compression: CompressionSettings = DEFAULT_COMPRESSION,
+        memory: MemorySettings = DEFAULT_MEMORY,
+    ) -> None:
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.memory = memory
+        self._memo_budget = memory.size_mb * 1024 * 1024 if memory.enabled else 0
+        self._memo: OrderedDict[str, Tuple[bytes, datetime]] = OrderedDict()
+        self._memo_bytes = 0
+        self._memo_lock = Lock()
+        # One autocommit connection for the manager's lifetime, shared across
+        # threads and serialised by _conn_lock
+        self._conn_lock = Lock()
+        if str(db_path) == self.MEMORY_DB:
+            # Each sqlite3.connect(":memory:") is a fresh database, so the
+            # shared connection *is* the cache; durability settings are moot.
+            self._conn = self._open_connection(self.MEMORY_DB)
+            self._conn.execute("PRAGMA journal_mode=MEMORY")
+            self._conn.execute("PRAGMA synchronous=OFF")
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = self._open_connection(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # WAL stays consistent with NORMAL; only the last commits before
+            # a power loss can be rolled back, which a cache tolerates
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Close (and checkpoint the WAL) when the manager is collected or at exit
+        self._finalizer = weakref.finalize(self, self._conn.close)
         self._init_db()
 
-    @contextmanager
-    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        """Context manager for SQLite connections with consistent error handling."""
+    @staticmethod
+    def _open_connection(database: Path | str) -> sqlite3.Connection:
+        """Open the shared SQLite connection, wrapping failures as CacheError."""
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA journal_mode=WAL")
-            yield conn
-            conn.commit()
+            return sqlite3.connect(
+                database, check_same_thread=False, isolation_level=None
+            )
         except sqlite3.Error as exc:  # pragma: no cover - defensive
             logger.exception("Cache database error: %s", exc)
             raise CacheError("Cache database operation failed") from exc
-        finally:
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for SQLite connections with consistent error handling."""
+
+        with self._conn_lock:
             try:
-                conn.close()
-            except UnboundLocalError:  # pragma: no cover - connection failed
-                pass
+                yield self._conn
+            except sqlite3.Error as exc:  # pragma: no cover - defensive
+                logger.exception("Cache database error: %s", exc)
+                raise CacheError("Cache database operation failed") from exc
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+
+        self._finalizer()
 
     def _init_db(self) -> None:
         """Create cache table and supporting index if required."""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
+        with self._connect() as conn:
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache (
                     key TEXT PRIMARY KEY,
                     value BLOB NOT NULL,
                     created_at TEXT NOT NULL,
                     expires_at TEXT NOT NULL
                 )
-                """
-            )
-            conn.execute(
-                """
+                """)
+            conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_cache_expires
                     ON cache(expires_at)
-                """
-            )
-            conn.commit()
+                """)
 
     def _current_time(self) -> datetime:
         """Return current UTC timestamp (wrapped for monkeypatching in tests)."""
@@ -91,11 +160,23 @@ class CacheManager:
 
         now = self._current_time()
 
+        with self._memo_lock:
+            entry = self._memo.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memo.move_to_end(key)
+                else:
+                    # Let the SQLite path below log and delete the expired row
+                    self._memo_bytes -= len(self._memo.pop(key)[0])
+                    entry = None
+
+        if entry is not None:
+            payload, expires_at = entry
+            logger.info("Cache hit for %s (expires %s)", key, expires_at.isoformat())
+            return pickle.loads(payload)
+
         with self._connect() as conn:
-            cursor = conn.execute(
-                "SELECT value, expires_at FROM cache WHERE key = ?",
-                (key,),
-            )
+            cursor = conn.execute(self._GET_SQL, (key,))
             row = cursor.fetchone()
 
             if row is None:
@@ -115,34 +196,124 @@ class CacheManager:
                 key,
                 expires_at_str,
             )
+            payload = self._decode(payload)
+            self._memo_put(key, payload, expires_at)
             return pickle.loads(payload)
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return cached values for every unexpired key among *keys*.
+
+        Keys missing from the memo are read with one ``IN (...)`` query per
+        ``MAX_KEYS_PER_QUERY`` keys; misses and expired keys are left out of
+        the result.
+        """
+
+        requested = list(dict.fromkeys(keys))
+        now = self._current_time()
+        found: dict[str, bytes] = {}
+        pending: list[str] = []
+
+        with self._memo_lock:
+            for key in requested:
+                entry = self._memo.get(key)
+                if entry is not None and entry[1] > now:
+                    self._memo.move_to_end(key)
+                    found[key] = entry[0]
+                    continue
+                if entry is not None:
+                    self._memo_bytes -= len(self._memo.pop(key)[0])
+                pending.append(key)
+
+        expired: list[tuple[str]] = []
+        with self._connect() as conn:
+            for start in range(0, len(pending), self.MAX_KEYS_PER_QUERY):
+                chunk = pending[start : start + self.MAX_KEYS_PER_QUERY]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT key, value, expires_at FROM cache"
+                    f" WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, payload, expires_at_str in rows:
+                    expires_at = datetime.fromisoformat(expires_at_str)
+                    if expires_at <= now:
+                        expired.append((key,))
+                        continue
+                    payload = self._decode(payload)
+                    self._memo_put(key, payload, expires_at)
+                    found[key] = payload
+            if expired:
+                conn.executemany("DELETE FROM cache WHERE key = ?", expired)
+
+        logger.info(
+            "Cache batch lookup: %s hits, %s misses",
+            len(found),
+            len(requested) - len(found),
+        )
+        return {key: pickle.loads(found[key]) for key in requested if key in found}
+
     def set(self, key: str, value: Any, *, ttl: timedelta) -> None:
         """Store *value* under *key* with provided *ttl*."""
 
         now = self._current_time()
         expires_at = now + ttl
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        blob = self._encode(payload)
 
         with self._connect() as conn:
             conn.execute(
-                """
-                INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)
-                VALUES (?, ?, ?, ?)
-                """,
+                self._SET_SQL,
                 (
                     key,
-                    pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                    blob,
                     now.isoformat(),
                     expires_at.isoformat(),
                 ),
             )
+        self._memo_put(key, payload, expires_at)
 
         logger.info("Cached %s until %s", key, expires_at.isoformat())
 
+    def set_many(self, items: Iterable[Tuple[str, Any]], *, ttl: timedelta) -> None:
+        """Store each ``(key, value)`` pair with the same *ttl* in one transaction."""
+
+        now = self._current_time()
+        expires_at = now + ttl
+        created_iso = now.isoformat()
+        expires_iso = expires_at.isoformat()
+        payloads = [
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            for key, value in items
+        ]
+        if not payloads:
+            return
+
+        rows = [
+            (key, self._encode(payload), created_iso, expires_iso)
+            for key, payload in payloads
+        ]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(self._SET_SQL, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        for key, payload in payloads:
+            self._memo_put(key, payload, expires_at)
+
+        logger.info("Cached %s entries until %s", len(payloads), expires_iso)
+
     def clear_expired(self) -> int:
         """Remove expired cache entries. Returns the number of rows removed."""
 
-        now_iso = self._current_time().isoformat()
+        now = self._current_time()
+        now_iso = now.isoformat()
+        with self._memo_lock:
+            for key in [k for k, (_, exp) in self._memo.items() if exp <= now]:
+                self._memo_bytes -= len(self._memo.pop(key)[0])
+
         with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM cache WHERE expires_at <= ?",
@@ -157,11 +328,48 @@ class CacheManager:
     def purge(self) -> None:
         """Remove all cache entries."""
 
+        with self._memo_lock:
+            self._memo.clear()
+            self._memo_bytes = 0
         with self._connect() as conn:
             conn.execute("DELETE FROM cache")
 
         logger.warning("Purged all cache entries")
 
+    def _encode(self, payload: bytes) -> bytes:
+        """Compress *payload* for storage when it exceeds the size threshold."""
+
+        settings = self.compression
+        if settings.enabled and len(payload) > settings.threshold_kb * 1024:
+            return self._ZLIB_MARKER + zlib.compress(payload, settings.level)
+        return payload
+
+    def _decode(self, blob: bytes) -> bytes:
+        """Return the pickled payload for a stored *blob*."""
+
+        if blob[:1] == self._ZLIB_MARKER:
+            return zlib.decompress(blob[1:])
+        return blob
+
+    def _memo_put(self, key: str, payload: bytes, expires_at: datetime) -> None:
+        """Record *payload* as most recently used, evicting the oldest entry."""
+
+        with self._memo_lock:
+            previous = self._memo.pop(key, None)
+            if previous is not None:
+                self._memo_bytes -= len(previous[0])
+            if len(payload) > self._memo_budget:
+                # Too large to ever fit (or the memory tier is disabled)
+                return
+            self._memo[key] = (payload, expires_at)
+            self._memo_bytes += len(payload)
+            while (
+                len(self._memo) > self.MEMO_MAX_ENTRIES
+                or self._memo_bytes > self._memo_budget
+            ):
+                _, (evicted, _) = self._memo.popitem(last=False)
+                self._memo_bytes -= len(evicted)
+
     def list_keys(self, limit: int = 100) -> list[str]:
         """List cache keys.
 
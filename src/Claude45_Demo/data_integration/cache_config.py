@@ -16,6 +16,7 @@ Example usage:
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -28,10 +29,32 @@ import yaml
 
 from .exceptions import ConfigurationError
 
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
 _TTL_PATTERN = re.compile(r"^(?P<value>\d+(?:\.\d+)?)(?P<unit>[smhdw])$", re.IGNORECASE)
+_TTL_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+_ISO_DURATION_PATTERN = re.compile(
+    r"P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a YAML config file, memoized on its path, mtime and size.
+
+    Callers must treat the result as read-only; ``CacheConfig`` only ever
+    builds new dictionaries from it.
+    """
+
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_YamlLoader) or {}
 
 
 @dataclass(frozen=True)
@@ -146,8 +169,10 @@ class CacheConfig:
             resolved_path = self._resolve_config_path(config_path)
             if resolved_path and resolved_path.exists():
                 try:
-                    with resolved_path.open("r", encoding="utf-8") as fh:
-                        raw_config = yaml.safe_load(fh) or {}
+                    stat = resolved_path.stat()
+                    raw_config = _load_yaml(
+                        str(resolved_path), stat.st_mtime_ns, stat.st_size
+                    )
                     logger.info("Loaded cache config from %s", resolved_path)
                 except yaml.YAMLError as exc:
                     raise ConfigurationError(
@@ -165,8 +190,10 @@ class CacheConfig:
 
         self._config = self._merge_with_defaults(raw_config)
         self._substitute_env_vars()
-        self._validate_schema()
+        # Filled with every configured policy by _validate_schema, so get_ttl
+        # only parses the default TTL for unlisted sources
         self._ttl_cache: Dict[str, timedelta] = {}
+        self._validate_schema()
 
     # ------------------------------------------------------------------
     # Public API
@@ -345,11 +372,14 @@ class CacheConfig:
             raise ConfigurationError("cache.ttl_policies must be a mapping")
         for source, value in ttl_policies.items():
             try:
-                self._parse_ttl(value, label=f"ttl for {source}")
+                ttl = self._parse_ttl(value, label=f"ttl for {source}")
             except ConfigurationError as exc:
                 raise ConfigurationError(
                     f"Invalid TTL for cache source '{source}': {exc}"
                 ) from exc
+            # get_ttl looks sources up lower-cased, so only those keys can hit
+            if isinstance(source, str) and source == source.lower():
+                self._ttl_cache[source] = ttl
 
     def _parse_ttl(self, value: Any, *, label: str) -> timedelta:
         """Parse TTL value into timedelta."""
@@ -369,18 +399,8 @@ class CacheConfig:
 
             match = _TTL_PATTERN.match(normalized)
             if match:
-                amount = float(match.group("value"))
-                unit = match.group("unit").lower()
-                if unit == "s":
-                    return timedelta(seconds=amount)
-                if unit == "m":
-                    return timedelta(minutes=amount)
-                if unit == "h":
-                    return timedelta(hours=amount)
-                if unit == "d":
-                    return timedelta(days=amount)
-                if unit == "w":
-                    return timedelta(weeks=amount)
+                unit = _TTL_UNITS[match.group("unit").lower()]
+                return timedelta(**{unit: float(match.group("value"))})
 
             # Support ISO 8601-like values (e.g., PT1H) if provided
             try:
@@ -393,11 +413,7 @@ class CacheConfig:
     def _parse_iso_duration(self, value: str) -> timedelta:
         """Parse minimal subset of ISO 8601 durations (PnDTnHnMnS)."""
 
-        iso_pattern = re.compile(
-            r"P(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?",
-            re.IGNORECASE,
-        )
-        match = iso_pattern.fullmatch(value)
+        match = _ISO_DURATION_PATTERN.fullmatch(value)
         if not match:
             raise ConfigurationError(f"Unsupported TTL format '{value}'")
 
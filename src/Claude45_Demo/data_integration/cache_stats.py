@@ -13,17 +13,23 @@ Example usage:
 
 from __future__ import annotations
 
-import json
 import logging
 import statistics
 import time
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
-from threading import RLock
-from typing import Any
+from threading import RLock, local
+from typing import Any, Sequence
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Ring-buffer latencies are whole microseconds in uint32 (up to ~71 minutes)
+_MAX_LATENCY_US = int(np.iinfo(np.uint32).max)
+
 
 @dataclass
 class TierStatistics:
@@ -85,13 +91,13 @@ class SourceStatistics:
 class LatencyMetrics:
     """Calculate latency percentiles."""
 
-    def __init__(self, latencies: list[float]) -> None:
+    def __init__(self, latencies: Sequence[float] | np.ndarray) -> None:
         """Initialize with latency measurements."""
-        self.latencies = sorted(latencies)
+        self.latencies = np.asarray(latencies, dtype=np.float64)
 
     def calculate(self) -> dict[str, float]:
         """Calculate latency metrics."""
-        if not self.latencies:
+        if self.latencies.size == 0:
             return {
                 "p50": 0.0,
                 "p95": 0.0,
@@ -101,42 +107,175 @@ class LatencyMetrics:
                 "max": 0.0,
             }
 
+        # Linear interpolation between closest ranks, in a single partition
+        p50, p95, p99 = np.percentile(self.latencies, [50, 95, 99])
         return {
-            "p50": self._percentile(50),
-            "p95": self._percentile(95),
-            "p99": self._percentile(99),
-            "avg": statistics.mean(self.latencies),
-            "min": min(self.latencies),
-            "max": max(self.latencies),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "avg": float(self.latencies.mean()),
+            "min": float(self.latencies.min()),
+            "max": float(self.latencies.max()),
         }
 
-    def _percentile(self, p: float) -> float:
-        """Calculate percentile."""
-        if not self.latencies:
-            return 0.0
-
-        k = (len(self.latencies) - 1) * (p / 100)
-        f = int(k)
-        c = f + 1
 
-        if c >= len(self.latencies):
-            return self.latencies[-1]
-
-        d0 = self.latencies[f]
-        d1 = self.latencies[c]
-        return d0 + (d1 - d0) * (k - f)
+class _CounterShard:
+    """Per-thread hit/miss counters and latency ring buffer."""
+
+    __slots__ = ("counters", "latency_totals", "latencies", "latency_head")
+
+    def __init__(self, capacity: int, latency_window: int) -> None:
+        # Column 0 holds hits, column 1 misses
+        self.counters = np.zeros((capacity, 2), dtype=np.int64)
+        self.latency_totals = np.zeros(capacity, dtype=np.float64)
+        self.latencies = np.empty(latency_window, dtype=np.uint32)
+        self.latency_head = 0
+
+    def ensure_capacity(self, index: int) -> None:
+        """Grow the counter rows so that ``index`` is addressable."""
+        size = len(self.counters)
+        if index < size:
+            return
+        capacity = max(size * 2, index + 1)
+        counters = np.zeros((capacity, 2), dtype=np.int64)
+        counters[:size] = self.counters
+        latency_totals = np.zeros(capacity, dtype=np.float64)
+        latency_totals[:size] = self.latency_totals
+        self.counters = counters
+        self.latency_totals = latency_totals
+
+    def absorb(self, other: _CounterShard) -> None:
+        """Add another shard's counts and recent latencies into this one."""
+        rows = len(other.counters)
+        self.ensure_capacity(rows - 1)
+        self.counters[:rows] += other.counters
+        self.latency_totals[:rows] += other.latency_totals
+
+        held = min(other.latency_head, len(other.latencies))
+        if not held:
+            return
+        # Oldest first, so the newest samples survive if this ring overflows
+        window = len(self.latencies)
+        samples = np.roll(other.latencies, -other.latency_head)[-held:][-window:]
+        slots = (self.latency_head + np.arange(len(samples))) % window
+        self.latencies[slots] = samples
+        self.latency_head += len(samples)
+
+
+class _ShardOwner:
+    """Thread-local handle whose collection marks the thread's shard dead."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(
+    stats_ref: weakref.ref[CacheStatistics], shard: _CounterShard
+) -> None:
+    """Fold a finished thread's shard into its statistics object, if alive."""
+    stats = stats_ref()
+    if stats is not None:
+        stats._retire_shard(shard)
 
 
 class CacheStatistics:
-    """Comprehensive cache statistics tracking and monitoring."""
+    """Comprehensive cache statistics tracking and monitoring.
+
+    Hit/miss counts live in flat ``int64`` arrays with one row per interned
+    ``(source, tier)`` pair, so recording an event is a couple of array
+    increments rather than dataclass lookups and list growth. Each recording
+    thread writes to its own shard without taking the lock; readers merge the
+    shards under the lock. When a thread exits its shard is folded into a
+    shared retired shard, so the shard count tracks live threads. Latencies
+    go into a per-shard ring buffer holding the most recent ``latency_window``
+    samples from that thread (the retired shard keeps the most recent
+    ``latency_window`` samples of all exited threads), stored as ``uint32``
+    microseconds; per-tier averages use exact running totals.
+    """
+
+    LATENCY_WINDOW = 8192
+    _INITIAL_KEY_CAPACITY = 16
+
+    def __init__(self, latency_window: int = LATENCY_WINDOW) -> None:
+        """Initialize statistics tracker.
 
-    def __init__(self) -> None:
-        """Initialize statistics tracker."""
+        Args:
+            latency_window: Number of most recent hit latencies retained per
+                recording thread for percentile calculations
+        """
         self._lock = RLock()
-        self._tier_stats: dict[str, TierStatistics] = {}
-        self._source_stats: dict[str, SourceStatistics] = {}
-        self._all_latencies: list[float] = []
-        self._start_time = time.time()
+        self._latency_window = latency_window
+        self._start_time = time.monotonic()
+        self._init_counters()
+
+    def _init_counters(self) -> None:
+        """Drop all shards and key maps."""
+        capacity = self._INITIAL_KEY_CAPACITY
+        self._key_index: dict[tuple[str, str], int] = {}
+        self._source_index: dict[str, int] = {}
+        # Tier insertion order doubles as the storage-size registry
+        self._tier_sizes: dict[str, float] = {}
+        self._tier_index: dict[str, int] = {}
+        self._key_source = np.zeros(capacity, dtype=np.intp)
+        self._key_tier = np.zeros(capacity, dtype=np.intp)
+        # A fresh thread-local makes every thread allocate a new shard
+        self._tls = local()
+        # Slot 0 accumulates the shards of threads that have exited
+        self._shards: list[_CounterShard] = [
+            _CounterShard(capacity, self._latency_window)
+        ]
+
+    def _new_shard(self) -> _CounterShard:
+        """Allocate and register a counter shard for the calling thread."""
+        shard = _CounterShard(
+            max(len(self._key_index), self._INITIAL_KEY_CAPACITY),
+            self._latency_window,
+        )
+        with self._lock:
+            self._shards.append(shard)
+        # The owner is dropped with the thread's locals when the thread exits
+        owner = _ShardOwner()
+        weakref.finalize(owner, _retire_shard, weakref.ref(self), shard)
+        self._tls.owner = owner
+        self._tls.shard = shard
+        return shard
+
+    def _retire_shard(self, shard: _CounterShard) -> None:
+        """Fold an exited thread's shard into the retired shard."""
+        with self._lock:
+            # Shards dropped by reset() are no longer listed and stay discarded
+            if shard not in self._shards[1:]:
+                return
+            self._shards.remove(shard)
+            self._shards[0].absorb(shard)
+
+    def _register_tier(self, tier: str) -> int:
+        """Return the index for ``tier``, registering it on first use."""
+        index = self._tier_index.get(tier)
+        if index is None:
+            index = self._tier_index[tier] = len(self._tier_index)
+            self._tier_sizes[tier] = 0.0
+        return index
+
+    def _intern(self, source: str, tier: str) -> int:
+        """Return the counter row for ``(source, tier)``, allocating if new."""
+        with self._lock:
+            index = self._key_index.get((source, tier))
+            if index is not None:
+                return index
+
+            index = len(self._key_index)
+            if index == len(self._key_source):
+                self._key_source = np.resize(self._key_source, index * 2)
+                self._key_tier = np.resize(self._key_tier, index * 2)
+
+            source_index = self._source_index.get(source)
+            if source_index is None:
+                source_index = self._source_index[source] = len(self._source_index)
+            self._key_source[index] = source_index
+            self._key_tier[index] = self._register_tier(tier)
+            # Publish last so lock-free readers never see a half-built key
+            self._key_index[(source, tier)] = index
+            return index
 
     def record_hit(self, source: str, tier: str, latency_ms: float) -> None:
         """Record a cache hit.
@@ -146,19 +285,18 @@ class CacheStatistics:
             tier: Cache tier (e.g., "memory", "sqlite")
             latency_ms: Latency in milliseconds
         """
-        with self._lock:
-            # Update tier stats
-            if tier not in self._tier_stats:
-                self._tier_stats[tier] = TierStatistics(tier=tier)
-            self._tier_stats[tier].record_hit(latency_ms)
-
-            # Update source stats
-            if source not in self._source_stats:
-                self._source_stats[source] = SourceStatistics(source=source)
-            self._source_stats[source].hits += 1
-
-            # Track global latencies
-            self._all_latencies.append(latency_ms)
+        shard = getattr(self._tls, "shard", None) or self._new_shard()
+        index = self._key_index.get((source, tier))
+        if index is None:
+            index = self._intern(source, tier)
+        shard.ensure_capacity(index)
+        shard.counters[index, 0] += 1
+        shard.latency_totals[index] += latency_ms
+
+        # Track global latencies
+        micros = min(max(round(latency_ms * 1000), 0), _MAX_LATENCY_US)
+        shard.latencies[shard.latency_head % self._latency_window] = micros
+        shard.latency_head += 1
 
     def record_miss(self, source: str, tier: str) -> None:
         """Record a cache miss.
@@ -167,16 +305,12 @@ class CacheStatistics:
             source: Data source name
             tier: Cache tier
         """
-        with self._lock:
-            # Update tier stats
-            if tier not in self._tier_stats:
-                self._tier_stats[tier] = TierStatistics(tier=tier)
-            self._tier_stats[tier].record_miss()
-
-            # Update source stats
-            if source not in self._source_stats:
-                self._source_stats[source] = SourceStatistics(source=source)
-            self._source_stats[source].misses += 1
+        shard = getattr(self._tls, "shard", None) or self._new_shard()
+        index = self._key_index.get((source, tier))
+        if index is None:
+            index = self._intern(source, tier)
+        shard.ensure_capacity(index)
+        shard.counters[index, 1] += 1
 
     def update_storage_size(self, tier: str, size_mb: float) -> None:
         """Update storage size for a tier.
@@ -186,19 +320,39 @@ class CacheStatistics:
             size_mb: Storage size in megabytes
         """
         with self._lock:
-            if tier not in self._tier_stats:
-                self._tier_stats[tier] = TierStatistics(tier=tier)
-            self._tier_stats[tier].size_mb = size_mb
+            self._register_tier(tier)
+            self._tier_sizes[tier] = size_mb
+
+    def _merged_counters(self) -> tuple[np.ndarray, np.ndarray]:
+        """Sum hit/miss rows and latency totals across all shards."""
+        n_keys = len(self._key_index)
+        counters = np.zeros((n_keys, 2), dtype=np.int64)
+        latency_totals = np.zeros(n_keys, dtype=np.float64)
+        for shard in self._shards:
+            shard_counters = shard.counters[:n_keys]
+            rows = len(shard_counters)
+            counters[:rows] += shard_counters
+            latency_totals[:rows] += shard.latency_totals[:rows]
+        return counters, latency_totals
+
+    def _recent_latencies(self) -> np.ndarray:
+        """Return the latencies (ms) currently held in the shard ring buffers."""
+        windows = [
+            shard.latencies[: min(shard.latency_head, self._latency_window)]
+            for shard in self._shards
+        ]
+        micros = np.concatenate(windows) if windows else np.empty(0, np.uint32)
+        return micros / 1000.0
 
     def get_summary(self) -> dict[str, Any]:
         """Get overall cache statistics summary."""
         with self._lock:
-            total_hits = sum(t.hits for t in self._tier_stats.values())
-            total_misses = sum(t.misses for t in self._tier_stats.values())
+            counters, _ = self._merged_counters()
+            total_hits, total_misses = (int(n) for n in counters.sum(axis=0))
             total_requests = total_hits + total_misses
             hit_rate = total_hits / total_requests if total_requests > 0 else 0.0
 
-            uptime_seconds = time.time() - self._start_time
+            uptime_seconds = time.monotonic() - self._start_time
 
             return {
                 "total_hits": total_hits,
@@ -211,28 +365,67 @@ class CacheStatistics:
     def get_tier_stats(self) -> dict[str, dict[str, Any]]:
         """Get statistics by cache tier."""
         with self._lock:
-            return {tier: stats.get_stats() for tier, stats in self._tier_stats.items()}
+            n_keys = len(self._key_index)
+            n_tiers = len(self._tier_index)
+            tier_codes = self._key_tier[:n_keys]
+            counters, key_latency_totals = self._merged_counters()
+            hits = np.bincount(tier_codes, weights=counters[:, 0], minlength=n_tiers)
+            misses = np.bincount(tier_codes, weights=counters[:, 1], minlength=n_tiers)
+            latency_totals = np.bincount(
+                tier_codes, weights=key_latency_totals, minlength=n_tiers
+            )
+
+            stats = {}
+            for tier, index in self._tier_index.items():
+                tier_hits = int(hits[index])
+                tier_misses = int(misses[index])
+                total = tier_hits + tier_misses
+                stats[tier] = {
+                    "tier": tier,
+                    "hits": tier_hits,
+                    "misses": tier_misses,
+                    "hit_rate": tier_hits / total if total > 0 else 0.0,
+                    "avg_latency_ms": (
+                        float(latency_totals[index]) / tier_hits if tier_hits else 0.0
+                    ),
+                    "size_mb": self._tier_sizes[tier],
+                }
+            return stats
+
+    def _source_totals(self, counters: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Reduce merged per-key counters to hit and miss arrays per source."""
+        n_sources = len(self._source_index)
+        source_codes = self._key_source[: len(counters)]
+        hits = np.bincount(source_codes, weights=counters[:, 0], minlength=n_sources)
+        misses = np.bincount(source_codes, weights=counters[:, 1], minlength=n_sources)
+        return hits, misses
 
     def get_source_stats(self) -> dict[str, dict[str, Any]]:
         """Get statistics by data source."""
         with self._lock:
+            counters, _ = self._merged_counters()
+            hits, misses = self._source_totals(counters)
+
             return {
-                source: stats.get_stats()
-                for source, stats in self._source_stats.items()
+                source: SourceStatistics(
+                    source=source,
+                    hits=int(hits[index]),
+                    misses=int(misses[index]),
+                ).get_stats()
+                for source, index in self._source_index.items()
             }
 
     def get_latency_metrics(self) -> dict[str, float]:
         """Get latency percentiles and averages."""
         with self._lock:
-            metrics = LatencyMetrics(self._all_latencies)
+            metrics = LatencyMetrics(self._recent_latencies())
             return metrics.calculate()
 
     def get_storage_stats(self) -> dict[str, Any]:
         """Get storage utilization by tier."""
         with self._lock:
             tier_sizes = {
-                tier: {"size_mb": stats.size_mb}
-                for tier, stats in self._tier_stats.items()
+                tier: {"size_mb": size_mb} for tier, size_mb in self._tier_sizes.items()
             }
             total_size = sum(s["size_mb"] for s in tier_sizes.values())
 
@@ -255,16 +448,27 @@ class CacheStatistics:
         """
         alerts = []
 
+        # One merge of the shards serves both the overall and per-source sweep
+        with self._lock:
+            counters, _ = self._merged_counters()
+            source_hits, source_misses = self._source_totals(counters)
+            source_names = np.array(list(self._source_index), dtype=object)
+            latency = self.get_latency_metrics()
+
         # Check hit rate
-        summary = self.get_summary()
-        if summary["hit_rate"] < min_hit_rate:
+        total_hits, total_misses = counters.sum(axis=0)
+        total_requests = total_hits + total_misses
+        hit_rate = total_hits / total_requests if total_requests > 0 else 0.0
+        if hit_rate < min_hit_rate:
             alerts.append("low_hit_rate")
+            source_rates = source_hits / np.maximum(source_hits + source_misses, 1)
+            low_sources = source_names[source_rates < min_hit_rate]
             logger.warning(
-                f"Cache hit rate {summary['hit_rate']:.2%} below threshold {min_hit_rate:.2%}"
+                f"Cache hit rate {hit_rate:.2%} below threshold {min_hit_rate:.2%}"
+                + (f" (sources: {', '.join(low_sources)})" if low_sources.size else "")
             )
 
         # Check latency
-        latency = self.get_latency_metrics()
         if latency["p95"] > max_latency_ms:
             alerts.append("high_latency")
             logger.warning(
@@ -276,10 +480,8 @@ class CacheStatistics:
     def reset(self) -> None:
         """Reset all statistics."""
         with self._lock:
-            self._tier_stats.clear()
-            self._source_stats.clear()
-            self._all_latencies.clear()
-            self._start_time = time.time()
+            self._init_counters()
+            self._start_time = time.monotonic()
             logger.info("Cache statistics reset")
 
     def export_json(self, output_path: Path) -> None:
@@ -298,8 +500,9 @@ class CacheStatistics:
                 "storage": self.get_storage_stats(),
             }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        Path(output_path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
 
         logger.info(f"Cache statistics exported to {output_path}")
 
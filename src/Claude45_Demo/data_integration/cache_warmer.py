@@ -18,14 +18,51 @@ Example usage:
 from __future__ import annotations
 
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
+from itertools import islice
 from math import asin, cos, radians, sin, sqrt
 from typing import Any, Callable, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_MILES = 3956.0
+
+_shared_executor: ThreadPoolExecutor | None = None
+_shared_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide prefetch thread pool (singleton).
+
+    Schedulers and warmers borrow this pool instead of creating their own, so
+    it is never shut down by them; its threads are joined at interpreter exit.
+
+    Returns:
+        Shared ThreadPoolExecutor instance
+    """
+    global _shared_executor
+    if _shared_executor is None:
+        with _shared_executor_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="prefetch",
+                )
+    return _shared_executor
+
 
 @dataclass
 class WarmingProgress:
@@ -84,26 +121,45 @@ class PrefetchScheduler:
     """Manages parallel task execution with rate limiting."""
 
     def __init__(
-        self, max_requests_per_second: int = 50, max_parallel: int = 5
+        self,
+        max_requests_per_second: int = 50,
+        max_parallel: int = 5,
+        *,
+        executor: Optional[Executor] = None,
     ) -> None:
         """Initialize scheduler.
 
         Args:
             max_requests_per_second: Maximum API requests per second
             max_parallel: Maximum concurrent requests
+            executor: Thread pool to run tasks on (default: shared pool)
         """
         self.max_requests_per_second = max_requests_per_second
         self.max_parallel = max_parallel
-        self._min_interval = 1.0 / max_requests_per_second
-        self._last_request_time = 0.0
-
-    def _enforce_rate_limit(self) -> None:
-        """Sleep if necessary to respect rate limit."""
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_request_time = time.time()
+        self.executor = executor if executor is not None else get_shared_executor()
+        # Token bucket holding a single token: requests are spaced at the
+        # configured rate, and workers reserve their slot under the lock but
+        # sleep outside it, so dispatch never waits on the throttle.
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+    def _acquire_token(self) -> None:
+        """Reserve the next request slot, sleeping until it is due."""
+        with self._bucket_lock:
+            # Monotonic clock: intervals must not jump with NTP/wall-clock changes
+            now = time.monotonic()
+            refill = (now - self._last_refill) * self.max_requests_per_second
+            self._tokens = min(1.0, self._tokens + refill) - 1
+            self._last_refill = now
+            wait = -self._tokens / self.max_requests_per_second
+        if wait > 0:
+            time.sleep(wait)
+
+    def _run_throttled(self, task: Callable, args: tuple) -> Any:
+        """Run *task* once a rate-limit token is available."""
+        self._acquire_token()
+        return task(*args)
 
     def execute_batch(
         self,
@@ -123,23 +179,33 @@ class PrefetchScheduler:
             List of results (None for failed tasks if continue_on_error=True)
         """
         results: list[Any] = [None] * len(tasks)
-
-        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
-            future_to_index = {}
-            for i, (task, args) in enumerate(zip(tasks, args_list, strict=False)):
-                self._enforce_rate_limit()
-                future = executor.submit(task, *args)
-                future_to_index[future] = i
-
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
+        pending = enumerate(zip(tasks, args_list, strict=False))
+        in_flight: dict[Future, int] = {}
+
+        def submit(count: int) -> None:
+            for i, (task, args) in islice(pending, count):
+                future = self.executor.submit(self._run_throttled, task, args)
+                in_flight[future] = i
+
+        # Keep at most max_parallel tasks on the (possibly shared) pool
+        submit(self.max_parallel)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
                 try:
                     results[index] = future.result()
                 except Exception as e:
                     logger.warning(f"Task {index} failed: {e}")
                     if not continue_on_error:
+                        # Don't leave this batch's tasks running on the shared
+                        # pool after the call returns
+                        for other in in_flight:
+                            other.cancel()
+                        wait(in_flight)
                         raise
                     results[index] = None
+            submit(len(done))
 
         return results
 
@@ -154,6 +220,7 @@ class CacheWarmer:
         max_parallel_requests: int = 5,
         prefetch_nearby: bool = False,
         nearby_radius_miles: int = 50,
+        executor: Optional[Executor] = None,
     ) -> None:
         """Initialize cache warmer.
 
@@ -162,6 +229,7 @@ class CacheWarmer:
             max_parallel_requests: Maximum concurrent API requests
             prefetch_nearby: Enable geographic proximity prefetching
             nearby_radius_miles: Radius for nearby market prefetching
+            executor: Thread pool for fetches (default: shared pool)
         """
         self.cache = cache_manager
         if self.cache is None:
@@ -173,7 +241,9 @@ class CacheWarmer:
         self.prefetch_nearby = prefetch_nearby
         self.nearby_radius_miles = nearby_radius_miles
         self.scheduler = PrefetchScheduler(
-            max_requests_per_second=50, max_parallel=max_parallel_requests
+            max_requests_per_second=50,
+            max_parallel=max_parallel_requests,
+            executor=executor,
         )
 
     def warm_market(
@@ -197,17 +267,55 @@ class CacheWarmer:
         """
         progress = WarmingProgress(markets_processed=0, total_markets=1)
 
+        for source, connector in self._pending_fetches(
+            market, sources, connectors, progress, skip_cached=skip_cached
+        ):
+            error_msg = self._fetch_source(market, source, connector)
+            if error_msg is not None:
+                progress.errors.append(error_msg)
+
+        progress.markets_processed = 1
+        return progress
+
+    def _pending_fetches(
+        self,
+        market: str,
+        sources: list[str],
+        connectors: dict[str, Any],
+        progress: WarmingProgress,
+        *,
+        skip_cached: bool = True,
+        cached_keys: Optional[set[str]] = None,
+    ) -> list[tuple[str, Any]]:
+        """Count cache hits for a market and list the sources still to fetch.
+
+        Args:
+            market: Market identifier
+            sources: List of data sources to warm
+            connectors: Dict mapping source names to connector instances
+            progress: Progress record updated with requests, hits and errors
+            skip_cached: Skip sources already in cache
+            cached_keys: Keys already known to be cached; when omitted each
+                key is looked up with ``cache.get``
+
+        Returns:
+            List of (source, connector) pairs that need an API call
+        """
+        pending = []
         for source in sources:
             cache_key = f"{source}:{market}"
             progress.total_requests += 1
 
             # Check cache first
-            if skip_cached and self.cache.get(cache_key) is not None:
+            if cached_keys is not None:
+                is_cached = cache_key in cached_keys
+            else:
+                is_cached = self.cache.get(cache_key) is not None
+            if skip_cached and is_cached:
                 progress.cache_hits += 1
                 logger.debug(f"Cache hit for {cache_key}, skipping fetch")
                 continue
 
-            # Fetch from API
             connector = connectors.get(source)
             if connector is None:
                 error_msg = f"No connector found for source '{source}'"
@@ -215,17 +323,32 @@ class CacheWarmer:
                 progress.errors.append(error_msg)
                 continue
 
-            try:
-                _ = connector.fetch_market_data(market)
-                # Store in cache (assume connector handles this internally)
-                logger.info(f"Warmed cache for {cache_key}")
-            except Exception as e:
-                error_msg = f"Failed to fetch {source} for {market}: {e}"
-                logger.error(error_msg)
-                progress.errors.append(error_msg)
+            pending.append((source, connector))
 
-        progress.markets_processed = 1
-        return progress
+        return pending
+
+    def _cached_keys(self, keys: list[str]) -> set[str]:
+        """Return the subset of *keys* present in the cache.
+
+        Uses the cache's ``get_many`` batch lookup when it has one, so warming
+        N markets x M sources costs one query instead of N x M.
+        """
+        get_many = getattr(self.cache, "get_many", None)
+        if get_many is not None:
+            return set(get_many(keys))
+        return {key for key in keys if self.cache.get(key) is not None}
+
+    def _fetch_source(self, market: str, source: str, connector: Any) -> Optional[str]:
+        """Fetch one source for a market, returning an error message on failure."""
+        try:
+            _ = connector.fetch_market_data(market)
+            # Store in cache (assume connector handles this internally)
+            logger.info(f"Warmed cache for {source}:{market}")
+        except Exception as e:
+            error_msg = f"Failed to fetch {source} for {market}: {e}"
+            logger.error(error_msg)
+            return error_msg
+        return None
 
     def warm_markets(
         self,
@@ -237,6 +360,11 @@ class CacheWarmer:
     ) -> WarmingResult:
         """Warm cache for multiple markets.
 
+        Cached entries are found with a single batch lookup, and every uncached
+        (market, source) fetch is submitted to the scheduler as one batch, so a
+        market's sources are fetched concurrently rather than one after another
+        inside a per-market task.
+
         Args:
             markets: List of market identifiers
             sources: List of data sources to warm
@@ -246,30 +374,45 @@ class CacheWarmer:
         Returns:
             WarmingResult with aggregated results
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         total_progress = WarmingProgress(total_markets=len(markets))
 
-        def warm_task(market: str) -> WarmingProgress:
-            return self.warm_market(market, sources, connectors)
-
-        # Execute warming in parallel
-        tasks = [warm_task] * len(markets)
-        args_list = [(market,) for market in markets]
+        cached_keys = self._cached_keys(
+            [f"{source}:{market}" for market in markets for source in sources]
+        )
+        market_progress = [WarmingProgress(total_markets=1) for _ in markets]
+        fetch_markets: list[int] = []
+        args_list: list[tuple] = []
+        for index, market in enumerate(markets):
+            for source, connector in self._pending_fetches(
+                market,
+                sources,
+                connectors,
+                market_progress[index],
+                cached_keys=cached_keys,
+            ):
+                fetch_markets.append(index)
+                args_list.append((market, source, connector))
+
+        # Execute all fetches in parallel
+        tasks = [self._fetch_source] * len(args_list)
         results = self.scheduler.execute_batch(tasks, args_list, continue_on_error=True)
+        for index, error_msg in zip(fetch_markets, results, strict=True):
+            if error_msg is not None:
+                market_progress[index].errors.append(error_msg)
 
         # Aggregate results
-        for result in results:
-            if result is not None:
-                total_progress.markets_processed += result.markets_processed
-                total_progress.total_requests += result.total_requests
-                total_progress.cache_hits += result.cache_hits
-                total_progress.errors.extend(result.errors)
+        for result in market_progress:
+            total_progress.markets_processed += 1
+            total_progress.total_requests += result.total_requests
+            total_progress.cache_hits += result.cache_hits
+            total_progress.errors.extend(result.errors)
 
-                # Call progress callback after each market
-                if progress_callback:
-                    progress_callback(total_progress)
+            # Call progress callback after each market
+            if progress_callback:
+                progress_callback(total_progress)
 
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         return WarmingResult(
             markets_processed=total_progress.markets_processed,
@@ -324,18 +467,25 @@ class CacheWarmer:
         Returns:
             List of nearby market identifiers
         """
-        # This is a placeholder - would need geocoding in production
-        primary_coords = self._geocode(primary_market)
-        nearby = []
+        if not candidate_markets:
+            return []
 
-        for candidate in candidate_markets:
-            candidate_coords = self._geocode(candidate)
-            distance = self._haversine_distance(primary_coords, candidate_coords)
+        # This is a placeholder - would need geocoding in production
+        primary_lat, primary_lon = np.radians(self._geocode(primary_market))
+        candidate_coords = np.radians(
+            np.array([self._geocode(c) for c in candidate_markets], dtype=np.float64)
+        )
+        lat, lon = candidate_coords[:, 0], candidate_coords[:, 1]
 
-            if distance <= self.nearby_radius_miles:
-                nearby.append(candidate)
+        # Haversine formula, broadcast over all candidates at once
+        a = (
+            np.sin((lat - primary_lat) / 2) ** 2
+            + np.cos(primary_lat) * np.cos(lat) * np.sin((lon - primary_lon) / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
 
-        return nearby
+        within = np.flatnonzero(distances <= self.nearby_radius_miles)
+        return [candidate_markets[i] for i in within]
 
     def _geocode(self, location: str) -> tuple[float, float]:
         """Geocode a location string to (lat, lon).
@@ -376,9 +526,13 @@ class CacheWarmer:
         a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
         c = 2 * asin(sqrt(a))
 
-        # Earth radius in miles
-        radius_miles = 3956.0
-        return radius_miles * c
+        return EARTH_RADIUS_MILES * c
 
 
-__all__ = ["CacheWarmer", "PrefetchScheduler", "WarmingProgress", "WarmingResult"]
+__all__ = [
+    "CacheWarmer",
+    "PrefetchScheduler",
+    "WarmingProgress",
+    "WarmingResult",
+    "get_shared_executor",
+]
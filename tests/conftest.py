@@ -3,9 +3,59 @@ Root conftest for all tests.
 Ensures proper Python path setup.
 """
 import sys
+from numbers import Real
 from pathlib import Path
+from typing import Callable, TypeVar
+
+import pytest
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+T = TypeVar("T")
+
+
+class Between:
+    """Equality matcher for values within ``[lo, hi]`` (or ``[lo, hi)``).
+
+    ``assert x == Between(0.05, 0.10)`` is a single comparison, and pytest shows
+    the expected range when it fails.
+    """
+
+    def __init__(self, lo: float, hi: float, *, upper_inclusive: bool = True) -> None:
+        self.lo = lo
+        self.hi = hi
+        self.upper_inclusive = upper_inclusive
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Real):
+            return NotImplemented
+        if self.upper_inclusive:
+            return self.lo <= other <= self.hi
+        return self.lo <= other < self.hi
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        closing = "]" if self.upper_inclusive else ")"
+        return f"[{self.lo}, {self.hi}{closing}"
+
+
+@pytest.fixture(scope="session")
+def between() -> type[Between]:
+    """Provide the Between range matcher to tests."""
+    return Between
+
+
+@pytest.fixture
+def no_retry(monkeypatch: pytest.MonkeyPatch) -> Callable[[T], T]:
+    """Return a helper that makes a connector call straight through, no backoff."""
+
+    def disable(connector: T) -> T:
+        monkeypatch.setattr(connector, "_retry_with_backoff", lambda func, **_: func())
+        return connector
+
+    return disable
+
@@ -7,14 +7,19 @@ Tests scenarios from: openspec/changes/add-aker-investment-platform/specs/testin
 """
 
 import logging
+import traceback
 from pathlib import Path
 
 import pytest
+import requests
+import yaml
 
 from Claude45_Demo.data_integration.bea import BEAConnector
 from Claude45_Demo.data_integration.bls import BLSConnector
 from Claude45_Demo.data_integration.cache import CacheManager
 from Claude45_Demo.data_integration.census import CensusConnector
+from Claude45_Demo.data_integration.config import ConfigManager
+from Claude45_Demo.data_integration.exceptions import ConfigurationError
 
 
 @pytest.fixture
@@ -138,8 +143,6 @@ class TestErrorMessageMasking:
         self, cache_manager: CacheManager
     ) -> None:
         """Credential validation errors must mask the invalid credential."""
-        from Claude45_Demo.data_integration.exceptions import ConfigurationError
-
         invalid_key = "this_is_an_invalid_key_format"
 
         try:
@@ -159,7 +162,6 @@ class TestErrorMessageMasking:
         api_key = "sensitive_auth_token"
 
         def mock_get(*args, **kwargs):
-            import requests
             class MockResponse:
                 status_code = 403
                 text = f"Forbidden: Invalid token {kwargs.get('headers', {}).get('Authorization', '')}"
@@ -214,7 +216,6 @@ class TestStackTraceMasking:
             assert api_key not in str(e)
 
             # In production, would also check formatted traceback
-            import traceback
             tb = traceback.format_exc()
 
             # Stack trace might contain the key (Python limitation)
@@ -263,9 +264,6 @@ class TestConfigFileMasking:
 
     def test_config_display_masks_secrets(self, tmp_path: Path) -> None:
         """Configuration display must mask secret values."""
-        from Claude45_Demo.data_integration.config import ConfigManager
-        import yaml
-
         # Create config with secrets
         config_data = {
             "data_sources": {
@@ -13,7 +13,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from Claude45_Demo.data_integration.cache import CacheManager
+from Claude45_Demo.data_integration.config import ConfigManager
 from Claude45_Demo.data_integration.exceptions import ValidationError
+from Claude45_Demo.risk_assessment.wildfire import WildfireRiskAnalyzer
+
+_MOCK_WHP = {"mean_whp": 3, "max_whp": 4}
+
+
+@pytest.fixture(scope="module")
+def wildfire_analyzer() -> WildfireRiskAnalyzer:
+    """Provide a shared wildfire analyzer for bounds validation tests."""
+    return WildfireRiskAnalyzer()
 
 
 @pytest.fixture
@@ -143,8 +153,6 @@ class TestPathTraversalPrevention:
 
     def test_config_file_path_prevents_traversal(self, tmp_path: Path) -> None:
         """Configuration file paths must prevent directory traversal."""
-        from Claude45_Demo.data_integration.config import ConfigManager
-
         # Create a legitimate config file
         config_file = tmp_path / "config.yaml"
         config_file.write_text("data_sources: {}\n")
@@ -210,9 +218,6 @@ class TestCommandInjectionPrevention:
         # This test documents the expectation that if subprocess is used,
         # it should use subprocess.run with shell=False and list arguments
 
-        import subprocess
-        from unittest.mock import patch
-
         # If any module uses subprocess, verify it's done safely
         with patch('subprocess.run') as mock_run:
             # This is a placeholder test
@@ -276,73 +281,61 @@ class TestInputValidation:
     AND: invalid inputs are rejected
     """
 
-    def test_latitude_bounds_validation(self) -> None:
+    @pytest.mark.parametrize("lat", [0, 45.5, -45.5, 90, -90])
+    def test_latitude_bounds_validation(
+        self, wildfire_analyzer: WildfireRiskAnalyzer, lat: float
+    ) -> None:
         """Latitude must be validated to be within -90 to 90."""
-        from Claude45_Demo.risk_assessment.wildfire import WildfireRiskAnalyzer
-
-        analyzer = WildfireRiskAnalyzer()
-
-        # Valid latitudes should work
-        valid_lats = [0, 45.5, -45.5, 90, -90]
-        for lat in valid_lats:
-            # Should not raise error (with mock data)
-            try:
-                result = analyzer.assess_wildfire_hazard_potential(
-                    lat, -105.0, mock_whp={"mean_whp": 3, "max_whp": 4}
-                )
-                assert result is not None
-            except ValueError as e:
-                # May raise ValueError for out-of-bounds, which is good
-                if "latitude" in str(e).lower():
-                    pass
-                else:
-                    raise
-
-    def test_longitude_bounds_validation(self) -> None:
+        # Valid latitudes should work (with mock data)
+        try:
+            result = wildfire_analyzer.assess_wildfire_hazard_potential(
+                lat, -105.0, mock_whp=_MOCK_WHP
+            )
+            assert result is not None
+        except ValueError as e:
+            # May raise ValueError for out-of-bounds, which is good
+            if "latitude" not in str(e).lower():
+                raise
+
+    @pytest.mark.parametrize("lon", [0, 105.5, -105.5, 180, -180])
+    def test_longitude_bounds_validation(
+        self, wildfire_analyzer: WildfireRiskAnalyzer, lon: float
+    ) -> None:
         """Longitude must be validated to be within -180 to 180."""
-        from Claude45_Demo.risk_assessment.wildfire import WildfireRiskAnalyzer
-
-        analyzer = WildfireRiskAnalyzer()
-
-        # Valid longitudes should work
-        valid_lons = [0, 105.5, -105.5, 180, -180]
-        for lon in valid_lons:
-            # Should not raise error (with mock data)
-            try:
-                result = analyzer.assess_wildfire_hazard_potential(
-                    40.0, lon, mock_whp={"mean_whp": 3, "max_whp": 4}
-                )
-                assert result is not None
-            except ValueError:
-                # May validate bounds, which is good
-                pass
-
-    def test_fips_code_format_validation(self) -> None:
-        """FIPS codes must be validated for correct format."""
-        valid_fips = ["08031", "49035", "16001"]  # Denver, Salt Lake, Ada
-        invalid_fips = ["ABC", "123", "0803", "080311", ""]
-
-        # Valid FIPS should be 5 digits
-        for fips in valid_fips:
-            assert len(fips) == 5
-            assert fips.isdigit()
-
-        # Invalid FIPS should be rejected (test expectation)
-        for fips in invalid_fips:
-            assert len(fips) != 5 or not fips.isdigit()
-
-    def test_year_range_validation(self) -> None:
-        """Year inputs must be validated to be reasonable."""
-        valid_years = [2020, 2021, 2022, 2023]
-        invalid_years = [1800, 3000, -1, 0]
-
-        # Valid years should be in reasonable range (2000-2030)
-        for year in valid_years:
-            assert 2000 <= year <= 2030
-
-        # Invalid years should be rejected
-        for year in invalid_years:
-            assert year < 2000 or year > 2030
+        # Valid longitudes should work (with mock data)
+        try:
+            result = wildfire_analyzer.assess_wildfire_hazard_potential(
+                40.0, lon, mock_whp=_MOCK_WHP
+            )
+            assert result is not None
+        except ValueError:
+            # May validate bounds, which is good
+            pass
+
+    @pytest.mark.parametrize("fips", ["08031", "49035", "16001"])  # Denver, SLC, Ada
+    def test_fips_code_format_validation(self, fips: str) -> None:
+        """Valid FIPS codes must be 5 digits."""
+        assert len(fips) == 5
+        assert fips.isdigit()
+
+    @pytest.mark.parametrize(
+        "fips",
+        ["ABC", "123", "0803", "080311", ""],
+        ids=["letters", "three_digits", "four_digits", "six_digits", "empty"],
+    )
+    def test_invalid_fips_code_rejected(self, fips: str) -> None:
+        """Invalid FIPS codes should be rejected (test expectation)."""
+        assert len(fips) != 5 or not fips.isdigit()
+
+    @pytest.mark.parametrize("year", [2020, 2021, 2022, 2023])
+    def test_year_range_validation(self, year: int) -> None:
+        """Valid years should be in a reasonable range (2000-2030)."""
+        assert 2000 <= year <= 2030
+
+    @pytest.mark.parametrize("year", [1800, 3000, -1, 0])
+    def test_invalid_year_rejected(self, year: int) -> None:
+        """Years outside the reasonable range should be rejected."""
+        assert year < 2000 or year > 2030
 
 
 class TestDataSanitization:
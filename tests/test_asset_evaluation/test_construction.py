@@ -3,136 +3,197 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import partial
+from types import SimpleNamespace
 
 import pytest
 
 from Claude45_Demo.asset_evaluation.construction import ConstructionAdjuster
 
+approx = partial(pytest.approx, rel=1e-9, abs=1e-6)
 
-@pytest.fixture
-def adjuster():
-    """Create construction adjuster."""
-    return ConstructionAdjuster()
-
+_DATES = SimpleNamespace(
+    apr_1_24=date(2024, 4, 1),
+    oct_1_24=date(2024, 10, 1),
+    oct_31_24=date(2024, 10, 31),
+    nov_1_24=date(2024, 11, 1),
+    nov_15_24=date(2024, 11, 15),
+    dec_1_24=date(2024, 12, 1),
+    jan_31_25=date(2025, 1, 31),
+    feb_15_25=date(2025, 2, 15),
+    feb_28_25=date(2025, 2, 28),
+    mar_31_25=date(2025, 3, 31),
+    apr_30_25=date(2025, 4, 30),
+)
 
-def test_winter_premium_no_winter_months(adjuster):
-    """Test no premium when construction avoids winter."""
-    result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 4, 1),  # April start
-        end_date=date(2024, 10, 31),  # October end
-        base_cost=5_000_000,
-        location_type="mountain",
-    )
+_ELEVATED_RISK_LEVELS = frozenset({"medium", "high"})
 
-    assert result.winter_months == 0
-    assert result.premium_percentage == 0.0
-    assert result.premium_amount == 0.0
-    assert result.adjusted_cost == 5_000_000
-    assert "no winter" in result.notes.lower()
 
+@pytest.fixture(scope="session")
+def adjuster():
+    """Create construction adjuster."""
+    return ConstructionAdjuster()
 
-def test_winter_premium_mountain_location(adjuster):
-    """Test winter premium for mountain location."""
-    result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 11, 1),  # Nov start
-        end_date=date(2025, 3, 31),  # Mar end
-        base_cost=5_000_000,
-        location_type="mountain",
-    )
 
-    # 5 winter months: Nov, Dec, Jan, Feb, Mar
-    assert result.winter_months == 5
+WINTER_CASES = [
+    # start, end, base_cost, location, winter_months, premium_pct, adjusted, note keywords
+    pytest.param(
+        _DATES.apr_1_24,
+        _DATES.oct_31_24,
+        5_000_000,
+        "mountain",
+        0,
+        0.0,
+        5_000_000,
+        ("no winter",),
+        id="no_winter_months",
+    ),
     # Mountain: 10% base + 5 months * 2% = 20% (capped)
-    assert result.premium_percentage == 0.20
-    assert result.premium_amount == 1_000_000  # 20% of 5M
-    assert result.adjusted_cost == 6_000_000
-    assert "mountain" in result.notes.lower()
-    assert "severe" in result.notes.lower()
-
-
-def test_winter_premium_urban_location(adjuster):
-    """Test lower winter premium for urban location."""
-    result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 12, 1),
-        end_date=date(2025, 2, 28),
-        base_cost=3_000_000,
-        location_type="urban",
-    )
-
-    # 3 winter months: Dec, Jan, Feb
-    assert result.winter_months == 3
-    # Urban: 5% base + 3 months * 1% = 8%
-    assert result.premium_percentage == 0.08
-    assert result.premium_amount == 240_000
-    assert result.adjusted_cost == 3_240_000
-    assert "urban" in result.notes.lower()
-
-
-def test_winter_premium_partial_winter(adjuster):
-    """Test premium for partial winter exposure."""
+    pytest.param(
+        _DATES.nov_1_24,
+        _DATES.mar_31_25,
+        5_000_000,
+        "mountain",
+        5,
+        0.20,
+        6_000_000,
+        ("mountain", "severe"),
+        id="mountain_location",
+    ),
+    # Urban: 5% base + 3 months (Dec-Feb) * 1% = 8%
+    pytest.param(
+        _DATES.dec_1_24,
+        _DATES.feb_28_25,
+        3_000_000,
+        "urban",
+        3,
+        0.08,
+        3_240_000,
+        ("urban",),
+        id="urban_location",
+    ),
+    # Suburban: 8% base + 3 months (Nov-Jan; Oct is not winter) * 1.5% = 12.5%
+    pytest.param(
+        _DATES.oct_1_24,
+        _DATES.jan_31_25,
+        4_000_000,
+        "suburban",
+        3,
+        0.125,
+        4_500_000,
+        ("suburban",),
+        id="partial_winter",
+    ),
+    # Crossing the year boundary counts Nov, Dec, Jan, Feb
+    pytest.param(
+        _DATES.nov_15_24,
+        _DATES.feb_15_25,
+        2_000_000,
+        "mountain",
+        4,
+        0.18,
+        2_360_000,
+        ("mountain",),
+        id="year_boundary",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "start,end,base_cost,location,winter_months,premium_pct,adjusted,keywords",
+    WINTER_CASES,
+)
+def test_winter_premium(
+    adjuster,
+    start,
+    end,
+    base_cost,
+    location,
+    winter_months,
+    premium_pct,
+    adjusted,
+    keywords,
+):
+    """Test winter premium across locations and schedules."""
     result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 10, 1),  # Oct start
-        end_date=date(2025, 1, 31),  # Jan end
-        base_cost=4_000_000,
-        location_type="suburban",
-    )
-
-    # 4 winter months: Nov, Dec, Jan (Oct is not winter)
-    assert result.winter_months == 3
-    # Suburban: 8% base + 3 months * 1.5% = 12.5%
-    assert result.premium_percentage == 0.125
-    assert result.premium_amount == 500_000
-    assert result.adjusted_cost == 4_500_000
-
-
-def test_logistics_premium_urban_proximity(adjuster):
-    """Test minimal premium for urban-proximate site."""
-    result = adjuster.calculate_logistics_premium(
-        base_cost=5_000_000,
-        distance_to_metro_miles=15,
-        elevation_ft=5200,
-        accessibility="paved",
-        nearest_supplier_miles=10,
-    )
-
-    assert result.accessibility_rating == "urban"
-    assert result.premium_percentage <= 0.03  # Minimal premium
-    assert result.adjusted_cost < 5_200_000
-    assert any("urban" in f.lower() for f in result.factors)
-
-
-def test_logistics_premium_remote_mountain(adjuster):
-    """Test high premium for remote mountain site."""
-    result = adjuster.calculate_logistics_premium(
-        base_cost=5_000_000,
-        distance_to_metro_miles=120,  # Remote
-        elevation_ft=8500,  # High elevation
-        accessibility="4wd_only",  # Difficult access
-        nearest_supplier_miles=60,  # Distant suppliers
+        start_date=start,
+        end_date=end,
+        base_cost=base_cost,
+        location_type=location,
     )
 
-    assert result.accessibility_rating == "remote"
-    assert result.premium_percentage >= 0.12  # Significant premium
-    assert result.adjusted_cost > 5_600_000
-    assert len(result.factors) >= 4  # Multiple factors contributing
-    assert any("remote" in f.lower() for f in result.factors)
-    assert any("4wd" in f.lower() for f in result.factors)
-
-
-def test_logistics_premium_mountain_access(adjuster):
-    """Test moderate premium for mountain access site."""
-    result = adjuster.calculate_logistics_premium(
-        base_cost=4_000_000,
-        distance_to_metro_miles=65,
-        elevation_ft=7200,
-        accessibility="paved",
-        nearest_supplier_miles=35,
+    assert result.winter_months == winter_months
+    assert result.premium_percentage == approx(premium_pct)
+    assert result.premium_amount == approx(adjusted - base_cost, abs=0.5)
+    assert result.adjusted_cost == approx(adjusted, abs=0.5)
+    for keyword in keywords:
+        assert keyword in result.notes.casefold()
+
+
+LOGISTICS_CASES = [
+    # site inputs, accessibility rating, premium band, min factors, factor keywords
+    pytest.param(
+        dict(
+            base_cost=5_000_000,
+            distance_to_metro_miles=15,
+            elevation_ft=5200,
+            accessibility="paved",
+            nearest_supplier_miles=10,
+        ),
+        "urban",
+        (0.0, 0.03),
+        1,
+        ("urban",),
+        id="urban_proximity",
+    ),
+    pytest.param(
+        dict(
+            base_cost=5_000_000,
+            distance_to_metro_miles=120,  # Remote
+            elevation_ft=8500,  # High elevation
+            accessibility="4wd_only",  # Difficult access
+            nearest_supplier_miles=60,  # Distant suppliers
+        ),
+        "remote",
+        (0.12, 0.15),
+        4,
+        ("remote", "4wd"),
+        id="remote_mountain",
+    ),
+    pytest.param(
+        dict(
+            base_cost=4_000_000,
+            distance_to_metro_miles=65,
+            elevation_ft=7200,
+            accessibility="paved",
+            nearest_supplier_miles=35,
+        ),
+        "mountain_access",
+        (0.05, 0.10),
+        1,
+        ("mountain",),
+        id="mountain_access",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "site,rating,premium_band,min_factors,keywords", LOGISTICS_CASES
+)
+def test_logistics_premium(
+    adjuster, between, site, rating, premium_band, min_factors, keywords
+):
+    """Test logistics premium by site accessibility."""
+    result = adjuster.calculate_logistics_premium(**site)
+
+    assert result.accessibility_rating == rating
+    assert result.premium_percentage == between(*premium_band)
+    assert result.adjusted_cost == approx(
+        site["base_cost"] * (1 + result.premium_percentage), abs=0.5
     )
-
-    assert result.accessibility_rating == "mountain_access"
-    assert 0.05 <= result.premium_percentage <= 0.10
-    assert result.adjusted_cost > 4_200_000
-    assert "mountain" in " ".join(result.factors).lower()
+    assert len(result.factors) >= min_factors
+    for keyword in keywords:
+        assert keyword in result.factors_lower_joined
 
 
 def test_logistics_premium_elevation_impact(adjuster):
@@ -155,49 +216,66 @@ def test_logistics_premium_elevation_impact(adjuster):
 
     # High elevation should have higher premium
     assert high_result.premium_percentage > low_result.premium_percentage
-    assert any("elevation" in f.lower() for f in high_result.factors)
-
-
-def test_labor_market_tight_market(adjuster):
-    """Test high-risk assessment for tight labor market."""
-    result = adjuster.assess_labor_market(
-        unemployment_rate=0.02,  # 2.0% - very tight
-        construction_employment_change=0.08,  # 8% growth
-        state="ID",
-    )
-
-    assert result.risk_level == "high"
-    assert result.risk_score >= 60
-    assert result.wage_premium_pct >= 0.20  # 20%+ wage premium
-    assert "high risk" in result.recommendation.lower()
-
-
-def test_labor_market_adequate_supply(adjuster):
-    """Test low-risk assessment for adequate labor supply."""
+    assert "elevation" in high_result.factors_lower_joined
+
+
+LABOR_CASES = [
+    # unemployment, employment change, state, risk level, score band, wage band
+    pytest.param(
+        0.02,
+        0.08,
+        "ID",
+        "high",
+        range(60, 101),
+        (0.20, 0.25),
+        id="tight_market",  # 2.0% unemployment, 8% growth
+    ),
+    pytest.param(
+        0.045,
+        -0.01,
+        "CO",
+        "low",
+        range(0, 35),
+        (0.0, 0.09),
+        id="adequate_supply",  # 4.5% unemployment, -1% declining
+    ),
+    pytest.param(
+        0.028,
+        0.04,
+        "UT",
+        "medium",
+        range(35, 60),
+        (0.08, 0.20),
+        id="moderate_risk",  # 2.8% unemployment, 4% growth
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "unemployment,employment_change,state,risk_level,score_band,wage_band",
+    LABOR_CASES,
+)
+def test_labor_market_risk_level(
+    adjuster,
+    between,
+    unemployment,
+    employment_change,
+    state,
+    risk_level,
+    score_band,
+    wage_band,
+):
+    """Test labor market risk classification and wage premium bands."""
     result = adjuster.assess_labor_market(
-        unemployment_rate=0.045,  # 4.5% - adequate
-        construction_employment_change=-0.01,  # -1% declining
-        state="CO",
+        unemployment_rate=unemployment,
+        construction_employment_change=employment_change,
+        state=state,
     )
 
-    assert result.risk_level == "low"
-    assert result.risk_score < 35
-    assert result.wage_premium_pct < 0.10
-    assert "low risk" in result.recommendation.lower()
-
-
-def test_labor_market_moderate_risk(adjuster):
-    """Test medium-risk assessment."""
-    result = adjuster.assess_labor_market(
-        unemployment_rate=0.028,  # 2.8% - tight
-        construction_employment_change=0.04,  # 4% growth
-        state="UT",
-    )
-
-    assert result.risk_level == "medium"
-    assert 35 <= result.risk_score < 60
-    assert 0.08 <= result.wage_premium_pct <= 0.20
-    assert "medium risk" in result.recommendation.lower()
+    assert result.risk_level == risk_level
+    assert result.risk_score in score_band
+    assert result.wage_premium_pct == between(*wage_band)
+    assert f"{risk_level} risk" in result.recommendation.lower()
 
 
 def test_labor_market_state_specific_adjustments(adjuster):
@@ -242,21 +320,6 @@ def test_labor_market_employment_trend_impact(adjuster):
     assert growth_result.wage_premium_pct > decline_result.wage_premium_pct
 
 
-def test_winter_premium_year_boundary(adjuster):
-    """Test winter premium calculation crossing year boundary."""
-    result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 11, 15),
-        end_date=date(2025, 2, 15),
-        base_cost=2_000_000,
-        location_type="mountain",
-    )
-
-    # Should count Nov, Dec, Jan, Feb
-    assert result.winter_months == 4
-    assert result.premium_percentage > 0
-    assert result.adjusted_cost > 2_000_000
-
-
 def test_logistics_premium_capped_at_15_percent(adjuster):
     """Test that logistics premium is capped at 15%."""
     result = adjuster.calculate_logistics_premium(
@@ -272,7 +335,7 @@ def test_logistics_premium_capped_at_15_percent(adjuster):
     assert result.adjusted_cost <= 11_500_000
 
 
-def test_labor_market_risk_score_bounds(adjuster):
+def test_labor_market_risk_score_bounds(adjuster, between):
     """Test that risk score stays within 0-100 bounds."""
     # Extremely tight market
     result = adjuster.assess_labor_market(
@@ -281,16 +344,16 @@ def test_labor_market_risk_score_bounds(adjuster):
         state="ID",
     )
 
-    assert 0 <= result.risk_score <= 100
-    assert 0.0 <= result.wage_premium_pct <= 0.25
+    assert result.risk_score == between(0, 100)
+    assert result.wage_premium_pct == between(0.0, 0.25)
 
 
 def test_construction_adjustments_integration(adjuster):
     """Test combined construction adjustments."""
     # Mountain site, winter construction, tight labor
     winter_result = adjuster.adjust_winter_premium(
-        start_date=date(2024, 11, 1),
-        end_date=date(2025, 4, 30),
+        start_date=_DATES.nov_1_24,
+        end_date=_DATES.apr_30_25,
         base_cost=5_000_000,
         location_type="mountain",
     )
@@ -312,4 +375,4 @@ def test_construction_adjustments_integration(adjuster):
     assert winter_result.adjusted_cost > 5_000_000
     assert logistics_result.adjusted_cost > winter_result.adjusted_cost
     assert labor_result.wage_premium_pct > 0
-    assert labor_result.risk_level in {"medium", "high"}
+    assert labor_result.risk_level in _ELEVATED_RISK_LEVELS
@@ -2,10 +2,11 @@
 
 from Claude45_Demo.asset_evaluation.deal_archetype import DealArchetypeClassifier
 
+_CLASSIFIER = DealArchetypeClassifier()
+
 
 def test_classify_value_add_light() -> None:
-    classifier = DealArchetypeClassifier()
-    result = classifier.classify(
+    result = _CLASSIFIER.classify(
         {
             "year_built": 2005,
             "occupancy": 0.92,
@@ -21,8 +22,7 @@ def test_classify_value_add_light() -> None:
 
 
 def test_classify_ground_up_identifies_spread() -> None:
-    classifier = DealArchetypeClassifier()
-    result = classifier.classify(
+    result = _CLASSIFIER.classify(
         {
             "is_vacant_land": True,
             "yield_on_cost": 6.3,
@@ -36,8 +36,7 @@ def test_classify_ground_up_identifies_spread() -> None:
 
 
 def test_classify_heavy_lift_records_risks() -> None:
-    classifier = DealArchetypeClassifier()
-    result = classifier.classify(
+    result = _CLASSIFIER.classify(
         {
             "year_built": 1970,
             "occupancy": 0.55,
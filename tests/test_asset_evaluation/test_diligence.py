@@ -2,10 +2,11 @@
 
 from Claude45_Demo.asset_evaluation.diligence import DiligenceChecklistBuilder
 
+_BUILDER = DiligenceChecklistBuilder()
+
 
 def test_value_add_checklist_includes_aker_items() -> None:
-    builder = DiligenceChecklistBuilder()
-    checklist = builder.build(
+    checklist = _BUILDER.build(
         archetype="value_add_light",
         product_type="garden",
         risk_flags={"wildfire": False, "flood": False},
@@ -17,8 +18,7 @@ def test_value_add_checklist_includes_aker_items() -> None:
 
 
 def test_high_risk_adds_mitigation_section() -> None:
-    builder = DiligenceChecklistBuilder()
-    checklist = builder.build(
+    checklist = _BUILDER.build(
         archetype="heavy_lift_reposition",
         product_type="mid-rise",
         risk_flags={"wildfire": True, "flood": True},
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 import pytest
 
 from Claude45_Demo.asset_evaluation.exit_strategy import ExitAnalyzer
 
+approx = partial(pytest.approx, rel=1e-9, abs=1e-6)
+
+_SCENARIO_NAMES = frozenset({"base", "bull", "bear"})
+
+# Shared $10M / $3M equity / 5% cap baseline for appreciation projections
+_APPRECIATION_BASELINE = dict(
+    entry_noi=500_000,
+    entry_value=10_000_000,
+    initial_equity=3_000_000,
+    hold_period_years=5,
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def analyzer():
     """Create exit analyzer."""
     return ExitAnalyzer()
@@ -26,8 +40,10 @@ def test_exit_model_multiple_hold_periods(analyzer):
     )
 
     assert len(result.scenarios) == 3
-    assert all(s.stabilized_noi == 650_000 for s in result.scenarios)
-    assert all(s.exit_cap_rate == 0.0525 for s in result.scenarios)  # 5% + 25bps
+    assert all(s.stabilized_noi == approx(650_000, abs=0.5) for s in result.scenarios)
+    assert all(
+        s.exit_cap_rate == approx(0.0525) for s in result.scenarios
+    )  # 5% + 25bps
 
     # Verify each scenario has required fields
     for scenario in result.scenarios:
@@ -73,7 +89,7 @@ def test_exit_model_cap_rate_impact(analyzer):
     assert compression_result.scenarios[0].irr > expansion_result.scenarios[0].irr
 
 
-def test_exit_model_value_add_scenario(analyzer):
+def test_exit_model_value_add_scenario(analyzer, between):
     """Test typical value-add exit scenario."""
     result = analyzer.model_exit_scenarios(
         entry_noi=400_000,
@@ -86,20 +102,17 @@ def test_exit_model_value_add_scenario(analyzer):
     )
 
     # 5-year scenario
-    five_year = next(s for s in result.scenarios if s.hold_period_years == 5)
-    assert five_year.exit_value == 10_000_000  # 550k / 5.5%
-    assert five_year.equity_multiple == 4.0  # 10M / 2.5M
+    five_year = result.scenarios_by_hold_period[5]
+    assert five_year.exit_value == approx(10_000_000, abs=0.5)  # 550k / 5.5%
+    assert five_year.equity_multiple == approx(4.0)  # 10M / 2.5M
     # IRR should be around 32% for 4x in 5 years
-    assert 0.28 <= five_year.irr <= 0.35
+    assert five_year.irr == between(0.28, 0.35)
 
 
 def test_appreciation_scenarios_distribution(analyzer):
     """Test base/bull/bear appreciation projections."""
     result = analyzer.project_appreciation(
-        entry_noi=500_000,
-        entry_value=10_000_000,
-        initial_equity=3_000_000,
-        hold_period_years=5,
+        **_APPRECIATION_BASELINE,
         base_rent_growth=0.03,
         bull_rent_growth=0.045,
         bear_rent_growth=0.02,
@@ -108,12 +121,12 @@ def test_appreciation_scenarios_distribution(analyzer):
 
     assert len(result.scenarios) == 3
     scenario_names = {s.scenario_name for s in result.scenarios}
-    assert scenario_names == {"base", "bull", "bear"}
+    assert scenario_names == _SCENARIO_NAMES
 
     # Order: bear < base < bull
-    bear = next(s for s in result.scenarios if s.scenario_name == "bear")
-    base = next(s for s in result.scenarios if s.scenario_name == "base")
-    bull = next(s for s in result.scenarios if s.scenario_name == "bull")
+    bear = result.scenarios_by_name["bear"]
+    base = result.scenarios_by_name["base"]
+    bull = result.scenarios_by_name["bull"]
 
     assert bear.projected_irr < base.projected_irr < bull.projected_irr
     assert (
@@ -123,23 +136,20 @@ def test_appreciation_scenarios_distribution(analyzer):
     )
 
     # P10 (bear) < P50 (base) < P90 (bull)
-    assert result.p10_irr == bear.projected_irr
-    assert result.p50_irr == base.projected_irr
-    assert result.p90_irr == bull.projected_irr
+    assert result.p10_irr == approx(bear.projected_irr)
+    assert result.p50_irr == approx(base.projected_irr)
+    assert result.p90_irr == approx(bull.projected_irr)
 
 
 def test_appreciation_base_case_calculations(analyzer):
     """Test base case appreciation calculations."""
     result = analyzer.project_appreciation(
-        entry_noi=500_000,
-        entry_value=10_000_000,  # 5% cap rate
-        initial_equity=3_000_000,
-        hold_period_years=5,
+        **_APPRECIATION_BASELINE,
         base_rent_growth=0.03,  # 3% annual
         cap_rate_range_bps=0,  # Stable cap for base
     )
 
-    base = next(s for s in result.scenarios if s.scenario_name == "base")
+    base = result.scenarios_by_name["base"]
 
     # NOI after 5 years at 3% growth: 500k * 1.03^5 = ~579,637
     expected_noi = 500_000 * (1.03**5)
@@ -147,7 +157,7 @@ def test_appreciation_base_case_calculations(analyzer):
     expected_exit_value = expected_noi / 0.05
     expected_multiple = expected_exit_value / 3_000_000
 
-    assert base.annual_rent_growth == 0.03
+    assert base.annual_rent_growth == approx(0.03)
     assert base.cap_rate_movement_bps == 0
     assert abs(base.projected_equity_multiple - expected_multiple) < 0.05
 
@@ -155,18 +165,15 @@ def test_appreciation_base_case_calculations(analyzer):
 def test_appreciation_bull_bear_symmetry(analyzer):
     """Test that bull and bear scenarios are symmetric."""
     result = analyzer.project_appreciation(
-        entry_noi=500_000,
-        entry_value=10_000_000,
-        initial_equity=3_000_000,
-        hold_period_years=5,
+        **_APPRECIATION_BASELINE,
         base_rent_growth=0.03,
         bull_rent_growth=0.045,  # +1.5%
         bear_rent_growth=0.015,  # -1.5%
         cap_rate_range_bps=50,  # +/- 50 bps
     )
 
-    bear = next(s for s in result.scenarios if s.scenario_name == "bear")
-    bull = next(s for s in result.scenarios if s.scenario_name == "bull")
+    bear = result.scenarios_by_name["bear"]
+    bull = result.scenarios_by_name["bull"]
 
     # Cap rate movements should be symmetric
     assert bear.cap_rate_movement_bps == 50  # Expansion
@@ -191,7 +198,7 @@ def test_refi_vs_sale_refi_favored(analyzer):
 
     # Refi loan: 15M * 0.7 = 10.5M
     # Extract: 10.5M - 5M = 5.5M
-    assert result.refi_equity_extracted == 5_500_000
+    assert result.refi_equity_extracted == approx(5_500_000, abs=0.5)
 
     # New debt service: 10.5M * 4.5% = 472.5k
     # Annual cashflow: 750k - 472.5k = 277.5k
@@ -253,34 +260,63 @@ def test_refi_vs_sale_close_call(analyzer):
 
 def test_refi_vs_sale_tax_impact(analyzer):
     """Test impact of taxes on sale proceeds."""
-    # High tax scenario
-    high_tax = analyzer.compare_refi_vs_sale(
+    # [high tax, low tax] scenarios evaluated in one batched call
+    result = analyzer.compare_refi_vs_sale_batch(
         current_value=15_000_000,
         current_debt=5_000_000,
         current_noi=750_000,
         refi_ltv=0.70,
         refi_interest_rate=0.045,
-        capital_gains_rate=0.23,  # High state + federal
+        capital_gains_rate=[0.23, 0.15],  # High state + federal vs. low rate
         depreciation_recapture_rate=0.25,
-        depreciation_taken=2_000_000,  # Significant depreciation
-        cost_basis=8_000_000,  # Large gain
+        depreciation_taken=[2_000_000, 500_000],  # Significant vs. less depreciation
+        cost_basis=[8_000_000, 12_000_000],  # Large vs. smaller gain
     )
 
-    # Low tax scenario
-    low_tax = analyzer.compare_refi_vs_sale(
-        current_value=15_000_000,
-        current_debt=5_000_000,
-        current_noi=750_000,
-        refi_ltv=0.70,
-        refi_interest_rate=0.045,
-        capital_gains_rate=0.15,  # Low rate
-        depreciation_recapture_rate=0.25,
-        depreciation_taken=500_000,  # Less depreciation
-        cost_basis=12_000_000,  # Smaller gain
+    # Low tax scenario should have higher net proceeds
+    assert result.sale_net_proceeds[1] > result.sale_net_proceeds[0]
+
+
+def test_refi_vs_sale_batch_matches_scalar(analyzer):
+    """Test batched comparison agrees with the scalar method per case."""
+    cases = [
+        dict(
+            current_value=15_000_000,
+            current_debt=5_000_000,
+            current_noi=750_000,
+            hold_years_if_refi=5,
+            refi_interest_rate=0.045,
+            depreciation_taken=1_000_000,
+            cost_basis=10_000_000,
+        ),
+        dict(
+            current_value=12_000_000,
+            current_debt=8_000_000,
+            current_noi=600_000,
+            hold_years_if_refi=3,
+            refi_interest_rate=0.06,
+            depreciation_taken=500_000,
+            cost_basis=8_000_000,
+        ),
+        dict(
+            current_value=10_000_000,
+            current_debt=4_000_000,
+            current_noi=500_000,
+            hold_years_if_refi=0,
+            refi_interest_rate=0.05,
+            depreciation_taken=0,
+            cost_basis=0,
+        ),
+    ]
+    batch = analyzer.compare_refi_vs_sale_batch(
+        **{key: [case[key] for case in cases] for key in cases[0]}
     )
 
-    # Low tax scenario should have higher net proceeds
-    assert low_tax.sale_net_proceeds > high_tax.sale_net_proceeds
+    for i, case in enumerate(cases):
+        scalar = analyzer.compare_refi_vs_sale(**case)
+        assert batch.refi_net_benefit[i] == approx(scalar.refi_net_benefit, abs=0.5)
+        assert batch.sale_net_proceeds[i] == approx(scalar.sale_net_proceeds, abs=0.5)
+        assert batch.recommended_strategy[i] == scalar.recommended_strategy
 
 
 def test_exit_model_edge_case_zero_equity(analyzer):
@@ -303,18 +339,15 @@ def test_exit_model_edge_case_zero_equity(analyzer):
 def test_appreciation_negative_rent_growth(analyzer):
     """Test handling of negative rent growth scenario."""
     result = analyzer.project_appreciation(
-        entry_noi=500_000,
-        entry_value=10_000_000,
-        initial_equity=3_000_000,
-        hold_period_years=5,
+        **_APPRECIATION_BASELINE,
         base_rent_growth=0.02,
         bear_rent_growth=-0.01,  # Negative growth
         bull_rent_growth=0.04,
     )
 
-    bear = next(s for s in result.scenarios if s.scenario_name == "bear")
+    bear = result.scenarios_by_name["bear"]
     # Should handle negative growth without errors
-    assert bear.annual_rent_growth == -0.01
+    assert bear.annual_rent_growth == approx(-0.01)
     # Bear scenario should have lowest returns (may still be positive if equity is low)
-    base = next(s for s in result.scenarios if s.scenario_name == "base")
+    base = result.scenarios_by_name["base"]
     assert bear.projected_irr < base.projected_irr
@@ -2,10 +2,11 @@
 
 from Claude45_Demo.asset_evaluation.parking import ParkingAdvisor
 
+_ADVISOR = ParkingAdvisor()
+
 
 def test_infill_transit_reduces_ratio() -> None:
-    advisor = ParkingAdvisor()
-    rec = advisor.recommend(
+    rec = _ADVISOR.recommend(
         {
             "location_type": "urban_core",
             "transit_headway_minutes": 12,
@@ -20,8 +21,7 @@ def test_infill_transit_reduces_ratio() -> None:
 
 
 def test_suburban_defaults_higher() -> None:
-    advisor = ParkingAdvisor()
-    rec = advisor.recommend(
+    rec = _ADVISOR.recommend(
         {
             "location_type": "suburban",
             "transit_headway_minutes": 30,
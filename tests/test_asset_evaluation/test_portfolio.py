@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from Claude45_Demo.asset_evaluation.portfolio import PortfolioAnalyzer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analyzer():
-    """Create portfolio analyzer."""
+    """Create portfolio analyzer shared by tests that do not inspect its state."""
+    return PortfolioAnalyzer()
+
+
+@pytest.fixture
+def fresh_analyzer():
+    """Create a per-test portfolio analyzer with no loaded portfolio."""
     return PortfolioAnalyzer()
 
 
@@ -65,6 +72,95 @@ def test_geographic_fit_balanced_addition(analyzer):
     assert result.concentration_risk_score >= 20  # 40% concentration = 20 score
 
 
+def test_geographic_fit_memoized_for_identical_snapshot(analyzer):
+    """Test identical portfolio snapshots reuse the cached result."""
+    first = analyzer.assess_geographic_fit(
+        candidate_metro="Salt Lake City",
+        candidate_noi=500_000,
+        portfolio_by_metro={
+            "Denver-Aurora-Lakewood": 2_000_000,
+            "Boise-Nampa": 750_000,
+        },
+    )
+    second = analyzer.assess_geographic_fit(
+        candidate_metro="Salt Lake City",
+        candidate_noi=500_000,
+        portfolio_by_metro={
+            "Boise-Nampa": 750_000,
+            "Denver-Aurora-Lakewood": 2_000_000,
+        },
+    )
+
+    assert second is first
+
+
+def test_geographic_fit_batch_matches_scalar(analyzer):
+    """Test batched geographic fit agrees with the scalar method per candidate."""
+    portfolio = {
+        "Denver-Aurora-Lakewood": 2_000_000,
+        "Salt Lake City": 1_500_000,
+        "Boise-Nampa": 1_000_000,
+    }
+    candidates = [
+        ("Boise-Nampa", 500_000),
+        ("Denver-Aurora-Lakewood", 1_000_000),
+        ("Salt Lake City", 500_000),
+        ("Colorado Springs", 250_000),
+    ]
+
+    batch = analyzer.assess_geographic_fit_batch(
+        candidate_metros=[metro for metro, _ in candidates],
+        candidate_nois=[noi for _, noi in candidates],
+        portfolio_by_metro=portfolio,
+    )
+
+    for i, (metro, noi) in enumerate(candidates):
+        scalar = analyzer.assess_geographic_fit(
+            candidate_metro=metro, candidate_noi=noi, portfolio_by_metro=portfolio
+        )
+        assert batch.concentration_risk_score[i] == scalar.concentration_risk_score
+        assert batch.current_noi_concentration_pct[i] == pytest.approx(
+            scalar.current_noi_concentration_pct
+        )
+        assert batch.projected_noi_concentration_pct[i] == pytest.approx(
+            scalar.projected_noi_concentration_pct
+        )
+        assert batch.diversification_impact[i] == scalar.diversification_impact
+
+
+def test_loaded_portfolio_matches_dict_argument(fresh_analyzer):
+    """Test screening against a loaded portfolio matches passing the dict."""
+    portfolio = {
+        "Denver-Aurora-Lakewood": 2_000_000,
+        "Salt Lake City": 1_500_000,
+        "Boise-Nampa": 1_000_000,
+    }
+    fresh_analyzer.load_portfolio(portfolio)
+
+    metros = ["Salt Lake City", "Colorado Springs"]
+    batch = fresh_analyzer.assess_geographic_fit_batch(
+        candidate_metros=metros, candidate_nois=[500_000, 500_000]
+    )
+
+    for i, metro in enumerate(metros):
+        loaded = fresh_analyzer.assess_geographic_fit(
+            candidate_metro=metro, candidate_noi=500_000
+        )
+        explicit = fresh_analyzer.assess_geographic_fit(
+            candidate_metro=metro, candidate_noi=500_000, portfolio_by_metro=portfolio
+        )
+        assert loaded == explicit
+        assert batch.concentration_risk_score[i] == explicit.concentration_risk_score
+
+
+def test_geographic_fit_requires_portfolio(fresh_analyzer):
+    """Test omitting the portfolio without loading one raises ValueError."""
+    with pytest.raises(ValueError, match="load_portfolio"):
+        fresh_analyzer.assess_geographic_fit(
+            candidate_metro="Boise-Nampa", candidate_noi=500_000
+        )
+
+
 def test_product_type_mix_core_strengthening(analyzer):
     """Test product mix for adding core garden/low-rise assets."""
     result = analyzer.assess_product_type_mix(
@@ -177,6 +273,24 @@ def test_synergies_second_asset_in_market(analyzer):
     assert "second asset" in result.synergy_factors[0].lower()
 
 
+def test_synergy_factors_shared_across_results(analyzer):
+    """Test same-sized clusters share one immutable factors tuple."""
+    results = [
+        analyzer.estimate_synergies(
+            candidate_metro="Boise-Nampa",
+            candidate_units=units,
+            candidate_opex_per_unit=5_000,
+            portfolio_assets_in_metro=3,
+            local_reputation_score=75,
+        )
+        for units in (100, 250)
+    ]
+
+    assert isinstance(results[0].synergy_factors, tuple)
+    assert not hasattr(results[0], "__dict__")  # Slotted result
+    assert results[0].synergy_factors is results[1].synergy_factors
+
+
 def test_synergies_small_cluster(analyzer):
     """Test meaningful synergies for small asset cluster."""
     result = analyzer.estimate_synergies(
@@ -254,3 +368,60 @@ def test_product_mix_empty_portfolio(analyzer):
 
     assert result.projected_mix["garden"] == 100.0
     assert result.balance_impact in {"improves", "neutral", "concentrates"}
+
+
+def test_evaluate_candidate_matches_individual_methods(analyzer):
+    """Test the fused evaluation equals calling each assessment separately."""
+    portfolio_by_metro = {"Denver-Aurora-Lakewood": 2_000_000, "Boise-Nampa": 750_000}
+    portfolio_by_product = {"garden": 300, "low-rise": 150, "mid-rise": 50}
+
+    result = analyzer.evaluate_candidate(
+        candidate_metro="Boise-Nampa",
+        candidate_noi=500_000,
+        candidate_product_type="garden",
+        candidate_units=120,
+        candidate_opex_per_unit=5_000,
+        local_reputation_score=75,
+        portfolio_by_metro=portfolio_by_metro,
+        portfolio_by_product=portfolio_by_product,
+        assets_by_metro={"Denver-Aurora-Lakewood": 4, "Boise-Nampa": 2},
+    )
+
+    assert result.geographic_fit == analyzer.assess_geographic_fit(
+        candidate_metro="Boise-Nampa",
+        candidate_noi=500_000,
+        portfolio_by_metro=portfolio_by_metro,
+    )
+    assert result.product_mix == analyzer.assess_product_type_mix(
+        candidate_product_type="garden",
+        candidate_units=120,
+        portfolio_by_product=portfolio_by_product,
+    )
+    assert result.synergies == analyzer.estimate_synergies(
+        candidate_metro="Boise-Nampa",
+        candidate_units=120,
+        candidate_opex_per_unit=5_000,
+        portfolio_assets_in_metro=2,
+        local_reputation_score=75,
+    )
+
+
+def test_evaluate_candidate_accepts_numpy_strings(analyzer):
+    """Test names read from NumPy/pandas columns (np.str_) are accepted."""
+    metros = np.array(["Boise-Nampa"])
+    product_types = np.array(["garden"])
+
+    result = analyzer.evaluate_candidate(
+        candidate_metro=metros[0],
+        candidate_noi=500_000,
+        candidate_product_type=product_types[0],
+        candidate_units=120,
+        candidate_opex_per_unit=5_000,
+        local_reputation_score=75,
+        portfolio_by_metro={"Denver-Aurora-Lakewood": 2_000_000},
+        portfolio_by_product={"garden": 300},
+        assets_by_metro={"Denver-Aurora-Lakewood": 4},
+    )
+
+    assert result.geographic_fit.current_noi_concentration_pct == 0.0
+    assert result.product_mix.projected_mix["garden"] == 100.0
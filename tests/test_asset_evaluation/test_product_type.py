@@ -79,6 +79,51 @@ class TestProductTypeClassification:
         assert "9+ stories" in result["description"]
         assert result["notes"] == "Rare opportunity, high bar"
 
+    @pytest.mark.parametrize(
+        ("stories", "expected"),
+        [
+            (0, "garden"),
+            (2, "garden"),
+            (3, "low-rise"),
+            (4, "low-rise"),
+            (5, "mid-rise"),
+            (8, "mid-rise"),
+            (9, "high-rise"),
+            # Counts between the integer ranges fall through to high-rise
+            (2.5, "high-rise"),
+            (4.5, "high-rise"),
+            (8.5, "high-rise"),
+            (3.5, "low-rise"),
+        ],
+    )
+    def test_story_bucket_boundaries(self, product_classifier, stories, expected):
+        """Test story counts at each bucket edge classify inclusively."""
+        result = product_classifier.classify_product_type({"stories": stories})
+
+        assert result["product_type"] == expected
+
+    @pytest.mark.parametrize("size", [4, 40], ids=["scalar_path", "vectorized"])
+    def test_classify_batch_matches_scalar(self, product_classifier, size):
+        """Test batch classification agrees with the scalar path at any size."""
+        # Quarter-story steps also hit the fractional gaps between buckets
+        stories = [(i % 48) / 4 for i in range(size)]
+
+        result = product_classifier.classify_batch(stories)
+
+        for i, story_count in enumerate(stories):
+            scalar = product_classifier.classify_product_type({"stories": story_count})
+            assert result["product_type"][i] == scalar["product_type"]
+            assert result["aker_fit_score"][i] == scalar["aker_fit_score"]
+
+    @pytest.mark.parametrize("size", [4, 40], ids=["scalar_path", "vectorized"])
+    def test_classify_batch_rejects_nan(self, product_classifier, size):
+        """Test a NaN story count is rejected on both batch paths."""
+        stories = [3.0] * size
+        stories[-1] = float("nan")
+
+        with pytest.raises(ValueError, match="NaN"):
+            product_classifier.classify_batch(stories)
+
 
 class TestMixedUseAssessment:
     """Test mixed-use property evaluation."""
@@ -122,6 +167,45 @@ class TestMixedUseAssessment:
         assert result["retail_profile_score"] < 60  # Not preferred tenants
         assert result["mixed_use_fit_score"] < 50
 
+    def test_retail_score_ignores_tenant_order(self, product_classifier):
+        """Test tenant mixes listed in any order score identically."""
+        base = {"ground_floor_commercial": True, "location_type": "urban"}
+        tenants = ["coffee_shop", "chain_restaurant", "bodega", "dry_cleaner"]
+
+        forward = product_classifier.assess_mixed_use(
+            {**base, "retail_tenants": tenants}
+        )
+        reverse = product_classifier.assess_mixed_use(
+            {**base, "retail_tenants": tenants[::-1]}
+        )
+
+        assert forward == reverse
+        assert forward["retail_profile_score"] == 50
+
+    def test_retail_score_counts_repeated_preferred_tenants(self, product_classifier):
+        """Test each preferred storefront counts, even for repeated types."""
+        result = product_classifier.assess_mixed_use(
+            {
+                "ground_floor_commercial": True,
+                "retail_tenants": ["coffee_shop", "coffee_shop", "bank", "bodega"],
+            }
+        )
+
+        assert result["retail_profile_score"] == 75
+        assert "Preferred tenants: 3/4" in result["retail_assessment"]
+
+    def test_retail_score_tolerates_missing_tenant_entries(self, product_classifier):
+        """Test None entries in the tenant list count as non-preferred tenants."""
+        result = product_classifier.assess_mixed_use(
+            {
+                "ground_floor_commercial": True,
+                "retail_tenants": ["coffee_shop", None, "bodega", 7],
+            }
+        )
+
+        assert result["retail_profile_score"] == 50
+        assert "Preferred tenants: 2/4" in result["retail_assessment"]
+
     def test_residential_only_not_mixed_use(self, product_classifier):
         """Test that residential-only property is not flagged as mixed-use."""
         property_data = {
@@ -193,6 +277,18 @@ class TestAdaptiveReuseEvaluation:
         assert result["reuse_potential_score"] == 0
         assert "already residential" in result["notes"].lower()
 
+    @pytest.mark.parametrize(
+        "current_use", ["single_family", "Residential", "senior_residential"]
+    )
+    def test_residential_uses_short_circuit(self, product_classifier, current_use):
+        """Test housing uses are rejected without conversion scoring."""
+        result = product_classifier.evaluate_adaptive_reuse(
+            {"current_use": current_use, "ceiling_height_ft": 10}
+        )
+
+        assert result["reuse_candidate"] is False
+        assert "positive_factors" not in result
+
 
 class TestProductMetadata:
     """Test product type metadata and documentation."""
@@ -214,6 +310,15 @@ class TestProductMetadata:
         assert "typical_features" in result
         assert isinstance(result["typical_features"], list)
 
+    def test_classification_returns_independent_copies(self, product_classifier):
+        """Test mutating one result does not leak into later classifications."""
+        first = product_classifier.classify_product_type({"stories": 2})
+        first["typical_features"].append("Pool")
+
+        second = product_classifier.classify_product_type({"stories": 2})
+
+        assert "Pool" not in second["typical_features"]
+
     def test_fit_score_range_validation(self, product_classifier):
         """Test that fit scores are always in 0-100 range."""
         test_cases = [
@@ -228,7 +333,7 @@ class TestProductMetadata:
             assert 0 <= result["aker_fit_score"] <= 100
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def product_classifier():
     """Create ProductTypeClassifier instance for testing."""
     from Claude45_Demo.asset_evaluation.product_type import ProductTypeClassifier
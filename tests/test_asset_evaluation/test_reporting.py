@@ -1,4 +1,8 @@
-"""Tests for asset fit report generation."""
+"""Tests for asset fit report generation.
+
+The generator and sample-data fixtures are module-scoped and shared
+read-only; a test that needs to modify sample data must copy it first.
+"""
 
 from __future__ import annotations
 
@@ -6,14 +10,63 @@ import pytest
 
 from Claude45_Demo.asset_evaluation.reporting import ReportGenerator
 
+# Keep the module-scoped fixtures on one worker under `-n auto --dist loadgroup`
+pytestmark = pytest.mark.xdist_group("reporting")
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator():
     """Create report generator."""
     return ReportGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def make_property():
+    """Build batch-screening property payloads, omitting unset sections."""
+
+    def _make(
+        property_id,
+        *,
+        fit=70,
+        units=100,
+        vintage=2005,
+        archetype="value_add_light",
+        div=None,
+        irr=None,
+        product_type=None,
+        **data,
+    ):
+        classification = {"aker_fit_score": fit}
+        if product_type is not None:
+            classification["product_type"] = product_type
+        analyses = {
+            "product_classification": classification,
+            "deal_archetype": {"archetype": archetype},
+        }
+        if div is not None:
+            analyses["portfolio_fit"] = {"diversification_score": div}
+        if irr is not None:
+            analyses["exit_strategy"] = {"base_irr": irr}
+        return {
+            "data": {
+                "property_id": property_id,
+                **data,
+                "units": units,
+                "year_built": vintage,
+            },
+            "analyses": analyses,
+        }
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def strong_pipeline_props(make_property):
+    """Ten qualifying properties, built once for the module."""
+    return tuple(make_property(f"P{i}", fit=75) for i in range(10))
+
+
+@pytest.fixture(scope="module")
 def sample_property_data():
     """Sample property data."""
     return {
@@ -25,7 +78,7 @@ def sample_property_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_analyses():
     """Sample analysis results."""
     return {
@@ -104,144 +157,117 @@ def test_generate_asset_report_complete(
 
     # Verify diligence checklist compiled
     assert len(report.diligence_checklist) == 4
-    assert any("roof" in item.lower() for item in report.diligence_checklist)
+    checklist_lower = {item.lower() for item in report.diligence_checklist}
+    assert any("roof" in item for item in checklist_lower)
 
     # Verify overall recommendation
-    assert report.overall_recommendation
-    assert "strong buy" in report.overall_recommendation.lower()
-
-
-def test_generate_asset_report_strong_buy(generator, sample_property_data):
-    """Test strong buy recommendation for high-fit property."""
-    analyses = {
-        "product_classification": {"product_type": "garden", "aker_fit_score": 95},
-        "deal_archetype": {"archetype": "value_add_light"},
-        "portfolio_fit": {"diversification_score": 85},
-    }
-
-    report = generator.generate_asset_report(
-        property_id="PROP-002",
-        property_data=sample_property_data,
-        analyses=analyses,
-    )
-
-    assert "strong buy" in report.overall_recommendation.lower()
-    assert "95" in report.overall_recommendation
-
-
-def test_generate_asset_report_pass_recommendation(generator, sample_property_data):
-    """Test pass recommendation for low-fit property."""
-    analyses = {
-        "product_classification": {"product_type": "high-rise", "aker_fit_score": 35},
-        "deal_archetype": {"archetype": "heavy_lift_reposition"},
-        "portfolio_fit": {"diversification_score": 40},
-    }
-
-    report = generator.generate_asset_report(
-        property_id="PROP-003",
-        property_data=sample_property_data,
-        analyses=analyses,
-    )
-
-    assert "pass" in report.overall_recommendation.lower()
-    assert "below" in report.overall_recommendation.lower()
-
-
-def test_generate_asset_report_conditional_recommendation(
-    generator, sample_property_data
+    recommendation = report.overall_recommendation
+    assert recommendation
+    assert "strong buy" in recommendation.lower()
+
+
+@pytest.mark.parametrize(
+    ("product_type", "fit", "archetype", "div", "expected_substrings"),
+    [
+        pytest.param(
+            "garden", 95, "value_add_light", 85, ("strong buy", "95"), id="strong_buy"
+        ),
+        pytest.param(
+            "high-rise",
+            35,
+            "heavy_lift_reposition",
+            40,
+            ("pass", "below"),
+            id="pass",
+        ),
+        pytest.param(
+            "mid-rise",
+            65,
+            "value_add_medium",
+            60,
+            ("conditional", "moderate"),
+            id="conditional",
+        ),
+    ],
+)
+def test_recommendation_tier(
+    generator,
+    sample_property_data,
+    product_type,
+    fit,
+    archetype,
+    div,
+    expected_substrings,
 ):
-    """Test conditional recommendation for moderate-fit property."""
+    """Test overall recommendation tier follows fit and diversification."""
     analyses = {
-        "product_classification": {"product_type": "mid-rise", "aker_fit_score": 65},
-        "deal_archetype": {"archetype": "value_add_medium"},
-        "portfolio_fit": {"diversification_score": 60},
+        "product_classification": {
+            "product_type": product_type,
+            "aker_fit_score": fit,
+        },
+        "deal_archetype": {"archetype": archetype},
+        "portfolio_fit": {"diversification_score": div},
     }
 
     report = generator.generate_asset_report(
-        property_id="PROP-004",
+        property_id="PROP-002",
         property_data=sample_property_data,
         analyses=analyses,
     )
 
-    assert "conditional" in report.overall_recommendation.lower()
-    assert "moderate" in report.overall_recommendation.lower()
+    recommendation_lower = report.overall_recommendation.lower()
+    for substring in expected_substrings:
+        assert substring in recommendation_lower
 
 
-def test_batch_screen_properties_with_filters(generator):
+def test_batch_screen_properties_with_filters(generator, make_property):
     """Test batch screening with filters."""
     properties = [
-        {
-            "data": {
-                "property_id": "P1",
-                "name": "Property 1",
-                "location": "Denver",
-                "units": 150,
-                "year_built": 2000,
-            },
-            "analyses": {
-                "product_classification": {
-                    "aker_fit_score": 85,
-                    "product_type": "garden",
-                },
-                "deal_archetype": {"archetype": "value_add_light"},
-                "portfolio_fit": {"diversification_score": 75},
-                "exit_strategy": {"base_irr": 0.18},
-            },
-        },
-        {
-            "data": {
-                "property_id": "P2",
-                "name": "Property 2",
-                "location": "Salt Lake City",
-                "units": 200,
-                "year_built": 2010,
-            },
-            "analyses": {
-                "product_classification": {
-                    "aker_fit_score": 90,
-                    "product_type": "low-rise",
-                },
-                "deal_archetype": {"archetype": "value_add_light"},
-                "portfolio_fit": {"diversification_score": 80},
-                "exit_strategy": {"base_irr": 0.20},
-            },
-        },
-        {
-            "data": {
-                "property_id": "P3",
-                "name": "Property 3",
-                "location": "Boise",
-                "units": 30,  # Below minimum
-                "year_built": 2005,
-            },
-            "analyses": {
-                "product_classification": {
-                    "aker_fit_score": 80,
-                    "product_type": "garden",
-                },
-                "deal_archetype": {"archetype": "value_add_light"},
-                "portfolio_fit": {"diversification_score": 70},
-                "exit_strategy": {"base_irr": 0.16},
-            },
-        },
-        {
-            "data": {
-                "property_id": "P4",
-                "name": "Property 4",
-                "location": "Denver",
-                "units": 100,
-                "year_built": 1995,
-            },
-            "analyses": {
-                "product_classification": {
-                    "aker_fit_score": 75,
-                    "product_type": "low-rise",
-                },
-                "deal_archetype": {"archetype": "value_add_medium"},
-                "portfolio_fit": {"diversification_score": 65},
-                "exit_strategy": {"base_irr": 0.15},
-            },
-        },
+        make_property(
+            "P1",
+            name="Property 1",
+            location="Denver",
+            units=150,
+            vintage=2000,
+            fit=85,
+            product_type="garden",
+            div=75,
+            irr=0.18,
+        ),
+        make_property(
+            "P2",
+            name="Property 2",
+            location="Salt Lake City",
+            units=200,
+            vintage=2010,
+            fit=90,
+            product_type="low-rise",
+            div=80,
+            irr=0.20,
+        ),
+        make_property(
+            "P3",
+            name="Property 3",
+            location="Boise",
+            units=30,  # Below minimum
+            vintage=2005,
+            fit=80,
+            product_type="garden",
+            div=70,
+            irr=0.16,
+        ),
+        make_property(
+            "P4",
+            name="Property 4",
+            location="Denver",
+            units=100,
+            vintage=1995,
+            fit=75,
+            product_type="low-rise",
+            archetype="value_add_medium",
+            div=65,
+            irr=0.15,
+        ),
     ]
 
     result = generator.batch_screen_properties(
@@ -267,35 +293,11 @@ def test_batch_screen_properties_with_filters(generator):
     assert result.recommendation
 
 
-def test_batch_screen_properties_ranking(generator):
+def test_batch_screen_properties_ranking(generator, make_property):
     """Test that properties are ranked by composite score."""
     properties = [
-        {
-            "data": {
-                "property_id": "P1",
-                "units": 100,
-                "year_built": 2005,
-            },
-            "analyses": {
-                "product_classification": {"aker_fit_score": 70},
-                "deal_archetype": {"archetype": "value_add_light"},
-                "portfolio_fit": {"diversification_score": 60},
-                "exit_strategy": {"base_irr": 0.12},
-            },
-        },
-        {
-            "data": {
-                "property_id": "P2",
-                "units": 100,
-                "year_built": 2005,
-            },
-            "analyses": {
-                "product_classification": {"aker_fit_score": 85},
-                "deal_archetype": {"archetype": "value_add_light"},
-                "portfolio_fit": {"diversification_score": 75},
-                "exit_strategy": {"base_irr": 0.18},
-            },
-        },
+        make_property("P1", fit=70, div=60, irr=0.12),
+        make_property("P2", fit=85, div=75, irr=0.18),
     ]
 
     result = generator.batch_screen_properties(
@@ -315,21 +317,9 @@ def test_batch_screen_properties_ranking(generator):
     )
 
 
-def test_batch_screen_no_qualifying_properties(generator):
+def test_batch_screen_no_qualifying_properties(generator, make_property):
     """Test batch screening when no properties meet criteria."""
-    properties = [
-        {
-            "data": {
-                "property_id": "P1",
-                "units": 100,
-                "year_built": 2005,
-            },
-            "analyses": {
-                "product_classification": {"aker_fit_score": 45},  # Too low
-                "deal_archetype": {"archetype": "value_add_light"},
-            },
-        }
-    ]
+    properties = [make_property("P1", fit=45)]  # Fit too low
 
     result = generator.batch_screen_properties(
         properties=properties,
@@ -344,18 +334,10 @@ def test_batch_screen_no_qualifying_properties(generator):
     assert "no properties met" in result.recommendation.lower()
 
 
-def test_batch_screen_limited_pipeline(generator):
+def test_batch_screen_limited_pipeline(generator, make_property):
     """Test recommendation for limited qualifying properties."""
-    properties = [
-        {
-            "data": {"property_id": f"P{i}", "units": 100, "year_built": 2005},
-            "analyses": {
-                "product_classification": {"aker_fit_score": 70},
-                "deal_archetype": {"archetype": "value_add_light"},
-            },
-        }
-        for i in range(3)  # Only 3 properties
-    ]
+    # Only 3 properties
+    properties = [make_property(f"P{i}") for i in range(3)]
 
     result = generator.batch_screen_properties(
         properties=properties,
@@ -368,21 +350,10 @@ def test_batch_screen_limited_pipeline(generator):
     assert "limited pipeline" in result.recommendation.lower()
 
 
-def test_batch_screen_strong_pipeline(generator):
+def test_batch_screen_strong_pipeline(generator, strong_pipeline_props):
     """Test recommendation for strong pipeline."""
-    properties = [
-        {
-            "data": {"property_id": f"P{i}", "units": 100, "year_built": 2005},
-            "analyses": {
-                "product_classification": {"aker_fit_score": 75},
-                "deal_archetype": {"archetype": "value_add_light"},
-            },
-        }
-        for i in range(10)  # Strong pipeline
-    ]
-
     result = generator.batch_screen_properties(
-        properties=properties,
+        properties=list(strong_pipeline_props),
         min_aker_fit=60,
         min_units=50,
         max_vintage=2015,
@@ -1,10 +1,16 @@
 """Tests for unit mix optimizer."""
 
+import pytest
+
 from Claude45_Demo.asset_evaluation.unit_mix import UnitMixOptimizer
 
 
-def test_job_core_mix_biases_toward_smaller_units() -> None:
-    optimizer = UnitMixOptimizer()
+@pytest.fixture(scope="module")
+def optimizer() -> UnitMixOptimizer:
+    return UnitMixOptimizer()
+
+
+def test_job_core_mix_biases_toward_smaller_units(optimizer: UnitMixOptimizer) -> None:
     rec = optimizer.recommend(
         {
             "job_core": True,
@@ -17,8 +23,9 @@ def test_job_core_mix_biases_toward_smaller_units() -> None:
     assert "job core" in rec.rationale.lower() or "compact" in rec.rationale.lower()
 
 
-def test_family_node_mixes_larger_units_with_affordability_adjustment() -> None:
-    optimizer = UnitMixOptimizer()
+def test_family_node_mixes_larger_units_with_affordability_adjustment(
+    optimizer: UnitMixOptimizer,
+) -> None:
     rec = optimizer.recommend(
         {
             "family_age_cohort_index": 120,
@@ -1,33 +1,54 @@
 """Tests for CLI main module."""
 
-from click.testing import CliRunner
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner, Result
 
 from Claude45_Demo.cli.main import cli
 
 
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Click test runner shared by all CLI tests.
+
+    Tests of successful command runs pass ``standalone_mode=False`` to skip
+    Click's exit/exception wrapping; tests of ``--help``, ``--version``,
+    usage errors, and aborts keep standalone mode because they assert on the
+    exit codes it sets.
+    """
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_outputs(runner: CliRunner) -> dict[str, Result]:
+    """``--help`` results for the root CLI ("") and each command group."""
+    return {
+        path: runner.invoke(cli, [*path.split(), "--help"])
+        for path in ("", "screen", "analyze", "report", "data", "config")
+    }
+
+
 class TestCLI:
     """Test CLI commands."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, help_outputs: dict[str, Result]) -> None:
         """Test CLI shows help message."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        result = help_outputs[""]
 
         assert result.exit_code == 0
         assert "Aker Investment Platform" in result.output
         assert "Real Estate Analysis Tool" in result.output
 
-    def test_cli_version(self) -> None:
+    def test_cli_version(self, runner: CliRunner) -> None:
         """Test CLI shows version."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_cli_verbose_flag(self) -> None:
+    def test_cli_verbose_flag(self, runner: CliRunner) -> None:
         """Test verbose flag is recognized."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--verbose", "--help"])
 
         assert result.exit_code == 0
@@ -36,122 +57,107 @@ class TestCLI:
 class TestScreenCommand:
     """Test screen command."""
 
-    def test_screen_help(self) -> None:
+    def test_screen_help(self, help_outputs: dict[str, Result]) -> None:
         """Test screen command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["screen", "--help"])
+        result = help_outputs["screen"]
 
         assert result.exit_code == 0
         assert "Screen multiple submarkets" in result.output
 
-    def test_screen_requires_input(self) -> None:
+    def test_screen_requires_input(self, runner: CliRunner) -> None:
         """Test screen command requires input file."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["screen"])
 
         assert result.exit_code != 0
         assert "Missing option" in result.output or "required" in result.output.lower()
 
-    def test_screen_not_implemented_message(self) -> None:
-        """Test screen command shows not implemented message."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            # Create a dummy input file
-            with open("test.csv", "w") as f:
-                f.write("name,lat,lon,state\nBoulder,40.0,-105.3,CO\n")
-
-            result = runner.invoke(cli, ["screen", "--input", "test.csv"])
-
-            assert result.exit_code == 0
-            assert "not yet implemented" in result.output
-
 
 class TestAnalyzeCommand:
     """Test analyze command."""
 
-    def test_analyze_help(self) -> None:
+    def test_analyze_help(self, help_outputs: dict[str, Result]) -> None:
         """Test analyze command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["analyze", "--help"])
+        result = help_outputs["analyze"]
 
         assert result.exit_code == 0
         assert "Perform detailed analysis" in result.output
 
-    def test_analyze_requires_address(self) -> None:
+    def test_analyze_requires_address(self, runner: CliRunner) -> None:
         """Test analyze command requires address."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["analyze"])
 
         assert result.exit_code != 0
 
-    def test_analyze_not_implemented_message(self) -> None:
-        """Test analyze command shows not implemented message."""
-        runner = CliRunner()
-        result = runner.invoke(
-            cli, ["analyze", "--address", "123 Main St, Boulder, CO"]
-        )
-
-        assert result.exit_code == 0
-        assert "not yet implemented" in result.output
-
 
 class TestReportCommand:
     """Test report command."""
 
-    def test_report_help(self) -> None:
+    def test_report_help(self, help_outputs: dict[str, Result]) -> None:
         """Test report command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["report", "--help"])
+        result = help_outputs["report"]
 
         assert result.exit_code == 0
         assert "Generate formatted reports" in result.output
 
-    def test_report_requires_market(self) -> None:
+    def test_report_requires_market(self, runner: CliRunner) -> None:
         """Test report command requires market."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["report"])
 
         assert result.exit_code != 0
 
-    def test_report_not_implemented_message(self) -> None:
-        """Test report command shows not implemented message."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["report", "--market", "Boulder, CO"])
 
-        assert result.exit_code == 0
-        assert "not yet implemented" in result.output
+@pytest.mark.parametrize(
+    ("args", "needs_input_file"),
+    [
+        pytest.param(["screen", "--input"], True, id="screen"),
+        pytest.param(
+            ["analyze", "--address", "123 Main St, Boulder, CO"], False, id="analyze"
+        ),
+        pytest.param(["report", "--market", "Boulder, CO"], False, id="report"),
+    ],
+)
+def test_command_not_implemented_message(
+    runner: CliRunner, tmp_path: Path, args: list[str], needs_input_file: bool
+) -> None:
+    """Test placeholder commands show the not implemented message."""
+    if needs_input_file:
+        # --input must name an existing file
+        input_file = tmp_path / "test.csv"
+        input_file.write_text("name,lat,lon,state\nBoulder,40.0,-105.3,CO\n")
+        args = [*args, str(input_file)]
+
+    result = runner.invoke(cli, args, standalone_mode=False)
+
+    assert result.exit_code == 0
+    assert "not yet implemented" in result.output
 
 
 class TestDataCommands:
     """Test data management commands."""
 
-    def test_data_help(self) -> None:
+    def test_data_help(self, help_outputs: dict[str, Result]) -> None:
         """Test data command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["data", "--help"])
+        result = help_outputs["data"]
 
         assert result.exit_code == 0
         assert "Data management commands" in result.output
 
-    def test_data_status(self) -> None:
+    def test_data_status(self, runner: CliRunner) -> None:
         """Test data status command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["data", "status"])
+        result = runner.invoke(cli, ["data", "status"], standalone_mode=False)
 
         assert result.exit_code == 0
         assert "Cache Status" in result.output
 
-    def test_data_refresh(self) -> None:
+    def test_data_refresh(self, runner: CliRunner) -> None:
         """Test data refresh command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["data", "refresh", "--all"])
+        result = runner.invoke(cli, ["data", "refresh", "--all"], standalone_mode=False)
 
         assert result.exit_code == 0
         assert "Data Refresh" in result.output
 
-    def test_data_clear_requires_confirmation(self) -> None:
+    def test_data_clear_requires_confirmation(self, runner: CliRunner) -> None:
         """Test data clear command requires confirmation."""
-        runner = CliRunner()
         # Without confirmation, should abort
         result = runner.invoke(cli, ["data", "clear", "--all"], input="n\n")
 
@@ -161,41 +167,27 @@ class TestDataCommands:
 class TestConfigCommands:
     """Test configuration commands."""
 
-    def test_config_help(self) -> None:
+    def test_config_help(self, help_outputs: dict[str, Result]) -> None:
         """Test config command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "--help"])
+        result = help_outputs["config"]
 
         assert result.exit_code == 0
         assert "Configuration management" in result.output
 
-    def test_config_init(self) -> None:
-        """Test config init command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "init"])
-
-        assert result.exit_code == 0
-        assert "Configuration Setup" in result.output
-
-    def test_config_show(self) -> None:
-        """Test config show command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "show"])
-
-        assert result.exit_code == 0
-        assert "Current Configuration" in result.output
-
-    def test_config_set(self) -> None:
-        """Test config set command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "set", "test_key", "test_value"])
-
-        assert result.exit_code == 0
-        assert "test_key" in result.output
-
-    def test_config_get(self) -> None:
-        """Test config get command."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config", "get", "test_key"])
-
-        assert result.exit_code == 0
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            pytest.param(["init"], "Configuration Setup", id="init"),
+            pytest.param(["show"], "Current Configuration", id="show"),
+            pytest.param(["set", "test_key", "test_value"], "test_key", id="set"),
+            pytest.param(["get", "test_key"], "test_key", id="get"),
+        ],
+    )
+    def test_config_subcommand(
+        self, runner: CliRunner, args: list[str], expected: str
+    ) -> None:
+        """Test config subcommands run and echo their subject."""
+        result = runner.invoke(cli, ["config", *args], standalone_mode=False)
+
+        assert result.exit_code == 0
+        assert expected in result.output
@@ -0,0 +1,65 @@
+"""Shared fixtures for data integration connector tests."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator
+
+import pytest
+import responses
+
+from Claude45_Demo.data_integration.bea import BEAConnector
+from Claude45_Demo.data_integration.cache import CacheManager
+
+BEA_API_URL = "https://apps.bea.gov/api/data"
+
+DEFAULT_BEA_JSON: Dict[str, Any] = {
+    "BEAAPI": {
+        "Results": {
+            "Data": [
+                {
+                    "GeoFips": "08",
+                    "DataValue": "100",
+                    "TimePeriod": "2021",
+                    "Description": "Test",
+                }
+            ]
+        }
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def _module_bea_connector() -> Iterator[BEAConnector]:
+    """Build one BEA connector per module on an in-memory cache, retries disabled."""
+    cache = CacheManager(db_path=CacheManager.MEMORY_DB)
+    connector = BEAConnector(api_key="test-key", cache_manager=cache)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(connector, "_retry_with_backoff", lambda func, **_: func())
+        yield connector
+
+
+@pytest.fixture
+def bea_connector(_module_bea_connector: BEAConnector) -> BEAConnector:
+    """Provide the shared BEA connector with an empty cache and full quota."""
+    _module_bea_connector.cache.purge()
+    _module_bea_connector._request_count = 0
+    return _module_bea_connector
+
+
+@pytest.fixture(scope="module")
+def _module_bea_api() -> Iterator[responses.RequestsMock]:
+    """Intercept HTTP to the BEA API for the whole module."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def bea_api(_module_bea_api: responses.RequestsMock) -> responses.RequestsMock:
+    """Serve DEFAULT_BEA_JSON from the BEA API with a clean call log.
+
+    Tests needing another payload call ``bea_api.replace(responses.GET,
+    connector.base_url, json=...)``; ``bea_api.calls`` records the requests.
+    """
+    _module_bea_api.reset()
+    _module_bea_api.get(BEA_API_URL, json=DEFAULT_BEA_JSON)
+    return _module_bea_api
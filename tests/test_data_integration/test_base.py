@@ -4,12 +4,41 @@ Tests for base API connector functionality.
 Tests scenarios from: openspec/changes/add-aker-investment-platform/specs/data-integration/spec.md
 """
 
-import time
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 
+from Claude45_Demo.data_integration.base import APIConnector
+
+
+class _ConcreteConnector(APIConnector):
+    """Minimal concrete connector echoing its params."""
+
+    def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"data": "mock_response", "params": params}
+
+    def parse(self, response: Dict[str, Any]) -> Any:
+        return response
+
+
+class _StubConnector(APIConnector):
+    """Concrete connector whose fetch does nothing, for exercising helpers."""
+
+    def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    def parse(self, response: Dict[str, Any]) -> Any:
+        return response
+
+
+class _TrackedConnector(_StubConnector):
+    """Connector that records each fetch against its rate limit."""
+
+    def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._track_request()
+        return {"data": "test"}
+
 
 class MockConnector:
     """Mock connector for testing abstract base class."""
@@ -17,17 +46,23 @@ class MockConnector:
     def __init__(
         self, api_key: str = "test_key", base_url: str = "https://api.example.com"
     ):
-        from Claude45_Demo.data_integration.base import APIConnector
+        self.connector = _ConcreteConnector(api_key=api_key, base_url=base_url)
+
+
+class FakeClock:
+    """Sleeper stand-in that records requested delays instead of waiting."""
 
-        # Create a concrete implementation for testing
-        class ConcreteConnector(APIConnector):
-            def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                return {"data": "mock_response", "params": params}
+    def __init__(self) -> None:
+        self.delays: List[float] = []
 
-            def parse(self, response: Dict[str, Any]) -> Any:
-                return response
+    def __call__(self, seconds: float) -> None:
+        self.delays.append(seconds)
 
-        self.connector = ConcreteConnector(api_key=api_key, base_url=base_url)
+
+@pytest.fixture(scope="module")
+def mock_connector() -> MockConnector:
+    """Default MockConnector shared by tests that only read its state."""
+    return MockConnector()
 
 
 class TestAPIConnectorAbstraction:
@@ -40,26 +75,19 @@ class TestAPIConnectorAbstraction:
     AND: implements required methods: authenticate(), fetch(), parse(), validate()
     """
 
-    def test_connector_inheritance(self):
+    def test_connector_inheritance(self, mock_connector):
         """Test that connectors properly inherit from APIConnector."""
-        from Claude45_Demo.data_integration.base import APIConnector
-
-        mock = MockConnector()
-        assert isinstance(mock.connector, APIConnector)
-        assert hasattr(mock.connector, "fetch")
-        assert hasattr(mock.connector, "parse")
-        assert hasattr(mock.connector, "validate")
+        assert isinstance(mock_connector.connector, APIConnector)
+        assert {"fetch", "parse", "validate"} <= set(dir(mock_connector.connector))
 
-    def test_required_methods_implemented(self):
+    def test_required_methods_implemented(self, mock_connector):
         """Test that all required abstract methods are implemented."""
-        mock = MockConnector()
-
         # Test fetch is callable
-        result = mock.connector.fetch({"test": "param"})
+        result = mock_connector.connector.fetch({"test": "param"})
         assert result is not None
 
         # Test parse is callable
-        parsed = mock.connector.parse({"data": "test"})
+        parsed = mock_connector.connector.parse({"data": "test"})
         assert parsed is not None
 
 
@@ -76,21 +104,7 @@ class TestErrorHandlingWithRetry:
 
     def test_exponential_backoff_on_failure(self):
         """Test exponential backoff retry logic."""
-        from Claude45_Demo.data_integration.base import APIConnector
-
-        class FailingConnector(APIConnector):
-            def __init__(self):
-                super().__init__(api_key="test")
-                self.attempt_count = 0
-                self.attempt_times = []
-
-            def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                return {}
-
-            def parse(self, response: Dict[str, Any]) -> Any:
-                return response
-
-        connector = FailingConnector()
+        connector = _StubConnector(api_key="test")
 
         # Mock function that fails first 2 times, succeeds on 3rd
         call_count = 0
@@ -103,39 +117,34 @@ class TestErrorHandlingWithRetry:
             return {"success": True}
 
         # Test retry with backoff
-        start_time = time.time()
+        clock = FakeClock()
         result = connector._retry_with_backoff(
-            failing_func, max_retries=5, initial_delay=0.1
+            failing_func, max_retries=5, initial_delay=0.1, sleeper=clock
         )
-        elapsed = time.time() - start_time
 
         assert result == {"success": True}
         assert call_count == 3
-        # Should have waited at least 0.1 + 0.2 = 0.3 seconds
-        assert elapsed >= 0.3
+        # Should have waited 0.1 then 0.2 seconds between attempts
+        assert clock.delays == pytest.approx([0.1, 0.2])
+        assert sum(clock.delays) >= 0.3
 
     def test_max_retries_exceeded_raises_exception(self):
         """Test that custom exception is raised after max retries."""
-        from Claude45_Demo.data_integration.base import APIConnector
         from Claude45_Demo.data_integration.exceptions import DataSourceError
 
-        class FailingConnector(APIConnector):
-            def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                return {}
-
-            def parse(self, response: Dict[str, Any]) -> Any:
-                return response
-
-        connector = FailingConnector()
+        connector = _StubConnector()
 
         def always_fails():
             raise ConnectionError("Persistent failure")
 
         # Should raise DataSourceError after exhausting retries
+        clock = FakeClock()
         with pytest.raises(DataSourceError):
             connector._retry_with_backoff(
-                always_fails, max_retries=3, initial_delay=0.01
+                always_fails, max_retries=3, initial_delay=0.01, sleeper=clock
             )
+        # No wait after the final attempt
+        assert len(clock.delays) == 2
 
 
 class TestRateLimiting:
@@ -152,28 +161,82 @@ class TestRateLimiting:
     def test_rate_limit_tracking(self):
         """Test that rate limit is tracked per connector."""
         mock = MockConnector()
+        capacity = mock.connector._capacity
 
         # Make multiple requests
-        for i in range(10):
-            mock.connector.fetch({"request": i})
+        for _ in range(10):
+            mock.connector._check_rate_limit()
 
-        # Request count should be tracked
-        assert hasattr(mock.connector, "_request_count")
-        assert mock.connector._request_count >= 0
+        # Each request draws a token and counts against the daily quota
+        assert mock.connector._tokens == pytest.approx(capacity - 10, abs=0.01)
+        assert mock.connector._request_count == 10
 
-    def test_rate_limit_warning_on_high_usage(self, caplog):
-        """Test warning is logged when approaching rate limit."""
-        from Claude45_Demo.data_integration.base import APIConnector
+    def test_rate_limit_exhausted_raises(self):
+        """Test a spent daily quota raises rather than waiting for hours."""
+        from Claude45_Demo.data_integration.exceptions import RateLimitExceeded
+
+        mock = MockConnector()
+        mock.connector._request_count = mock.connector.rate_limit
+
+        with pytest.raises(RateLimitExceeded):
+            mock.connector._check_rate_limit()
+
+    def test_daily_quota_is_a_hard_ceiling(self):
+        """Test refilled tokens cannot push a connector past its daily quota."""
+        from Claude45_Demo.data_integration.exceptions import RateLimitExceeded
 
-        class TrackedConnector(APIConnector):
-            def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                self._track_request()
-                return {"data": "test"}
+        connector = _TrackedConnector(api_key="test", rate_limit=10)
+        for _ in range(10):
+            connector._check_rate_limit()
+
+        # A refilled bucket puts tokens back, but today's quota is spent
+        connector._last_refill -= connector.BURST_WINDOW_SECONDS
+        with pytest.raises(RateLimitExceeded):
+            connector._check_rate_limit()
 
-            def parse(self, response: Dict[str, Any]) -> Any:
-                return response
+        # A new UTC day restores the quota
+        connector._daily_count_date -= timedelta(days=1)
+        connector._check_rate_limit()
+        assert connector._request_count == 1
+
+    def test_burst_waits_for_next_token(self):
+        """Test an empty bucket waits for the next token instead of raising."""
+        connector = _TrackedConnector(api_key="test", rate_limit=100, burst_limit=6)
+        clock = FakeClock()
+
+        for _ in range(8):
+            connector._check_rate_limit(sleeper=clock)
+
+        # 6 requests/minute: one token every 10s, queued callers wait in turn
+        assert clock.delays == pytest.approx([10.0, 20.0], abs=0.01)
+        assert connector._request_count == 8
+
+    def test_fresh_daily_quota_after_midnight(self):
+        """Test a quota spent by the end of the day is usable after midnight."""
+        from Claude45_Demo.data_integration.exceptions import RateLimitExceeded
+
+        connector = _TrackedConnector(api_key="test", rate_limit=10, burst_limit=5)
+        clock = FakeClock()
+
+        # Requests spread over the day, then a burst that empties the bucket
+        for _ in range(6):
+            connector._last_refill -= 3600
+            connector._check_rate_limit(sleeper=clock)
+        for _ in range(4):
+            connector._check_rate_limit(sleeper=clock)
+        assert clock.delays == []
+        with pytest.raises(RateLimitExceeded, match="requests/day"):
+            connector._check_rate_limit(sleeper=clock)
+
+        # Midnight UTC: the new day's quota only waits on the next burst token
+        connector._daily_count_date -= timedelta(days=1)
+        connector._check_rate_limit(sleeper=clock)
+        assert connector._request_count == 1
+        assert clock.delays == pytest.approx([12.0], abs=0.01)
 
-        connector = TrackedConnector(api_key="test", rate_limit=10)
+    def test_rate_limit_warning_on_high_usage(self, caplog):
+        """Test warning is logged when approaching rate limit."""
+        connector = _TrackedConnector(api_key="test", rate_limit=10)
 
         # Simulate approaching rate limit
         connector._request_count = 8
@@ -196,15 +259,12 @@ class TestConfigurationInitialization:
 
         assert mock.connector.api_key == "test_key_123"
         assert mock.connector.base_url == "https://test.api.com"
-        assert hasattr(mock.connector, "cache_ttl")
-        assert hasattr(mock.connector, "rate_limit")
+        assert {"cache_ttl", "rate_limit"} <= set(vars(mock.connector))
 
-    def test_default_cache_ttl_is_set(self):
+    def test_default_cache_ttl_is_set(self, mock_connector):
         """Test that default cache TTL is configured."""
-        mock = MockConnector()
-
         # Default TTL should be 30 days per spec
-        assert mock.connector.cache_ttl == timedelta(days=30)
+        assert mock_connector.connector.cache_ttl == timedelta(days=30)
 
 
 class TestValidation:
@@ -219,25 +279,15 @@ class TestValidation:
     AND: raises DataValidationError if critical fields are invalid
     """
 
-    def test_validate_method_exists(self):
+    def test_validate_method_exists(self, mock_connector):
         """Test that validate method is available."""
-        mock = MockConnector()
-        assert hasattr(mock.connector, "validate")
-        assert callable(mock.connector.validate)
+        assert callable(getattr(mock_connector.connector, "validate", None))
 
     def test_validate_checks_required_fields(self):
         """Test validation checks for required fields."""
-        from Claude45_Demo.data_integration.base import APIConnector
         from Claude45_Demo.data_integration.exceptions import ValidationError
 
-        class ValidatingConnector(APIConnector):
-            def fetch(self, params: Dict[str, Any]) -> Dict[str, Any]:
-                return {}
-
-            def parse(self, response: Dict[str, Any]) -> Any:
-                return response
-
-        connector = ValidatingConnector()
+        connector = _StubConnector()
 
         # Valid data should pass
         valid_data = {"required_field": "value", "optional_field": 123}
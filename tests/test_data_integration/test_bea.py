@@ -6,104 +6,85 @@ openspec/changes/add-aker-investment-platform/specs/data-integration/spec.md.
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import pytest
-
-
-def _bea_connector(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
-    """Lazy import and setup for BEA connector with mocked requests."""
-    from Claude45_Demo.data_integration.bea import BEAConnector
-    from Claude45_Demo.data_integration.cache import CacheManager
-
-    cache = CacheManager(db_path=tmp_path / "bea_cache.db")
-    connector = BEAConnector(api_key="test-key", cache_manager=cache)
-
-    # Disable retry delays for faster tests
-    monkeypatch.setattr(connector, "_retry_with_backoff", lambda func, **kw: func())
-
-    return connector
+import responses
 
 
 class TestGDPByIndustryScenario:
     """Scenario: GDP by industry query returns sector data with shares and growth."""
 
-    @pytest.fixture
-    def mock_bea_gdp_response(self) -> Dict[str, Any]:
-        """Mock BEA Regional API response for GDP by industry."""
-        return {
-            "BEAAPI": {
-                "Results": {
-                    "Data": [
-                        {
-                            "GeoFips": "08",
-                            "GeoName": "Colorado",
-                            "TimePeriod": "2021",
-                            "LineCode": "1",
-                            "IndustryId": "1",
-                            "Description": "All industry total",
-                            "DataValue": "420500",
-                            "CL_UNIT": "Millions of current dollars",
-                        },
-                        {
-                            "GeoFips": "08",
-                            "GeoName": "Colorado",
-                            "TimePeriod": "2021",
-                            "LineCode": "3",
-                            "IndustryId": "3",
-                            "Description": "Information",
-                            "DataValue": "25800",
-                            "CL_UNIT": "Millions of current dollars",
-                        },
-                        {
-                            "GeoFips": "08",
-                            "GeoName": "Colorado",
-                            "TimePeriod": "2021",
-                            "LineCode": "51",
-                            "IndustryId": "51",
-                            "Description": "Professional and business services",
-                            "DataValue": "68300",
-                            "CL_UNIT": "Millions of current dollars",
-                        },
-                        {
-                            "GeoFips": "08",
-                            "GeoName": "Colorado",
-                            "TimePeriod": "2020",
-                            "LineCode": "1",
-                            "IndustryId": "1",
-                            "Description": "All industry total",
-                            "DataValue": "400200",
-                            "CL_UNIT": "Millions of current dollars",
-                        },
-                    ]
+    @pytest.fixture(scope="module")
+    def mock_bea_gdp_response(self) -> Mapping[str, Any]:
+        """Mock BEA Regional API response for GDP by industry (read-only, shared)."""
+        return MappingProxyType(
+            {
+                "BEAAPI": {
+                    "Results": {
+                        "Data": [
+                            {
+                                "GeoFips": "08",
+                                "GeoName": "Colorado",
+                                "TimePeriod": "2021",
+                                "LineCode": "1",
+                                "IndustryId": "1",
+                                "Description": "All industry total",
+                                "DataValue": "420500",
+                                "CL_UNIT": "Millions of current dollars",
+                            },
+                            {
+                                "GeoFips": "08",
+                                "GeoName": "Colorado",
+                                "TimePeriod": "2021",
+                                "LineCode": "3",
+                                "IndustryId": "3",
+                                "Description": "Information",
+                                "DataValue": "25800",
+                                "CL_UNIT": "Millions of current dollars",
+                            },
+                            {
+                                "GeoFips": "08",
+                                "GeoName": "Colorado",
+                                "TimePeriod": "2021",
+                                "LineCode": "51",
+                                "IndustryId": "51",
+                                "Description": "Professional and business services",
+                                "DataValue": "68300",
+                                "CL_UNIT": "Millions of current dollars",
+                            },
+                            {
+                                "GeoFips": "08",
+                                "GeoName": "Colorado",
+                                "TimePeriod": "2020",
+                                "LineCode": "1",
+                                "IndustryId": "1",
+                                "Description": "All industry total",
+                                "DataValue": "400200",
+                                "CL_UNIT": "Millions of current dollars",
+                            },
+                        ]
+                    }
                 }
             }
-        }
+        )
 
     def test_fetch_gdp_by_industry_returns_sector_data(
-        self, tmp_path, monkeypatch, mock_bea_gdp_response
+        self, bea_connector, bea_api, mock_bea_gdp_response
     ):
         """Test BEA GDP by industry returns DataFrame with sectors and growth."""
         import pandas as pd
 
-        connector = _bea_connector(tmp_path, monkeypatch)
-
-        # Mock requests.get
-        class MockResponse:
-            def json(self):
-                return mock_bea_gdp_response
-
-            def raise_for_status(self):
-                pass
-
-        def mock_get(*args, **kwargs):
-            return MockResponse()
-
-        monkeypatch.setattr("requests.get", mock_get)
+        bea_api.replace(
+            responses.GET, bea_connector.base_url, json=dict(mock_bea_gdp_response)
+        )
 
         # Execute
-        df = connector.fetch_gdp_by_industry(geo_fips="08", years=[2020, 2021])
+        df = bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2020, 2021])
+
+        # Both years come back from one batched request
+        assert len(bea_api.calls) == 1
 
         # Verify DataFrame structure
         assert isinstance(df, pd.DataFrame)
@@ -112,68 +93,95 @@ class TestGDPByIndustryScenario:
         assert "DataValue" in df.columns
         assert "TimePeriod" in df.columns
 
+        # Repeated labels are stored as categoricals
+        assert isinstance(df["Description"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["GeoFips"].dtype, pd.CategoricalDtype)
+
         # Verify sector data present
         sectors = df["Description"].unique()
         assert "All industry total" in sectors
         assert any("Information" in s for s in sectors)
 
+    def test_calculate_sector_shares_divides_by_year_total(
+        self, bea_connector, mock_bea_gdp_response
+    ):
+        """Test sector shares use each year's all-industry total."""
+        df = bea_connector.parse(mock_bea_gdp_response)
+
+        shares = bea_connector.calculate_sector_shares(df)
+        by_key = shares.set_index(["Description", "TimePeriod"])["sector_share"]
+
+        assert by_key[("Information", "2021")] == pytest.approx(25800 / 420500 * 100)
+        assert by_key[("All industry total", "2020")] == pytest.approx(100.0)
+        assert by_key[("All industry total", "2021")] == pytest.approx(100.0)
+
+    @pytest.mark.filterwarnings("error::FutureWarning")
+    def test_sector_growth_ignores_filtered_out_categories(
+        self, bea_connector, mock_bea_gdp_response
+    ):
+        """Test growth grouping on a categorical frame with unobserved sectors."""
+        df = bea_connector.parse(mock_bea_gdp_response)
+        df = df[df["Description"] != "Information"]
+
+        shares = bea_connector.calculate_sector_shares(df)
+        growth = shares.set_index(["Description", "TimePeriod"])["growth_rate"]
+
+        assert "Information" not in set(shares["Description"])
+        assert growth[("All industry total", "2021")] == pytest.approx(
+            (420500 / 400200 - 1) * 100
+        )
+
 
 class TestPersonalIncomeScenario:
     """Scenario: Personal income query returns income data by region."""
 
-    @pytest.fixture
-    def mock_bea_income_response(self) -> Dict[str, Any]:
-        """Mock BEA Regional API response for personal income."""
-        return {
-            "BEAAPI": {
-                "Results": {
-                    "Data": [
-                        {
-                            "GeoFips": "08031",
-                            "GeoName": "Denver, CO",
-                            "TimePeriod": "2021",
-                            "LineCode": "1",
-                            "Description": "Personal income",
-                            "DataValue": "45500",
-                            "CL_UNIT": "Thousands of dollars",
-                        },
-                        {
-                            "GeoFips": "08031",
-                            "GeoName": "Denver, CO",
-                            "TimePeriod": "2020",
-                            "LineCode": "1",
-                            "Description": "Personal income",
-                            "DataValue": "43200",
-                            "CL_UNIT": "Thousands of dollars",
-                        },
-                    ]
+    @pytest.fixture(scope="module")
+    def mock_bea_income_response(self) -> Mapping[str, Any]:
+        """Mock BEA Regional API response for personal income (read-only, shared)."""
+        return MappingProxyType(
+            {
+                "BEAAPI": {
+                    "Results": {
+                        "Data": [
+                            {
+                                "GeoFips": "08031",
+                                "GeoName": "Denver, CO",
+                                "TimePeriod": "2021",
+                                "LineCode": "1",
+                                "Description": "Personal income",
+                                "DataValue": "45500",
+                                "CL_UNIT": "Thousands of dollars",
+                            },
+                            {
+                                "GeoFips": "08031",
+                                "GeoName": "Denver, CO",
+                                "TimePeriod": "2020",
+                                "LineCode": "1",
+                                "Description": "Personal income",
+                                "DataValue": "43200",
+                                "CL_UNIT": "Thousands of dollars",
+                            },
+                        ]
+                    }
                 }
             }
-        }
+        )
 
     def test_fetch_personal_income_returns_income_data(
-        self, tmp_path, monkeypatch, mock_bea_income_response
+        self, bea_connector, bea_api, mock_bea_income_response
     ):
         """Test BEA personal income returns DataFrame with income trends."""
         import pandas as pd
 
-        connector = _bea_connector(tmp_path, monkeypatch)
-
-        # Mock requests.get
-        class MockResponse:
-            def json(self):
-                return mock_bea_income_response
-
-            def raise_for_status(self):
-                pass
-
-        def mock_get(*args, **kwargs):
-            return MockResponse()
-
-        monkeypatch.setattr("requests.get", mock_get)
+        bea_api.replace(
+            responses.GET, bea_connector.base_url, json=dict(mock_bea_income_response)
+        )
 
         # Execute
-        df = connector.fetch_personal_income(geo_fips="08031", years=[2020, 2021])
+        df = bea_connector.fetch_personal_income(geo_fips="08031", years=[2020, 2021])
+
+        # Both years come back from one batched request
+        assert len(bea_api.calls) == 1
 
         # Verify DataFrame structure
         assert isinstance(df, pd.DataFrame)
@@ -189,88 +197,94 @@ class TestPersonalIncomeScenario:
 class TestCachingBehavior:
     """Verify BEA connector uses caching properly."""
 
-    def test_subsequent_requests_use_cache(self, tmp_path, monkeypatch):
+    def test_subsequent_requests_use_cache(self, bea_connector, bea_api):
         """Test that identical requests hit cache instead of API."""
 
-        connector = _bea_connector(tmp_path, monkeypatch)
-
-        call_count = 0
-
-        def mock_get(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-
-            class MockResponse:
-                def json(self):
-                    return {
-                        "BEAAPI": {
-                            "Results": {
-                                "Data": [
-                                    {
-                                        "GeoFips": "08",
-                                        "DataValue": "100",
-                                        "TimePeriod": "2021",
-                                        "Description": "Test",
-                                    }
-                                ]
-                            }
-                        }
-                    }
-
-                def raise_for_status(self):
-                    pass
-
-            return MockResponse()
-
-        monkeypatch.setattr("requests.get", mock_get)
-
         # First call - should hit API
-        df1 = connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
-        assert call_count == 1
+        df1 = bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
+        assert len(bea_api.calls) == 1
 
         # Second identical call - should hit cache
-        df2 = connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
-        assert call_count == 1  # No additional API call
+        df2 = bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
+        assert len(bea_api.calls) == 1  # No additional API call
 
         # DataFrames should be equivalent
         assert len(df1) == len(df2)
 
+    def test_year_order_shares_cache_entry(self, bea_connector, bea_api):
+        """Test that the same years in another order reuse the cached response."""
+        bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2020, 2021])
+        bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2021, 2020, 2021])
+
+        assert len(bea_api.calls) == 1
+        assert bea_connector.cache.list_keys() == ["bea_gdp_SAGDP2N_08_2020_2021"]
+        query = bea_api.calls[0].request.params
+        assert query["Year"] == "2020,2021"
+        assert query["UserID"] == "test-key"
+        assert query["method"] == "GetData"
+
+
+class TestCachePersistence:
+    """File-backed caches survive across connector instances."""
+
+    def test_cached_response_reused_by_new_connector(self, tmp_path, no_retry, bea_api):
+        """Test a fresh connector on the same cache file skips the API."""
+        from Claude45_Demo.data_integration.bea import BEAConnector
+        from Claude45_Demo.data_integration.cache import CacheManager
+
+        db_path = tmp_path / "bea_cache.db"
+
+        for _ in range(2):
+            connector = no_retry(
+                BEAConnector(
+                    api_key="test-key", cache_manager=CacheManager(db_path=db_path)
+                )
+            )
+            connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
+
+        assert len(bea_api.calls) == 1
+
 
 class TestErrorHandling:
     """Test error handling for BEA API failures."""
 
-    def test_invalid_api_key_raises_configuration_error(self, tmp_path, monkeypatch):
-        """Test that missing API key raises ConfigurationError."""
+    def test_invalid_api_key_raises_configuration_error(self, monkeypatch):
+        """Test that missing API key raises ConfigurationError before any I/O."""
         from Claude45_Demo.data_integration.bea import BEAConnector
+        from Claude45_Demo.data_integration.cache import CacheManager
         from Claude45_Demo.data_integration.exceptions import ConfigurationError
 
         # Mock environment to have no BEA_API_KEY
         monkeypatch.delenv("BEA_API_KEY", raising=False)
 
+        def fail_if_called(*args, **kwargs):
+            raise AssertionError("I/O set up before the API key check")
+
+        monkeypatch.setattr(CacheManager, "__init__", fail_if_called)
+        monkeypatch.setattr("requests.Session", fail_if_called)
+
         with pytest.raises(ConfigurationError, match="BEA_API_KEY"):
             BEAConnector(api_key=None)
 
-    def test_api_error_response_handled_gracefully(self, tmp_path, monkeypatch):
+    def test_api_error_response_handled_gracefully(self, bea_connector, bea_api):
         """Test that API errors are caught and re-raised appropriately."""
         from Claude45_Demo.data_integration.exceptions import DataSourceError
 
-        connector = _bea_connector(tmp_path, monkeypatch)
-
-        def mock_get(*args, **kwargs):
-            class MockResponse:
-                def json(self):
-                    return {
-                        "BEAAPI": {
-                            "Error": {"ErrorCode": "40", "Detail": "Bad Request"}
-                        }
-                    }
+        bea_api.replace(
+            responses.GET,
+            bea_connector.base_url,
+            json={"BEAAPI": {"Error": {"ErrorCode": "40", "Detail": "Bad Request"}}},
+            status=400,
+        )
 
-                def raise_for_status(self):
-                    raise Exception("HTTP 400")
+        with pytest.raises(DataSourceError):
+            bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
 
-            return MockResponse()
+    def test_invalid_json_raises_data_source_error(self, bea_connector, bea_api):
+        """Test that a non-JSON body surfaces as DataSourceError."""
+        from Claude45_Demo.data_integration.exceptions import DataSourceError
 
-        monkeypatch.setattr("requests.get", mock_get)
+        bea_api.replace(responses.GET, bea_connector.base_url, body="<html>down</html>")
 
-        with pytest.raises((DataSourceError, Exception)):
-            connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
+        with pytest.raises(DataSourceError, match="Invalid JSON"):
+            bea_connector.fetch_gdp_by_industry(geo_fips="08", years=[2021])
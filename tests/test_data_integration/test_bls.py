@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
+import orjson
 import pandas as pd
 import pytest
 
@@ -130,6 +131,12 @@ class TestBLSConnectorInitialization:
         # BLS allows 500 requests per day with API key
         assert bls_connector.rate_limit == 500
 
+    def test_connector_reuses_pooled_session(self, bls_connector: BLSConnector) -> None:
+        """Test that BLS requests go through one pooled HTTPS session."""
+        adapter = bls_connector._session.get_adapter(bls_connector.base_url)
+
+        assert adapter._pool_maxsize == 4
+
 
 class TestQCEWEmploymentData:
     """
@@ -143,7 +150,7 @@ class TestQCEWEmploymentData:
     AND: computes 3-year compound annual growth rate (CAGR) per sector
     """
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_qcew_employment_data(
         self,
         mock_post: Mock,
@@ -151,7 +158,7 @@ class TestQCEWEmploymentData:
         qcew_response: Dict[str, Any],
     ) -> None:
         """Test fetching QCEW employment data for a CBSA."""
-        mock_post.return_value.json.return_value = qcew_response
+        mock_post.return_value.content = orjson.dumps(qcew_response)
         mock_post.return_value.status_code = 200
 
         df = bls_connector.fetch_qcew_employment(
@@ -167,7 +174,37 @@ class TestQCEWEmploymentData:
         assert "year" in df.columns
         assert "value" in df.columns
 
-    @patch("requests.post")
+    def test_parse_flattens_multiple_series(self, bls_connector: BLSConnector) -> None:
+        """Test that datapoints from every series land in typed columns."""
+        response = {
+            "status": "REQUEST_SUCCEEDED",
+            "Results": {
+                "series": [
+                    {
+                        "seriesID": series_id,
+                        "data": [
+                            {
+                                "year": "2021",
+                                "period": "A01",
+                                "periodName": "Annual",
+                                "value": value,
+                            }
+                        ],
+                    }
+                    for series_id, value in [("A", "10"), ("B", "2.5")]
+                ]
+            },
+        }
+
+        df = bls_connector.parse(response)
+
+        assert df["series_id"].tolist() == ["A", "B"]
+        assert isinstance(df["series_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["period"].dtype, pd.CategoricalDtype)
+        assert df["year"].dtype == "int64"
+        assert df["value"].tolist() == [10.0, 2.5]
+
+    @patch("requests.Session.post")
     def test_calculate_location_quotient(
         self,
         mock_post: Mock,
@@ -175,7 +212,7 @@ class TestQCEWEmploymentData:
         qcew_response: Dict[str, Any],
     ) -> None:
         """Test Location Quotient calculation for industry sectors."""
-        mock_post.return_value.json.return_value = qcew_response
+        mock_post.return_value.content = orjson.dumps(qcew_response)
         mock_post.return_value.status_code = 200
 
         lq_result = bls_connector.calculate_location_quotient(
@@ -189,7 +226,7 @@ class TestQCEWEmploymentData:
         assert isinstance(lq_result, float)
         assert lq_result > 0
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_calculate_cagr(
         self,
         mock_post: Mock,
@@ -197,7 +234,7 @@ class TestQCEWEmploymentData:
         qcew_response: Dict[str, Any],
     ) -> None:
         """Test 3-year CAGR calculation for employment sector."""
-        mock_post.return_value.json.return_value = qcew_response
+        mock_post.return_value.content = orjson.dumps(qcew_response)
         mock_post.return_value.status_code = 200
 
         df = bls_connector.fetch_qcew_employment(
@@ -214,6 +251,41 @@ class TestQCEWEmploymentData:
         # Based on mock data: 46000 -> 50000 over 3 years ≈ 2.8% CAGR
         assert 0.02 < cagr < 0.04
 
+    def test_calculate_cagr_batch_per_series(self, bls_connector: BLSConnector) -> None:
+        """Test batch CAGR matches the single-series calculation per group."""
+        df = pd.DataFrame(
+            {
+                "series_id": ["A", "A", "B", "A", "B"],
+                "year": [2021, 2019, 2019, 2020, 2021],
+                "value": [50000.0, 46000.0, 100.0, 48000.0, 121.0],
+            }
+        )
+
+        cagrs = bls_connector.calculate_cagr_batch(df, years=2)
+
+        assert list(cagrs.index) == ["A", "B"]
+        assert cagrs["A"] == pytest.approx(
+            bls_connector.calculate_cagr(df[df["series_id"] == "A"], years=2)
+        )
+        assert cagrs["B"] == pytest.approx(0.10)
+
+    def test_calculate_cagr_batch_skips_unobserved_categories(
+        self, bls_connector: BLSConnector
+    ) -> None:
+        """Test categorical series IDs filtered out of the frame yield no rows."""
+        df = pd.DataFrame(
+            {
+                "series_id": pd.Categorical(["A", "A", "B", "B"]),
+                "year": [2019, 2021, 2019, 2021],
+                "value": [100.0, 121.0, 50.0, 60.0],
+            }
+        )
+
+        cagrs = bls_connector.calculate_cagr_batch(df[df["series_id"] == "A"], years=2)
+
+        assert list(cagrs.index) == ["A"]
+        assert cagrs["A"] == pytest.approx(0.10)
+
 
 class TestLAUSUnemploymentData:
     """
@@ -226,7 +298,7 @@ class TestLAUSUnemploymentData:
     AND: compares to state and national benchmarks
     """
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_fetch_laus_unemployment_rate(
         self,
         mock_post: Mock,
@@ -234,7 +306,7 @@ class TestLAUSUnemploymentData:
         laus_response: Dict[str, Any],
     ) -> None:
         """Test fetching LAUS unemployment rate time series."""
-        mock_post.return_value.json.return_value = laus_response
+        mock_post.return_value.content = orjson.dumps(laus_response)
         mock_post.return_value.status_code = 200
 
         df = bls_connector.fetch_laus_unemployment(
@@ -265,7 +337,7 @@ class TestLAUSUnemploymentData:
         assert ma.isna().sum() == 11
         assert not ma[11:].isna().any()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_compare_to_benchmarks(
         self,
         mock_post: Mock,
@@ -273,7 +345,7 @@ class TestLAUSUnemploymentData:
         laus_response: Dict[str, Any],
     ) -> None:
         """Test comparison to state and national unemployment benchmarks."""
-        mock_post.return_value.json.return_value = laus_response
+        mock_post.return_value.content = orjson.dumps(laus_response)
         mock_post.return_value.status_code = 200
 
         comparison = bls_connector.compare_unemployment_to_benchmarks(
@@ -293,7 +365,7 @@ class TestLAUSUnemploymentData:
 class TestCaching:
     """Test that BLS connector properly uses caching."""
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_cache_hit_avoids_api_call(
         self,
         mock_post: Mock,
@@ -301,7 +373,7 @@ class TestCaching:
         qcew_response: Dict[str, Any],
     ) -> None:
         """Test that cached data is returned without making API call."""
-        mock_post.return_value.json.return_value = qcew_response
+        mock_post.return_value.content = orjson.dumps(qcew_response)
         mock_post.return_value.status_code = 200
 
         # First call - should hit API
@@ -321,6 +393,52 @@ class TestCaching:
         # Data should be identical
         pd.testing.assert_frame_equal(df1, df2)
 
+    @patch("requests.Session.post")
+    def test_multi_code_request_batches_and_reuses_per_code_cache(
+        self, mock_post: Mock, bls_connector: BLSConnector
+    ) -> None:
+        """Test uncached codes share POSTs of at most 50 series each."""
+
+        def respond(url: str, json: Dict[str, Any], **kwargs: Any) -> Mock:
+            response = Mock(status_code=200)
+            response.content = orjson.dumps(
+                {
+                    "status": "REQUEST_SUCCEEDED",
+                    "Results": {
+                        "series": [
+                            {
+                                "seriesID": series_id,
+                                "data": [
+                                    {
+                                        "year": "2021",
+                                        "period": "A01",
+                                        "periodName": "Annual",
+                                        "value": "100",
+                                    }
+                                ],
+                            }
+                            for series_id in json["seriesid"]
+                        ]
+                    },
+                }
+            )
+            return response
+
+        mock_post.side_effect = respond
+
+        bls_connector.fetch_qcew_employment(
+            area_code="08031", naics_codes=["10"], start_year=2021, end_year=2021
+        )
+        codes = ["10"] + [str(1000 + i) for i in range(60)]
+        df = bls_connector.fetch_qcew_employment(
+            area_code="08031", naics_codes=codes, start_year=2021, end_year=2021
+        )
+
+        # "10" came from cache; the other 60 codes needed two batched POSTs
+        batch_sizes = [len(c.kwargs["json"]["seriesid"]) for c in mock_post.mock_calls]
+        assert batch_sizes == [1, 50, 10]
+        assert df["series_id"].tolist() == [f"ENU080310{code}010" for code in codes]
+
 
 class TestErrorHandling:
     """Test error handling and validation."""
@@ -332,7 +450,7 @@ class TestErrorHandling:
         with pytest.raises(ConfigurationError):
             BLSConnector(api_key=None, cache_manager=cache_manager)  # type: ignore
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_api_failure_raises_data_source_error(
         self, mock_post: Mock, bls_connector: BLSConnector
     ) -> None:
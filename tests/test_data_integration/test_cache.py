@@ -68,3 +68,181 @@ class TestCacheBypassScenario:
         assert bypassed is None
 
         assert cache.get("bypass-key") == {"value": "original"}
+
+
+class TestInMemoryCache:
+    """In-memory caches keep entries for the manager's lifetime only."""
+
+    def test_memory_cache_round_trips_without_files(self, tmp_path, monkeypatch):
+        from Claude45_Demo.data_integration.cache import CacheManager
+
+        monkeypatch.chdir(tmp_path)
+        cache = CacheManager(db_path=CacheManager.MEMORY_DB)
+        cache.set("memory-key", {"value": 1}, ttl=timedelta(minutes=5))
+
+        assert cache.get("memory-key") == {"value": 1}
+        assert cache.list_keys() == ["memory-key"]
+        assert list(tmp_path.iterdir()) == []
+
+        # A second manager gets its own empty database
+        assert CacheManager(db_path=CacheManager.MEMORY_DB).get("memory-key") is None
+
+
+class TestPersistentConnection:
+    """File-backed caches reuse one WAL-mode connection."""
+
+    def test_operations_share_one_connection(self, tmp_path):
+        cache = _cache_manager(tmp_path)
+        with cache._connect() as first:  # type: ignore[attr-defined]
+            journal_mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+        with cache._connect() as second:  # type: ignore[attr-defined]
+            pass
+
+        assert first is second
+        assert journal_mode == "wal"
+
+        # A second manager on the same file sees committed writes immediately
+        cache.set("shared-key", {"value": 1}, ttl=timedelta(minutes=5))
+        assert _cache_manager(tmp_path).get("shared-key") == {"value": 1}
+
+        cache.close()
+
+
+class TestBatchWrites:
+    """set_many and get_many move many entries in one round trip."""
+
+    def test_set_many_round_trips_entries(self, tmp_path):
+        cache = _cache_manager(tmp_path)
+        cache.set_many(
+            [("batch-a", {"value": 1}), ("batch-b", [1, 2, 3])],
+            ttl=timedelta(minutes=5),
+        )
+        cache.set_many([], ttl=timedelta(minutes=5))
+
+        assert list(cache._memo) == ["batch-a", "batch-b"]
+        fresh = _cache_manager(tmp_path)
+        assert fresh.get("batch-a") == {"value": 1}
+        assert fresh.get("batch-b") == [1, 2, 3]
+        assert sorted(fresh.list_keys()) == ["batch-a", "batch-b"]
+
+    def test_get_many_returns_unexpired_hits_in_key_order(self, tmp_path, monkeypatch):
+        cache = _cache_manager(tmp_path)
+        base_time = datetime(2025, 1, 1, 12, 0, 0)
+        monkeypatch.setattr(cache, "_current_time", lambda: base_time)
+        monkeypatch.setattr(cache, "MAX_KEYS_PER_QUERY", 2)
+        cache.set_many([(f"key-{i}", i) for i in range(5)], ttl=timedelta(hours=1))
+        cache.set("short", "gone", ttl=timedelta(minutes=1))
+
+        later = base_time + timedelta(minutes=2)
+        fresh = _cache_manager(tmp_path)
+        monkeypatch.setattr(fresh, "_current_time", lambda: later)
+        monkeypatch.setattr(fresh, "MAX_KEYS_PER_QUERY", 2)
+        fresh.get("key-3")  # served from the memo below
+
+        keys = ["key-4", "missing", "short", "key-0", "key-3", "key-1", "key-0"]
+        assert fresh.get_many(keys) == {"key-4": 4, "key-0": 0, "key-3": 3, "key-1": 1}
+        assert list(fresh.get_many(keys)) == ["key-4", "key-0", "key-3", "key-1"]
+        assert "short" not in fresh.list_keys()
+
+
+class TestRecentEntryMemo:
+    """Recently used entries are served without a SQLite round trip."""
+
+    def test_hot_key_skips_sqlite_and_returns_copy(self, tmp_path, monkeypatch):
+        cache = _cache_manager(tmp_path)
+        cache.set("hot-key", {"rows": [1, 2]}, ttl=timedelta(minutes=5))
+
+        def no_sqlite():
+            raise AssertionError("SQLite should not be queried for a hot key")
+
+        monkeypatch.setattr(cache, "_connect", no_sqlite)
+        first = cache.get("hot-key")
+        first["rows"].append(3)
+
+        assert cache.get("hot-key") == {"rows": [1, 2]}
+
+    def test_least_recently_used_entry_evicted(self, tmp_path, monkeypatch):
+        cache = _cache_manager(tmp_path)
+        monkeypatch.setattr(cache, "MEMO_MAX_ENTRIES", 2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key, ttl=timedelta(minutes=5))
+
+        assert list(cache._memo) == ["b", "c"]
+        # Evicted entries still come back from SQLite and re-enter the memo
+        assert cache.get("a") == "a"
+        assert list(cache._memo) == ["c", "a"]
+
+    def test_purge_and_expiry_drop_memo_entries(self, tmp_path, monkeypatch):
+        cache = _cache_manager(tmp_path)
+        base_time = datetime(2025, 1, 1, 12, 0, 0)
+        monkeypatch.setattr(cache, "_current_time", lambda: base_time)
+        cache.set("short", 1, ttl=timedelta(minutes=1))
+        cache.set("long", 2, ttl=timedelta(hours=1))
+
+        later = base_time + timedelta(minutes=2)
+        monkeypatch.setattr(cache, "_current_time", lambda: later)
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+        cache.purge()
+        assert cache.get("long") is None
+
+    def test_memo_respects_memory_budget(self, tmp_path):
+        from Claude45_Demo.data_integration.cache import CacheManager
+        from Claude45_Demo.data_integration.cache_config import MemorySettings
+
+        cache = CacheManager(
+            db_path=tmp_path / "cache.db",
+            memory=MemorySettings(enabled=True, size_mb=1),
+        )
+        half_mb = b"x" * (512 * 1024)
+        for key in ("a", "b", "c"):
+            cache.set(key, half_mb, ttl=timedelta(minutes=5))
+
+        # Two ~0.5 MB pickles overflow the 1 MB budget; only the newest stays
+        assert list(cache._memo) == ["c"]
+        assert cache._memo_bytes == len(cache._memo["c"][0])
+        assert cache.get("a") == half_mb
+
+        disabled = CacheManager(
+            db_path=tmp_path / "cache.db",
+            memory=MemorySettings(enabled=False, size_mb=256),
+        )
+        assert disabled.get("b") == half_mb
+        assert not disabled._memo
+
+
+class TestPayloadCompression:
+    """Large payloads are stored zlib-compressed and round-trip unchanged."""
+
+    def test_large_payload_compressed_in_sqlite(self, tmp_path):
+        cache = _cache_manager(tmp_path)
+        payload = {
+            "rows": [
+                {"series_id": "ENU0803100010", "value": float(i)} for i in range(2000)
+            ]
+        }
+        cache.set("large-key", payload, ttl=timedelta(minutes=5))
+        cache.set("small-key", {"value": 1}, ttl=timedelta(minutes=5))
+
+        with cache._connect() as conn:  # type: ignore[attr-defined]
+            stored = dict(conn.execute("SELECT key, value FROM cache").fetchall())
+        assert stored["large-key"][:1] == cache._ZLIB_MARKER
+        assert len(stored["large-key"]) < cache.compression.threshold_kb * 1024
+        assert stored["small-key"][:1] == b"\x80"
+
+        # A fresh manager has an empty memo, so this decodes the SQLite row
+        assert _cache_manager(tmp_path).get("large-key") == payload
+
+    def test_uncompressed_rows_still_readable(self, tmp_path):
+        from Claude45_Demo.data_integration.cache import CacheManager
+        from Claude45_Demo.data_integration.cache_config import CompressionSettings
+
+        plain = CacheManager(
+            db_path=tmp_path / "cache.db",
+            compression=CompressionSettings(enabled=False, threshold_kb=0, level=6),
+        )
+        payload = list(range(5000))
+        plain.set("plain-key", payload, ttl=timedelta(minutes=5))
+
+        assert _cache_manager(tmp_path).get("plain-key") == payload
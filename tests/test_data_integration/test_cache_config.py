@@ -158,3 +158,46 @@ def test_cache_config_all_ttls(
     assert "census_acs" in ttls
     assert ttls["census_acs"] == timedelta(days=365)
     assert len(ttls) >= 3
+
+
+def test_cache_config_reuses_parsed_file_until_modified(
+    sample_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated loads of an unchanged file should not re-parse the YAML."""
+
+    import os
+
+    import yaml
+
+    monkeypatch.setenv("CACHE_DB_PATH", ".cache/test.db")
+    CacheConfig(sample_config)
+
+    def fail_load(*args: object, **kwargs: object) -> None:
+        raise AssertionError("unchanged config should come from the parse cache")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(yaml, "load", fail_load)
+        assert CacheConfig(sample_config).memory.size_mb == 128
+
+    sample_config.write_text(
+        sample_config.read_text().replace("size_mb: 128", "size_mb: 64")
+    )
+    stat = sample_config.stat()
+    os.utime(sample_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert CacheConfig(sample_config).memory.size_mb == 64
+
+
+def test_cache_config_parses_policies_once_at_load(
+    sample_config: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Configured TTLs should be parsed during load, not on each lookup."""
+
+    monkeypatch.setenv("CACHE_DB_PATH", ".cache/test.db")
+    config = CacheConfig(sample_config)
+
+    def fail_parse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("configured TTLs should already be parsed")
+
+    monkeypatch.setattr(config, "_parse_ttl", fail_parse)
+    assert config.get_ttl("EPA_AQS") == timedelta(hours=1)
+    assert config.all_ttls()["custom_metric"] == timedelta(minutes=30)
@@ -7,6 +7,7 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
 from Claude45_Demo.data_integration.cache_stats import (
@@ -121,6 +122,33 @@ class TestCacheStatistics:
         assert stats["total_hits"] == 0
         assert stats["total_misses"] == 0
 
+    def test_latency_window_keeps_most_recent_samples(self) -> None:
+        """Test that latency percentiles only cover the retained window."""
+        cache_stats = CacheStatistics(latency_window=4)
+        for latency in [100.0, 100.0, 1.0, 2.0, 3.0, 4.0]:
+            cache_stats.record_hit(source="census", tier="memory", latency_ms=latency)
+
+        metrics = cache_stats.get_latency_metrics()
+        assert metrics["max"] == 4.0
+        assert metrics["min"] == 1.0
+        # Per-tier averages still cover every recorded hit
+        tier_stats = cache_stats.get_tier_stats()
+        assert tier_stats["memory"]["avg_latency_ms"] == pytest.approx(35.0)
+
+    def test_latency_samples_stored_as_microseconds(
+        self, cache_stats: CacheStatistics
+    ) -> None:
+        """Test latency percentiles resolve to whole microseconds."""
+        cache_stats.record_hit(source="census", tier="memory", latency_ms=0.0004)
+        cache_stats.record_hit(source="census", tier="memory", latency_ms=1.2346)
+        cache_stats.record_hit(source="census", tier="sqlite", latency_ms=1e9)
+
+        metrics = cache_stats.get_latency_metrics()
+        assert metrics["min"] == 0.0
+        assert metrics["p50"] == pytest.approx(1.235)
+        # Out-of-range samples clamp to the uint32 microsecond ceiling
+        assert metrics["max"] == pytest.approx(np.iinfo(np.uint32).max / 1000)
+
     def test_export_to_json(self, cache_stats: CacheStatistics, tmp_path: Path) -> None:
         """Test exporting statistics to JSON."""
         # Record some activity
@@ -177,6 +205,17 @@ class TestLatencyMetrics:
         assert 95 <= stats["p99"] <= 100
         assert stats["avg"] == pytest.approx(50.5, abs=1.0)
 
+    def test_accepts_ndarray_with_linear_interpolation(self) -> None:
+        """Test ndarray input interpolates between the closest ranks."""
+        metrics = LatencyMetrics(np.array([4.0, 1.0, 3.0, 2.0]))
+        stats = metrics.calculate()
+
+        assert stats["p50"] == pytest.approx(2.5)
+        assert stats["p95"] == pytest.approx(3.85)
+        assert stats["min"] == 1.0
+        assert stats["max"] == 4.0
+        assert isinstance(stats["avg"], float)
+
 
 class TestTierStatistics:
     """Test tier-specific statistics."""
@@ -248,6 +287,21 @@ class TestStatisticsIntegration:
         alerts = cache_stats.check_alerts(min_hit_rate=0.5, max_latency_ms=10.0)
         assert "low_hit_rate" in alerts
 
+    def test_low_hit_rate_alert_names_lagging_sources(
+        self, cache_stats: CacheStatistics, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that the low hit rate warning lists sources under threshold."""
+        cache_stats.record_hit(source="bls", tier="memory", latency_ms=0.5)
+        for source in ("census", "bea"):
+            for _ in range(3):
+                cache_stats.record_miss(source=source, tier="sqlite")
+
+        with caplog.at_level("WARNING"):
+            alerts = cache_stats.check_alerts(min_hit_rate=0.5, max_latency_ms=10.0)
+
+        assert alerts == ["low_hit_rate"]
+        assert "(sources: census, bea)" in caplog.text
+
     def test_statistics_high_latency_alert(self, cache_stats: CacheStatistics) -> None:
         """Test alerting on high latency."""
         # Record high latency
@@ -289,3 +343,50 @@ class TestStatisticsPerformance:
 
         stats = cache_stats.get_summary()
         assert stats["total_hits"] == 500  # 5 threads * 100 operations
+
+    def test_reset_discards_worker_thread_counts(
+        self, cache_stats: CacheStatistics
+    ) -> None:
+        """Test that reset also clears counts recorded on other threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def record_stats(tier: str) -> None:
+            cache_stats.record_hit(source="test", tier=tier, latency_ms=2.0)
+            cache_stats.record_miss(source="test", tier=tier)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(record_stats, "memory").result()
+            cache_stats.reset()
+            executor.submit(record_stats, "sqlite").result()
+
+        assert list(cache_stats.get_tier_stats()) == ["sqlite"]
+        stats = cache_stats.get_summary()
+        assert stats["total_hits"] == 1
+        assert stats["total_misses"] == 1
+
+    def test_exited_thread_shards_are_folded(
+        self, cache_stats: CacheStatistics
+    ) -> None:
+        """Test that short-lived threads don't leave their shards behind."""
+        import threading
+
+        def record_stats(i: int) -> None:
+            cache_stats.record_hit(source="test", tier="memory", latency_ms=float(i))
+            cache_stats.record_miss(source=f"source_{i}", tier="sqlite")
+
+        for i in range(1, 51):
+            thread = threading.Thread(target=record_stats, args=(i,))
+            thread.start()
+            thread.join()
+
+        # Only the retired shard remains once every recording thread has exited
+        assert len(cache_stats._shards) == 1
+
+        stats = cache_stats.get_summary()
+        assert stats["total_hits"] == 50
+        assert stats["total_misses"] == 50
+        assert cache_stats.get_tier_stats()["memory"]["avg_latency_ms"] == 25.5
+        assert len(cache_stats.get_source_stats()) == 51
+        latency = cache_stats.get_latency_metrics()
+        assert latency["min"] == 1.0
+        assert latency["max"] == 50.0
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 import time
+from itertools import pairwise
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +13,7 @@ from Claude45_Demo.data_integration.cache_warmer import (
     CacheWarmer,
     PrefetchScheduler,
     WarmingProgress,
+    get_shared_executor,
 )
 from Claude45_Demo.data_integration.exceptions import DataSourceError
 
@@ -146,6 +149,55 @@ class TestCacheWarmer:
         # With parallelism, should be faster than sequential
         assert duration < 2.0  # Should complete quickly
 
+    def test_warm_markets_fetches_sources_concurrently(
+        self, mock_cache_manager: MagicMock
+    ) -> None:
+        """Test that one market's sources are fetched in parallel."""
+        barrier = threading.Barrier(3, timeout=2)
+        connectors = {}
+        for source in ("census", "bls", "hud"):
+            connector = MagicMock()
+            connector.fetch_market_data.side_effect = lambda market: barrier.wait()
+            connectors[source] = connector
+
+        warmer = CacheWarmer(cache_manager=mock_cache_manager, max_parallel_requests=3)
+
+        result = warmer.warm_markets(
+            markets=["Boulder, CO"],
+            sources=list(connectors),
+            connectors=connectors,
+        )
+
+        # Serial fetches would break the barrier and surface as errors
+        assert result.errors == []
+        assert result.total_requests == 3
+
+    def test_warm_markets_uses_one_batch_cache_lookup(self) -> None:
+        """Test that warm_markets checks every key with one get_many call."""
+        cache = MagicMock()
+        cache.get_many.return_value = {"census:Boulder, CO": {"cached": "data"}}
+        connector = MagicMock()
+
+        warmer = CacheWarmer(cache_manager=cache)
+
+        result = warmer.warm_markets(
+            markets=["Boulder, CO", "Denver, CO"],
+            sources=["census", "bls"],
+            connectors={"census": connector, "bls": connector},
+        )
+
+        cache.get_many.assert_called_once_with(
+            [
+                "census:Boulder, CO",
+                "bls:Boulder, CO",
+                "census:Denver, CO",
+                "bls:Denver, CO",
+            ]
+        )
+        cache.get.assert_not_called()
+        assert result.cache_hits == 1
+        assert connector.fetch_market_data.call_count == 3
+
     def test_warm_with_progress_callback(
         self, mock_cache_manager: MagicMock, mock_api_connector: MagicMock
     ) -> None:
@@ -193,6 +245,84 @@ class TestPrefetchScheduler:
         # Should respect rate limit (10 requests / 50 per second = 0.2s minimum)
         assert duration >= 0.1
 
+    def test_scheduler_spaces_task_starts_across_workers(self) -> None:
+        """Test that task start times stay 1/rate apart with many workers."""
+        starts: list[float] = []
+
+        def record_start(x: int) -> int:
+            starts.append(time.monotonic())
+            return x
+
+        scheduler = PrefetchScheduler(max_requests_per_second=20, max_parallel=5)
+
+        scheduler.execute_batch([record_start] * 5, [(i,) for i in range(5)])
+
+        starts.sort()
+        gaps = [later - earlier for earlier, later in pairwise(starts)]
+        assert min(gaps) >= 0.045
+
+    def test_schedulers_share_pool_but_keep_own_parallelism(self) -> None:
+        """Test that the shared pool is reused and max_parallel still caps work."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracked_task(x: int) -> int:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return x
+
+        scheduler = PrefetchScheduler(max_requests_per_second=1000, max_parallel=2)
+        warmer = CacheWarmer(cache_manager=MagicMock())
+
+        results = scheduler.execute_batch([tracked_task] * 8, [(i,) for i in range(8)])
+
+        assert scheduler.executor is get_shared_executor()
+        assert warmer.scheduler.executor is get_shared_executor()
+        assert results == list(range(8))
+        assert peak <= 2
+
+    def test_scheduler_failure_waits_for_in_flight_tasks(self) -> None:
+        """Test a fail-fast batch has no tasks still running once it raises."""
+        started = 0
+        running = 0
+        lock = threading.Lock()
+        first_wave = threading.Barrier(4, timeout=5)
+
+        def task(x: int) -> int:
+            nonlocal started, running
+            with lock:
+                started += 1
+                running += 1
+            try:
+                if x < 4:
+                    # Fail only once the whole first window is in flight
+                    first_wave.wait()
+                if x == 0:
+                    raise ValueError("Task failed")
+                time.sleep(0.05)
+                return x
+            finally:
+                with lock:
+                    running -= 1
+
+        scheduler = PrefetchScheduler(max_requests_per_second=1000, max_parallel=4)
+
+        with pytest.raises(ValueError):
+            scheduler.execute_batch(
+                [task] * 8, [(i,) for i in range(8)], continue_on_error=False
+            )
+
+        assert running == 0
+        started_at_raise = started
+        time.sleep(0.1)
+        assert started == started_at_raise
+
     def test_scheduler_parallel_execution(self) -> None:
         """Test that scheduler executes tasks in parallel."""
 
@@ -281,6 +411,24 @@ class TestGeographicProximityPrefetch:
             # Denver should be excluded (>25 miles), Fort Collins included
             assert len(nearby) == 1
 
+    def test_nearby_markets_keep_candidate_order(self) -> None:
+        """Test that the vectorized scan returns matches in candidate order."""
+        warmer = CacheWarmer(prefetch_nearby=True, nearby_radius_miles=50)
+        coords = {
+            "Boulder, CO": (40.0150, -105.2705),
+            "Fort Collins, CO": (40.5853, -105.0844),
+            "Aspen, CO": (39.1911, -106.8175),
+            "Denver, CO": (39.7392, -104.9903),
+        }
+
+        with patch.object(warmer, "_geocode", side_effect=coords.__getitem__):
+            nearby = warmer._find_nearby_markets(
+                "Boulder, CO", candidate_markets=list(coords)[1:]
+            )
+
+        assert nearby == ["Fort Collins, CO", "Denver, CO"]
+        assert warmer._find_nearby_markets("Boulder, CO", []) == []
+
 
 class TestCacheWarmingProgress:
     """Test progress tracking and reporting."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from pathlib import Path
-from typing import Callable, Dict, List
+from typing import Dict, List
 
 import pandas as pd
 import pytest
@@ -14,19 +14,12 @@ from Claude45_Demo.data_integration.census import CensusConnector
 
 
 @pytest.fixture()
-def census_connector(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> CensusConnector:
+def census_connector(tmp_path: Path, no_retry) -> CensusConnector:
     """Provide a CensusConnector that uses a temporary cache and bypasses retries."""
 
     cache = CacheManager(db_path=tmp_path / "census_cache.db")
     connector = CensusConnector(api_key="test-key", cache_manager=cache)
-
-    def immediate_retry(func: Callable, **_: Dict) -> Dict:
-        return func()
-
-    monkeypatch.setattr(connector, "_retry_with_backoff", immediate_retry)
-    return connector
+    return no_retry(connector)
 
 
 def test_fetch_acs_demographics_returns_standardized_dataframe(
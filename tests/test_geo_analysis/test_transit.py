@@ -13,19 +13,12 @@ from Claude45_Demo.geo_analysis.transit import TransitlandConnector
 
 
 @pytest.fixture()
-def transit_connector(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> TransitlandConnector:
+def transit_connector(tmp_path: Path, no_retry) -> TransitlandConnector:
     """Provide a connector with deterministic cache and no delays."""
 
     cache = CacheManager(db_path=tmp_path / "transit_cache.db")
     connector = TransitlandConnector(api_key="test-key", cache_manager=cache)
-
-    def immediate_retry(func, **_):
-        return func()
-
-    monkeypatch.setattr(connector, "_retry_with_backoff", immediate_retry)
-    return connector
+    return no_retry(connector)
 
 
 def test_stop_density_summary_calculates_metrics(